@@ -0,0 +1,151 @@
+"""
+Formato binário dos conjuntos de dados (.bin).
+
+Layout (little-endian):
+- cabeçalho de 16 bytes: assinatura b"ADED", versão (uint16), tipo do array
+  ('q' = int64 ou 'I' = uint32), 1 byte reservado e a quantidade de valores (uint64);
+- em seguida, os valores com largura fixa, alinhados em 16 bytes.
+
+Como não há nenhum texto para interpretar, o arquivo pode ser mapeado em
+memória (mmap) e lido sem cópia: ~8 bytes por valor (int64).
+
+Uso como script, para converter arquivos .txt existentes:
+    python formato_binario.py conjunto_pequeno.txt conjunto_medio.txt
+"""
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+ASSINATURA = b"ADED"
+VERSAO = 1
+CABECALHO = struct.Struct("<4sHcxQ")
+TIPOS_SUPORTADOS = ("q", "I")
+VALORES_POR_BLOCO = 1 << 20 # valores convertidos por vez (limita a memória da conversão)
+
+
+def caminho_binario(caminho_txt):
+    """Retorna o caminho .bin correspondente a um arquivo .txt."""
+    return os.path.splitext(caminho_txt)[0] + ".bin"
+
+
+def escrever_cabecalho(arquivo, quantidade, tipo="q"):
+    """
+    Grava o cabeçalho no início de um arquivo aberto em modo binário.
+
+    Parâmetros:
+    - arquivo: arquivo aberto para escrita ("wb").
+    - quantidade: quantidade de valores que seguirão o cabeçalho.
+    - tipo: 'q' (int64) ou 'I' (uint32).
+    """
+    if tipo not in TIPOS_SUPORTADOS:
+        raise ValueError(f"Tipo não suportado: {tipo!r} (opções: {', '.join(TIPOS_SUPORTADOS)})")
+    arquivo.write(CABECALHO.pack(ASSINATURA, VERSAO, tipo.encode(), quantidade))
+
+
+def escrever_bloco(arquivo, bloco):
+    """Grava um array de valores em little-endian (logo após o cabeçalho ou outro bloco)."""
+    if sys.byteorder == "big":
+        bloco.byteswap()
+    arquivo.write(bloco.tobytes())
+
+
+def escrever_binario(caminho, valores, tipo="q"):
+    """
+    Grava valores inteiros no formato binário.
+
+    Parâmetros:
+    - caminho: arquivo .bin de destino.
+    - valores: sequência de inteiros (precisa ter len).
+    - tipo: 'q' (int64) ou 'I' (uint32).
+    """
+    with open(caminho, "wb") as arquivo:
+        escrever_cabecalho(arquivo, len(valores), tipo)
+        for inicio in range(0, len(valores), VALORES_POR_BLOCO):
+            escrever_bloco(arquivo, array(tipo, valores[inicio:inicio + VALORES_POR_BLOCO]))
+
+
+def converter_txt_para_binario(caminho_txt, caminho_bin=None, tipo="q"):
+    """
+    Converte um arquivo .txt (um inteiro por linha) para o formato binário,
+    lendo em blocos para não carregar o arquivo inteiro como lista.
+
+    Parâmetros:
+    - caminho_txt: arquivo de origem.
+    - caminho_bin: arquivo de destino (padrão: mesmo nome com extensão .bin).
+    - tipo: 'q' (int64) ou 'I' (uint32).
+
+    Retorna:
+    - caminho do arquivo .bin gerado.
+    """
+    caminho_bin = caminho_bin or caminho_binario(caminho_txt)
+    quantidade = 0
+    temporario = caminho_bin + ".tmp"
+
+    with open(caminho_txt, "r") as origem, open(temporario, "wb") as destino:
+        escrever_cabecalho(destino, 0, tipo) # quantidade é corrigida no final
+        bloco = array(tipo)
+        for linha in origem:
+            bloco.append(int(linha))
+            if len(bloco) == VALORES_POR_BLOCO:
+                quantidade += len(bloco)
+                escrever_bloco(destino, bloco)
+                bloco = array(tipo)
+        quantidade += len(bloco)
+        escrever_bloco(destino, bloco)
+
+        destino.seek(0)
+        escrever_cabecalho(destino, quantidade, tipo)
+
+    # só substitui o .bin quando a conversão terminou (nunca fica um arquivo pela metade)
+    os.replace(temporario, caminho_bin)
+    return caminho_bin
+
+
+def carregar_binario(caminho, usar_numpy=False):
+    """
+    Mapeia um arquivo .bin em memória e devolve os valores sem copiá-los.
+
+    Parâmetros:
+    - caminho: arquivo .bin.
+    - usar_numpy: se True (e NumPy estiver instalado), devolve um array NumPy
+      somente leitura em vez de um memoryview.
+
+    Retorna:
+    - memoryview (ou array NumPy) com os valores, apoiado diretamente no arquivo.
+    """
+    with open(caminho, "rb") as arquivo:
+        cabecalho = arquivo.read(CABECALHO.size)
+        if len(cabecalho) < CABECALHO.size:
+            raise ValueError(f"{caminho}: arquivo binário truncado")
+        assinatura, versao, tipo, quantidade = CABECALHO.unpack(cabecalho)
+        if assinatura != ASSINATURA or versao != VERSAO:
+            raise ValueError(f"{caminho}: não é um conjunto no formato binário v{VERSAO}")
+        tipo = tipo.decode()
+        if quantidade == 0:
+            return memoryview(array(tipo))
+        mapa = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+
+    tamanho_item = array(tipo).itemsize
+    fim = CABECALHO.size + quantidade * tamanho_item
+    if len(mapa) < fim:
+        raise ValueError(f"{caminho}: arquivo binário truncado")
+
+    if usar_numpy:
+        import numpy as np
+        return np.frombuffer(mapa, dtype=np.dtype(tipo).newbyteorder("<"), count=quantidade, offset=CABECALHO.size)
+
+    if sys.byteorder == "big":
+        # sem cópia só é possível na ordem de bytes nativa
+        valores = array(tipo)
+        valores.frombytes(mapa[CABECALHO.size:fim])
+        valores.byteswap()
+        return memoryview(valores)
+    return memoryview(mapa)[CABECALHO.size:fim].cast(tipo)
+
+
+if __name__ == "__main__":
+    for caminho in sys.argv[1:]:
+        print(f"Convertendo {caminho}...")
+        print(f"Gerado {converter_txt_para_binario(caminho)}")
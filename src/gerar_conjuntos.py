@@ -1,15 +1,179 @@
+import argparse
+import os
 import random
+from array import array
+from contextlib import nullcontext
+from multiprocessing import Pool
 
-def gerar_dataset(nome_arquivo, qtd):
-    print(f"Gerando {nome_arquivo} com {qtd} registros...")
-    with open(nome_arquivo, 'w') as f:
-        for _ in range(qtd):
-            f.write(f"{random.randint(1, qtd*10)}\n")
+from formato_binario import caminho_binario, escrever_bloco, escrever_cabecalho
+
+# NumPy é opcional: quando instalado, os blocos são sorteados de forma vetorizada
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+GERAR_BINARIO = True  # Também grava a versão .bin (lida por mmap em main.py)
+SEMENTE_PADRAO = 42
+VALORES_POR_BLOCO = 1 << 20  # Tamanho fixo dos blocos: define as sementes, não depende dos processos
+DESLOCAMENTO_QUASE_ORDENADO = 100  # Perfil quase_ordenado: cada valor fica a no máximo k posições da sua posição ordenada
+QTD_POUCOS_DISTINTOS = 100  # Perfil poucos_distintos: quantidade de valores diferentes
+QTD_GRUPOS = 16  # Perfil agrupado: quantidade de aglomerados de valores
+
+# Conjuntos gerados quando nenhum é passado na linha de comando
+CONJUNTOS_PADRAO = (
+    ("conjunto_pequeno.txt", 100_000),
+    ("conjunto_medio.txt", 5_000_000),
+    # O conjunto grande pode demorar até mesmo para ser construído.
+    ("conjunto_grande.txt", 30_000_000),
+)
+
+def _faixa_do_bloco(indice, total_blocos, maximo):
+    # cada bloco sorteia em uma faixa própria e crescente: ordenar só dentro do bloco basta
+    largura = max(1, maximo // total_blocos)
+    inicio = 1 + indice * largura
+    return inicio, max(inicio, min(maximo, inicio + largura - 1))
+
+def _bloco_ordenado(gerador, indice, total_blocos, quantidade, maximo, semente):
+    inicio, fim = _faixa_do_bloco(indice, total_blocos, maximo)
+    return sorted(gerador.randint(inicio, fim) for _ in range(quantidade))
+
+def _bloco_reverso(gerador, indice, total_blocos, quantidade, maximo, semente):
+    inicio, fim = _faixa_do_bloco(total_blocos - 1 - indice, total_blocos, maximo)
+    return sorted((gerador.randint(inicio, fim) for _ in range(quantidade)), reverse=True)
+
+def _bloco_quase_ordenado(gerador, indice, total_blocos, quantidade, maximo, semente):
+    # ordenado e depois embaralhado em janelas de k valores (nenhum sai da própria janela)
+    bloco = _bloco_ordenado(gerador, indice, total_blocos, quantidade, maximo, semente)
+    for inicio in range(0, len(bloco), DESLOCAMENTO_QUASE_ORDENADO):
+        janela = bloco[inicio:inicio + DESLOCAMENTO_QUASE_ORDENADO]
+        gerador.shuffle(janela)
+        bloco[inicio:inicio + DESLOCAMENTO_QUASE_ORDENADO] = janela
+    return bloco
+
+def _bloco_poucos_distintos(gerador, indice, total_blocos, quantidade, maximo, semente):
+    # os valores possíveis dependem só da semente, então são os mesmos em todos os blocos
+    distintos = random.Random(f"{semente}-distintos").sample(range(1, maximo + 1), min(maximo, QTD_POUCOS_DISTINTOS))
+    return gerador.choices(distintos, k=quantidade)
+
+def _bloco_agrupado(gerador, indice, total_blocos, quantidade, maximo, semente):
+    # valores concentrados em torno de poucos centros (distribuição normal ao redor de cada um)
+    centros = random.Random(f"{semente}-grupos").sample(range(1, maximo + 1), min(maximo, QTD_GRUPOS))
+    desvio = max(1.0, maximo / (QTD_GRUPOS * 100))
+    return [min(maximo, max(1, round(gerador.gauss(gerador.choice(centros), desvio)))) for _ in range(quantidade)]
+
+# Perfis de ordem/distribuição da entrada (além do uniforme, que é o padrão)
+PERFIS = {
+    "uniforme": None,
+    "ordenado": _bloco_ordenado,
+    "reverso": _bloco_reverso,
+    "quase_ordenado": _bloco_quase_ordenado,
+    "poucos_distintos": _bloco_poucos_distintos,
+    "agrupado": _bloco_agrupado,
+}
+
+def _gerar_bloco(parametros):
+    """
+    Sorteia um bloco de valores em [1, maximo] e já o devolve pronto para gravar.
+    A semente depende só de (semente, índice do bloco), então a saída é a mesma
+    com qualquer quantidade de processos (para um mesmo ambiente, com ou sem NumPy).
+
+    Parâmetros:
+    - parametros: tupla (semente, índice do bloco, quantidade de valores, maximo,
+      perfil, total de blocos).
+
+    Retorna:
+    - tupla (texto com um valor por linha, array int64 do bloco)
+    """
+    semente, indice, quantidade, maximo, perfil, total_blocos = parametros
+    if PERFIS[perfil] is not None:
+        gerador = random.Random(f"{semente}-{perfil}-{indice}")
+        bloco = PERFIS[perfil](gerador, indice, total_blocos, quantidade, maximo, semente)
+        texto = "\n".join(map(str, bloco)) + "\n"
+        return texto, array('q', bloco)
+
+    if np is not None:
+        gerador = np.random.default_rng([semente, indice])
+        bloco = gerador.integers(1, maximo, size=quantidade, endpoint=True, dtype=np.int64)
+        texto = "\n".join(map(str, bloco.tolist())) + "\n"
+        return texto, array('q', bloco.tolist())
+
+    gerador = random.Random(f"{semente}-{indice}")
+    bloco = gerador.choices(range(1, maximo + 1), k=quantidade)
+    texto = "\n".join(map(str, bloco)) + "\n"
+    return texto, array('q', bloco)
+
+def _parametros_blocos(qtd, semente, perfil):
+    if perfil not in PERFIS:
+        raise ValueError(f"Perfil desconhecido: {perfil!r} (opções: {', '.join(PERFIS)})")
+    total_blocos = -(-qtd // VALORES_POR_BLOCO)
+    return [
+        (semente, indice, min(VALORES_POR_BLOCO, qtd - inicio), qtd * 10, perfil, total_blocos)
+        for indice, inicio in enumerate(range(0, qtd, VALORES_POR_BLOCO))
+    ]
+
+def gerar_valores(qtd, perfil="uniforme", semente=SEMENTE_PADRAO):
+    """
+    Gera os mesmos valores que gerar_dataset gravaria, mas em memória e sem
+    processos extras (para testes pequenos, como os perfis de entrada em main.py).
+
+    Parâmetros:
+    - qtd: quantidade de valores.
+    - perfil: uma das chaves de PERFIS.
+    - semente: semente base.
+
+    Retorna:
+    - array int64 com os valores.
+    """
+    valores = array('q')
+    for parametros in _parametros_blocos(qtd, semente, perfil):
+        valores.extend(_gerar_bloco(parametros)[1])
+    return valores
+
+def gerar_dataset(nome_arquivo, qtd, binario=GERAR_BINARIO, processos=None, semente=SEMENTE_PADRAO, perfil="uniforme"):
+    print(f"Gerando {nome_arquivo} com {qtd} registros (perfil {perfil})...")
+    blocos = _parametros_blocos(qtd, semente, perfil)
+    caminho_bin = caminho_binario(nome_arquivo)
+
+    # Os blocos são sorteados em paralelo e gravados em ordem, cada um com uma única escrita.
+    # O .bin é fechado depois do txt, para não ficar mais antigo que ele (main.py o consideraria desatualizado)
+    with Pool(processos or os.cpu_count()) as pool, \
+            (open(caminho_bin, 'wb') if binario else nullcontext()) as arquivo_bin, \
+            open(nome_arquivo, 'w') as f:
+        if arquivo_bin:
+            escrever_cabecalho(arquivo_bin, qtd)
+        for texto, valores in pool.imap(_gerar_bloco, blocos):
+            f.write(texto)
+            if arquivo_bin:
+                escrever_bloco(arquivo_bin, valores)
+
+    if binario:
+        print(f"Versão binária em {caminho_bin}")
     print("Concluído.")
 
+def _conjunto(argumento):
+    """Interpreta 'nome=qtd' ou apenas 'qtd' (gera conjunto_<qtd>.txt)."""
+    nome, _, quantidade = argumento.rpartition("=")
+    try:
+        qtd = int(quantidade.replace("_", ""))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"quantidade inválida: {argumento!r}")
+    if qtd <= 0:
+        raise argparse.ArgumentTypeError(f"quantidade deve ser positiva: {argumento!r}")
+    return (nome or f"conjunto_{qtd}.txt"), qtd
+
 if __name__ == "__main__":
 
-    gerar_dataset("conjunto_pequeno.txt", 100_000)
-    gerar_dataset("conjunto_medio.txt", 5_000_000) 
-    # O conjunto grande pode demorar até mesmo para ser construído.
-    gerar_dataset("conjunto_grande.txt", 30_000_000)
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Gera os conjuntos de dados de teste.")
+    parser.add_argument("conjuntos", nargs="*", type=_conjunto,
+                        help="conjuntos como nome=qtd ou qtd (padrão: pequeno, médio e grande)")
+    parser.add_argument("--processos", type=int, default=None, help="processos geradores (padrão: núcleos da máquina)")
+    parser.add_argument("--semente", type=int, default=SEMENTE_PADRAO, help="semente base (saída reprodutível)")
+    parser.add_argument("--perfil", choices=list(PERFIS), default="uniforme", help="ordem/distribuição dos valores")
+    parser.add_argument("--sem-binario", dest="binario", action="store_false", help="não grava a versão .bin")
+    parser.set_defaults(binario=GERAR_BINARIO)
+    args = parser.parse_args()
+
+    for nome_arquivo, qtd in args.conjuntos or CONJUNTOS_PADRAO:
+        gerar_dataset(nome_arquivo, qtd, binario=args.binario, processos=args.processos, semente=args.semente,
+                      perfil=args.perfil)
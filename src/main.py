@@ -1,17 +1,84 @@
 import random
 import time
 import os
+import hashlib
+import json
+import struct
+import sys
+import math
+import csv
+import gc
+import heapq
+import statistics
+import tracemalloc
+import multiprocessing
+import queue
+import threading
+import traceback
+from array import array
+from multiprocessing import shared_memory
+
+from formato_binario import caminho_binario, carregar_binario, escrever_binario
+from gerar_conjuntos import PERFIS, gerar_valores
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+
+# NumPy é opcional: acelera as buscas em lote da ListaOtimizada quando instalado
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 # CONFIGURAÇÕES
 EXECUTAR_TESTE_GRANDE = False
+EXECUTAR_ARVORE_AVL = True  # Inclui a Árvore AVL (balanceada) nas análises de tempo
+EXECUTAR_ARVORE_COMPACTA = True  # Inclui a Árvore Compacta (nós em arrays) nas análises
+EXECUTAR_CONJUNTO_HASH = True  # Inclui o Conjunto Hash (endereçamento aberto) nas análises
+ORDENS_ARVORE_B = (4, 16, 64, 256)  # Ordens (máximo de filhos por nó) testadas na Árvore B
+TRABALHADORES_VARREDURA = (1, 2, 4, os.cpu_count() or 1)  # Processos testados na varredura paralela
+BLOOM_BITS_POR_CHAVE = 10  # Tamanho do Filtro de Bloom (bits por chave esperada)
+QTD_CONSULTAS_INTERVALO = 500  # Consultas de intervalo por conjunto no teste de intervalos
+TAMANHO_LOTE_LEITURA = 100_000  # Valores por lote na leitura em fluxo (streaming)
+MAX_LOTES_NA_FILA = 4  # Lotes lidos e ainda não consumidos (limita a memória do pipeline)
+PASTA_SNAPSHOTS = ".snapshots"  # Estruturas já construídas, salvas ao lado do script
+LIMITE_CACHE_DATASETS = 2 * 1024**3  # Memória máxima (bytes) dos conjuntos mantidos em cache
+MISTURAS_CARGA = ((80, 15, 5), (50, 25, 25))  # % de (buscar, inserir, remover) nas cargas mistas
+QTD_OPERACOES_CARGA = 5_000  # Operações por execução da carga mista
+QTD_PARTICOES = (1, 2, 4, 8)  # Quantidades de partições (processos) testadas no índice particionado
+QTD_CONSULTAS_DISTRIBUICAO = 10_000  # Consultas por distribuição (Zipf, quentes, uniforme, adversarial)
+ZIPF_EXPOENTE = 1.1  # Expoente s da distribuição de Zipf (maior = tráfego mais concentrado)
+ZIPF_MAX_CHAVES = 100_000  # Chaves ranqueadas na Zipf (a cauda além disso quase não é sorteada)
+CAPACIDADE_CACHE_LRU = 1_000  # Resultados mantidos pelo cache LRU de buscas
+EXECUTAR_PERFIS_ENTRADA = True  # Roda todas as estruturas sobre cada perfil de entrada (ordenado, reverso...)
+TAMANHO_PERFIS = 5_000  # Valores por perfil (pequeno: na entrada ordenada a Arvore fica O(n²))
+REPETICOES_BENCHMARK = 5  # Repetições medidas de cada célula da matriz de benchmark
+AQUECIMENTO_BENCHMARK = 1  # Execuções descartadas antes das medidas (aquecimento)
+QTD_BUSCAS_BENCHMARK = 500  # Consultas por cenário de busca
+OPERACOES_BENCHMARK = ("construcao", "buscar", "buscar_varios")  # Operações medidas (ver OPERACOES_BUSCA)
+CENARIOS_BENCHMARK = ("existentes", "inexistentes")  # Cenários de consulta (ver CENARIOS_BUSCA)
+PASTA_RESULTADOS = "resultados"  # JSON/CSV do benchmark, ao lado do script
+MEDIR_MEMORIA_BENCHMARK = True  # Mede pico (tracemalloc), delta de RSS e bytes/chave de cada construção
+REPETICOES_VIRADA = 7  # Medidas por tamanho na busca do ponto de virada (repetidas se inconclusivas)
+MAX_REPETICOES_VIRADA = 21  # Limite de medidas por tamanho quando o teste de confiança não decide
+N_INICIAL_VIRADA = 8  # Primeiro tamanho testado (depois dobra até a Árvore vencer)
+TOLERANCIA_VIRADA = 0.05  # Largura relativa do intervalo final da busca binária
+QTD_BUSCAS_VIRADA = 200  # Consultas por medida no ponto de virada só de busca
 
 ARQUIVO_PEQUENO = "conjunto_pequeno.txt"
 ARQUIVO_MEDIO = "conjunto_medio.txt"
 ARQUIVO_GRANDE = "conjunto_grande.txt"
 
+# Conjuntos medidos pelo benchmark (o grande entra com EXECUTAR_TESTE_GRANDE)
+CONJUNTOS_BENCHMARK = (("PEQUENO", ARQUIVO_PEQUENO), ("MEDIO", ARQUIVO_MEDIO)) + (
+    (("GRANDE", ARQUIVO_GRANDE),) if EXECUTAR_TESTE_GRANDE else ()
+)
+
 # Classes necessárias para os testes
 class Node:
     """Representa um nó na Árvore Binária."""
+    # __slots__ elimina o __dict__ de cada nó (bem menos memória por chave)
+    __slots__ = ("valor", "esquerda", "direita")
+
     def __init__(self, valor):
         self.valor = valor
         self.esquerda = None
@@ -22,9 +89,62 @@ class Arvore:
     Implementação de uma Árvore Binária de Busca (BST).
     Otimizada para buscas, mas com custo maior de inserção se não balanceada.
     """
+    classe_no = Node
+
     def __init__(self):
         self.raiz = None
 
+    @classmethod
+    def from_sorted(cls, valores):
+        """
+        Constrói uma árvore de altura mínima a partir de valores já ordenados.
+        Duplicados são descartados em uma única passada e a árvore é montada em
+        O(n), escolhendo o elemento do meio como raiz de cada subárvore
+        (nenhuma comparação descendo a árvore).
+
+        Parâmetros:
+        - valores: sequência ordenada em ordem crescente.
+
+        Retorna:
+        - nova árvore balanceada com os valores.
+        """
+        unicos = []
+        for valor in valores:
+            if not unicos or valor != unicos[-1]:
+                unicos.append(valor)
+
+        arvore = cls()
+        arvore.raiz = arvore._montar(unicos, 0, len(unicos) - 1)
+        return arvore
+
+    @classmethod
+    def from_iterable(cls, valores):
+        """
+        Constrói uma árvore de altura mínima a partir de valores em qualquer ordem.
+        Ordena uma única vez reaproveitando a ListaOtimizada e depois delega
+        para from_sorted.
+
+        Parâmetros:
+        - valores: qualquer iterável de valores comparáveis.
+
+        Retorna:
+        - nova árvore balanceada com os valores.
+        """
+        lista = ListaOtimizada()
+        lista.inserirVarios(valores)
+        lista.ordenar()
+        return cls.from_sorted(lista.items)
+
+    def _montar(self, unicos, inicio, fim):
+        """Monta recursivamente a subárvore de unicos[inicio..fim] (profundidade log n)."""
+        if inicio > fim:
+            return None
+        meio = (inicio + fim) // 2
+        no = self.classe_no(unicos[meio])
+        no.esquerda = self._montar(unicos, inicio, meio - 1)
+        no.direita = self._montar(unicos, meio + 1, fim)
+        return no
+
     def inserir(self, valor):
         if self.raiz is None:
             self.raiz = Node(valor)
@@ -52,6 +172,17 @@ class Arvore:
             else:
                 break # Valor duplicado, Ignorar
 
+    def inserirVarios(self, valores):
+        """
+        Insere múltiplos valores na árvore, um a um.
+        
+        Parâmetros:
+        - valores: lista de valores a ser inserido.
+        """
+        inserir = self.inserir
+        for valor in valores:
+            inserir(valor)
+
     def buscar(self, valor):
         no_atual = self.raiz
 
@@ -72,414 +203,3537 @@ class Arvore:
         # Valor não existe na árvore
         return False
 
-class Lista:
-    """Implementação padrão de lista sequencial (Wrapper para list do Python)."""
-    
-    def __init__(self):
-      self.items = []
-      
-    def inserir(self, valor):
+    def remover(self, valor):
         """
-        Insere um valor ao final da lista.
-        
+        Remove um valor da árvore. Um nó com dois filhos recebe o valor do seu
+        sucessor (menor valor da subárvore direita), e então o nó do sucessor,
+        que tem no máximo um filho, é retirado.
+
         Parâmetros:
-        - valor: valor a ser inserido.
+        - valor: valor a ser removido.
+
+        Retorna:
+        - True se o valor existia, False caso contrário.
         """
-        self.items.append(valor)
-    
-    def inserirVarios(self, valores):
+        pai = None
+        no_atual = self.raiz
+        while no_atual is not None and no_atual.valor != valor:
+            pai = no_atual
+            no_atual = no_atual.esquerda if valor < no_atual.valor else no_atual.direita
+        if no_atual is None:
+            return False
+
+        # Dois filhos: troca pelo sucessor e passa a remover o nó do sucessor
+        if no_atual.esquerda is not None and no_atual.direita is not None:
+            pai_sucessor = no_atual
+            sucessor = no_atual.direita
+            while sucessor.esquerda is not None:
+                pai_sucessor = sucessor
+                sucessor = sucessor.esquerda
+            no_atual.valor = sucessor.valor
+            pai, no_atual = pai_sucessor, sucessor
+
+        # Agora o nó tem no máximo um filho: o filho ocupa o lugar dele
+        filho = no_atual.esquerda if no_atual.esquerda is not None else no_atual.direita
+        if pai is None:
+            self.raiz = filho
+        elif pai.esquerda is no_atual:
+            pai.esquerda = filho
+        else:
+            pai.direita = filho
+        return True
+
+    def buscar_varios(self, valores):
         """
-        Insere múltiplos valores ao final da lista.
-        
+        Busca um lote de valores percorrendo a árvore uma única vez.
+        As consultas são ordenadas e cada nó divide a faixa de consultas pendentes
+        entre a subárvore esquerda e a direita (bisect), então cada nó é visitado
+        no máximo uma vez por lote.
+
         Parâmetros:
-        - valores: lista de valores a ser inserido.
+        - valores: lote de valores a serem buscados.
+
+        Retorna:
+        - lista de booleanos, na mesma ordem de valores.
         """
-        self.items.extend(valores) # extend é mais rápido que um loop for append
-    
-    def buscar(self, valor):
-        # Busca Linear: O(n)
-        for item in self.items:
-            if item == valor:
-                return True
-        return False
+        consultas = sorted(set(valores))
+        encontrados = set()
+        pilha = [(self.raiz, 0, len(consultas))]
 
-class ListaOtimizada:
-    """
-    Lista que mantém os dados ordenados para permitir Busca Binária.
-    Custo alto de construção (Ordenação), mas custo baixo de busca (O(log n)).
-    """
-    
-    def __init__(self):
-        self.items = []
-        
-    def inserir(self, valor):
+        while pilha:
+            no, inicio, fim = pilha.pop()
+            if no is None or inicio >= fim:
+                continue
+            # consultas[inicio:k] < no.valor <= consultas[k:fim]
+            k = bisect_left(consultas, no.valor, inicio, fim)
+            pilha.append((no.esquerda, inicio, k))
+            if k < fim and consultas[k] == no.valor:
+                encontrados.add(no.valor)
+                k += 1
+            pilha.append((no.direita, k, fim))
+
+        return [valor in encontrados for valor in valores]
+
+    def intervalo(self, a, b=None):
         """
-        Insere um valor ao final da lista.
-        
+        Gera, em ordem crescente, as chaves no intervalo [a, b].
+        Percurso em-ordem iterativo com pilha explícita: sem limite de recursão
+        mesmo em árvores degeneradas, e os valores são produzidos sob demanda
+        (nada é materializado). Subárvores fora do intervalo não são visitadas.
+
         Parâmetros:
-        - valor: valor a ser inserido.
+        - a: limite inferior (inclusivo).
+        - b: limite superior (inclusivo); None para não ter limite.
         """
-        self.items.append(valor)
-    
-    def inserirVarios(self, valores):
+        pilha = []
+        no = self.raiz
+        while pilha or no is not None:
+            # desce pela esquerda apenas enquanto ainda pode haver chaves >= a
+            while no is not None:
+                if no.valor < a:
+                    no = no.direita
+                else:
+                    pilha.append(no)
+                    no = no.esquerda
+            if not pilha:
+                return
+            no = pilha.pop()
+            if b is not None and no.valor > b:
+                return
+            yield no.valor
+            no = no.direita
+
+    def sucessor(self, x):
         """
-        Insere múltiplos valores ao final da lista.
-        
+        Retorna a menor chave >= x, ou None se não houver.
+
         Parâmetros:
-        - valores: lista de valores a ser inserido.
+        - x: valor de referência.
         """
-        self.items.extend(valores) # extend é mais rápido que um loop for append
-    
-    def merge_sort(self, lista):
-    
+        return next(self.intervalo(x), None)
+
+    def _percorrer(self):
         """
-        Método recursivo que implementa o algoritmo de ordenação Merge Sort
-        
-        Parâmetros:
-        - lista: recebe uma lista, ordena e a retorna.
+        Gera (nó, profundidade) de todos os nós (raiz = 1). Iterativo, para
+        funcionar também em árvores degeneradas (ex.: entrada ordenada).
         """
-        if len(lista) > 1:
-            meio = len(lista) // 2  # meio
-            metade_esquerda = lista[:meio]  # divide na metade esquerda
-            metade_direita = lista[meio:]   # divide na metade direita
-            
-            # recursivamente ordena as duas metades
-            self.merge_sort(metade_esquerda)
-            self.merge_sort(metade_direita)
-            
-            ponteiro_e = ponteiro_d = ponteiro_r = 0
-            
-            # mescla as metades ordenadas
-            while ponteiro_e< len(metade_esquerda) and ponteiro_d < len(metade_direita):
-                if metade_esquerda[ponteiro_e] < metade_direita[ponteiro_d]:
-                    lista[ponteiro_r] = metade_esquerda[ponteiro_e]
-                    ponteiro_e+=1
-                else:
-                    lista[ponteiro_r] = metade_direita[ponteiro_d]
-                    ponteiro_d += 1
-                ponteiro_r += 1
-            
-            # verifica elementos restantes    
-            while ponteiro_e < len(metade_esquerda):
-                lista[ponteiro_r] = metade_esquerda[ponteiro_e]
-                ponteiro_e += 1
-                ponteiro_r += 1
-            
-            while ponteiro_d < len(metade_direita):
-                lista[ponteiro_r] = metade_direita[ponteiro_d]
-                ponteiro_d += 1
-                ponteiro_r += 1
-                
-        return lista
-                
-    def ordenar(self):
+        pilha = [(self.raiz, 1)] if self.raiz is not None else []
+        while pilha:
+            no, profundidade = pilha.pop()
+            yield no, profundidade
+            if no.esquerda is not None:
+                pilha.append((no.esquerda, profundidade + 1))
+            if no.direita is not None:
+                pilha.append((no.direita, profundidade + 1))
+
+    def altura(self):
+        """Número de nós no caminho mais longo da raiz até uma folha (0 se vazia)."""
+        return max((profundidade for _, profundidade in self._percorrer()), default=0)
+
+    def chaves_pior_caso(self, qtd):
         """
-        Método que faz o processo de ordenação do objeto.
-        ele chama o método merge_sort e atualiza a lista interna com o resultado
+        Chaves cuja busca é a mais cara: as dos nós mais profundos.
+
+        Retorna:
+        - lista com até qtd chaves, as mais caras primeiro.
         """
-        
-        # chama o merge sort e armazena
-        lista_ordenada = self.merge_sort(self.items)
-        
-        # atualiza lista interna
-        self.items = lista_ordenada
+        return [no.valor for no, _ in heapq.nlargest(qtd, self._percorrer(), key=lambda item: item[1])]
 
-    def busca_binaria(self, valor):
-        esquerda = 0
-        direita = len(self.items) - 1
-        
-        while esquerda <= direita:
-            meio = esquerda + (direita - esquerda) // 2
-            
-            if self.items[meio] == valor:
-                return True # achou
-            elif self.items[meio] < valor:
-                esquerda = meio + 1 # metade direita
-            else:
-                direita = meio - 1 # metade esquerda
-        return False # não achou
+    def estatisticas_forma(self):
+        """
+        Forma da árvore: altura, profundidade média dos nós (= comparações de "==" de
+        uma busca bem-sucedida média) e histograma de profundidades (raiz = 1).
 
-#  === FUNÇÕES AUXILIARES ===
+        Retorna:
+        - dicionário com "altura", "profundidade_media" e "histograma" (profundidade -> nós).
+        """
+        histograma = {}
+        for _, profundidade in self._percorrer():
+            histograma[profundidade] = histograma.get(profundidade, 0) + 1
+
+        total = sum(histograma.values())
+        return {
+            "altura": max(histograma, default=0),
+            "profundidade_media": sum(p * q for p, q in histograma.items()) / total if total else 0.0,
+            "histograma": dict(sorted(histograma.items())),
+        }
+
+    def bytes_por_elemento(self):
+        """
+        Estima a memória ocupada pela árvore dividida pela quantidade de chaves.
+        Percorre os nós iterativamente (sem recursão) somando o tamanho de cada
+        nó e de cada valor inteiro.
+
+        Retorna:
+        - média de bytes por chave armazenada (0 se a árvore estiver vazia).
+        """
+        total_bytes = 0
+        quantidade = 0
+        pilha = [self.raiz] if self.raiz is not None else []
+        while pilha:
+            no = pilha.pop()
+            total_bytes += sys.getsizeof(no) + sys.getsizeof(no.valor)
+            quantidade += 1
+            if no.esquerda is not None:
+                pilha.append(no.esquerda)
+            if no.direita is not None:
+                pilha.append(no.direita)
+        return total_bytes / quantidade if quantidade else 0
+
+class NodeAVL(Node):
+    """Nó da Árvore AVL: guarda também a altura da subárvore que ele enraíza."""
+    __slots__ = ("altura",)
+
+    def __init__(self, valor):
+        super().__init__(valor)
+        self.altura = 1
 
-def ler_arquivo(arquivo):
+class ArvoreAVL(Arvore):
     """
-    Lê um arquivo txt e retorna os valores como uma lista de inteiros.
-    
-    Parâmetros:
-    - arquivo: nome do arquivo txt a ser lido
-    
-    Retorna:
-    - lista com os valores inteiros do arquivo
+    Árvore Binária de Busca auto-balanceada (AVL).
+    Após cada inserção as alturas são recalculadas e rotações mantêm a diferença
+    entre as subárvores em no máximo 1, garantindo altura O(log n) para qualquer
+    ordem de entrada (inclusive dados já ordenados).
+    A busca é a mesma da Arvore, herdada sem alterações.
     """
-    
+    classe_no = NodeAVL
 
-    pasta_do_script = os.path.dirname(os.path.abspath(__file__))
-    caminho_completo = os.path.join(pasta_do_script, arquivo)
-    
+    @staticmethod
+    def _altura(no):
+        return no.altura if no is not None else 0
 
-    
-    if not os.path.exists(caminho_completo):
-        print(f"\nArquivo '{arquivo}' não encontrado. Pulando testes relacionados.")
-        return []
-    
-    try:
-        valores = []
-        with open(caminho_completo, "r") as arq:
-            for linha in arq:
-                valor = int(linha.strip())
-                valores.append(valor)
-            return valores
-    except Exception as e:
-        print(f"\nFalha ao ler {arquivo}: {e}")
-        return
+    def _atualizar_altura(self, no):
+        no.altura = 1 + max(self._altura(no.esquerda), self._altura(no.direita))
 
+    def _rotacionar_direita(self, no):
+        nova_raiz = no.esquerda
+        no.esquerda = nova_raiz.direita
+        nova_raiz.direita = no
+        self._atualizar_altura(no)
+        self._atualizar_altura(nova_raiz)
+        return nova_raiz
 
+    def _rotacionar_esquerda(self, no):
+        nova_raiz = no.direita
+        no.direita = nova_raiz.esquerda
+        nova_raiz.esquerda = no
+        self._atualizar_altura(no)
+        self._atualizar_altura(nova_raiz)
+        return nova_raiz
 
+    def _montar(self, unicos, inicio, fim):
+        # A árvore montada pela Arvore já é balanceada, só falta preencher as alturas
+        no = super()._montar(unicos, inicio, fim)
+        if no is not None:
+            self._atualizar_altura(no)
+        return no
 
-def gerar_valores_busca(valores, qtd, existente=True):
-    """
-    Gera valores para teste de busca em uma lista de dados selecionada.
+    def _balancear(self, no):
+        """
+        Recalcula a altura do nó e aplica as rotações necessárias.
 
-    Parâmetros:
-    - valores: A lista inteira de onde tirar a amostra.
-    - quantidade: O número de valores a serem gerados.
-    - existente: boolean que define se gera valores existentes ou não existentes na estrutura alvo
+        Retorna:
+        - a nova raiz da subárvore (pode ser o próprio nó).
+        """
+        self._atualizar_altura(no)
+        fator = self._altura(no.esquerda) - self._altura(no.direita)
 
-    Retorna:
-    - Uma lista com a amostra de valores na lista passada como parâmetro (padrão: existentes).
-    """
-    
-    if not valores: return []
-    
-    resultado = []
-    if existente:
-        # calcula um intervalo pra fazer o incremento nos indices de acordo com a quantidade passada
-        intervalo = len(valores) // qtd
-        
-        # gera valores existentes na lista, pegando eles da propria lista por indice
-        for i in range(qtd):
-            indice = i * intervalo
-            resultado.append(valores[indice])
+        # Pesada à esquerda
+        if fator > 1:
+            if self._altura(no.esquerda.esquerda) < self._altura(no.esquerda.direita):
+                no.esquerda = self._rotacionar_esquerda(no.esquerda) # caso esquerda-direita
+            return self._rotacionar_direita(no)
 
-    else:
-        maior = max(valores)
-        for x in range(maior + 1, (maior + (qtd + 1))):
-            resultado.append(x)
-    
-    return resultado
+        # Pesada à direita
+        if fator < -1:
+            if self._altura(no.direita.direita) < self._altura(no.direita.esquerda):
+                no.direita = self._rotacionar_direita(no.direita) # caso direita-esquerda
+            return self._rotacionar_esquerda(no)
 
+        return no
 
-def imprimir_separador(titulo):
-    print(f"\n{'='*60}")
-    print(f"{titulo.center(60)}")
-    print(f"{'='*60}")
+    def inserir(self, valor):
+        if self.raiz is None:
+            self.raiz = NodeAVL(valor)
+            return
+
+        # Desce iterativamente guardando o caminho (sem recursão)
+        caminho = []
+        no_atual = self.raiz
+        while no_atual is not None:
+            if valor < no_atual.valor:
+                caminho.append(no_atual)
+                no_atual = no_atual.esquerda
+            elif valor > no_atual.valor:
+                caminho.append(no_atual)
+                no_atual = no_atual.direita
+            else:
+                return # Valor duplicado, Ignorar
 
+        pai = caminho[-1]
+        if valor < pai.valor:
+            pai.esquerda = NodeAVL(valor)
+        else:
+            pai.direita = NodeAVL(valor)
 
-#  === FUNÇÕES PARA TESTES DO PONTO DE VIRADA ===
-def encontrar_ponto_virada_busca():
+        # Sobe pelo caminho rebalanceando e religando as subárvores
+        for i in range(len(caminho) - 1, -1, -1):
+            no = caminho[i]
+            altura_antiga = no.altura
+            nova_raiz = self._balancear(no)
+
+            if i == 0:
+                self.raiz = nova_raiz
+            elif caminho[i - 1].esquerda is no:
+                caminho[i - 1].esquerda = nova_raiz
+            else:
+                caminho[i - 1].direita = nova_raiz
+
+            # Se a altura não mudou e não houve rotação, os ancestrais já estão corretos
+            if nova_raiz is no and no.altura == altura_antiga:
+                break
+
+    def remover(self, valor):
+        """
+        Remove como na Arvore (troca pelo sucessor) e rebalanceia todo o
+        caminho de volta até a raiz.
+        """
+        # Desce guardando o caminho, como na inserção
+        caminho = []
+        no_atual = self.raiz
+        while no_atual is not None and no_atual.valor != valor:
+            caminho.append(no_atual)
+            no_atual = no_atual.esquerda if valor < no_atual.valor else no_atual.direita
+        if no_atual is None:
+            return False
+
+        # Dois filhos: copia o sucessor e continua o caminho até ele
+        if no_atual.esquerda is not None and no_atual.direita is not None:
+            caminho.append(no_atual)
+            sucessor = no_atual.direita
+            while sucessor.esquerda is not None:
+                caminho.append(sucessor)
+                sucessor = sucessor.esquerda
+            no_atual.valor = sucessor.valor
+            no_atual = sucessor
+
+        filho = no_atual.esquerda if no_atual.esquerda is not None else no_atual.direita
+        if not caminho:
+            self.raiz = filho
+            return True
+        if caminho[-1].esquerda is no_atual:
+            caminho[-1].esquerda = filho
+        else:
+            caminho[-1].direita = filho
+
+        # Sobe rebalanceando (uma remoção pode exigir rotações em vários níveis)
+        for i in range(len(caminho) - 1, -1, -1):
+            no = caminho[i]
+            nova_raiz = self._balancear(no)
+            if i == 0:
+                self.raiz = nova_raiz
+            elif caminho[i - 1].esquerda is no:
+                caminho[i - 1].esquerda = nova_raiz
+            else:
+                caminho[i - 1].direita = nova_raiz
+        return True
+
+class ArvoreCompacta:
     """
-    Testa incrementalmente tamanhos de N para descobrir quando a 
-    Árvore supera a Lista na busca de dados existentes e não existentes
-    (considerando apenas tempo de busca).
+    Árvore Binária de Busca com os nós guardados em arrays tipados paralelos.
+    Em vez de um objeto Node por chave, o nó i é representado por
+    chaves[i], esquerda[i] e direita[i] (índices dos filhos, -1 = sem filho).
+    Cada chave ocupa ~24 bytes contíguos, sem objetos Python por nó.
+    Os valores precisam caber em um inteiro de 64 bits com sinal.
     """
-    dados = ler_arquivo("conjunto_pequeno.txt")
+    SEM_FILHO = -1
 
-    quantidade = 10
-    
-    ponto_virada_inexistentes = None
-    ponto_virada_existentes = None
-    
-    print("--> Executando testes incrementais...", end="", flush=True)
-    while True:
-        # gera quantidade inicial de dados para teste
-        dados_teste = gerar_valores_busca(dados, quantidade)
-        n = len(dados_teste)
+    def __init__(self):
+        self.chaves = array('q')
+        self.esquerda = array('q')
+        self.direita = array('q')
+
+    def __len__(self):
+        return len(self.chaves)
+
+    def _novo_no(self, valor):
+        self.chaves.append(valor)
+        self.esquerda.append(self.SEM_FILHO)
+        self.direita.append(self.SEM_FILHO)
+        return len(self.chaves) - 1
+
+    def inserirVarios(self, valores):
+        """
+        Insere múltiplos valores na árvore, um a um.
         
-        # verificação se ja achou os dois pontos de virada pra terminar a função
-        if n <= 0 or (ponto_virada_inexistentes and ponto_virada_existentes):
-            print(" Concluído!")
-            break
+        Parâmetros:
+        - valores: lista de valores a ser inserido.
+        """
+        inserir = self.inserir
+        for valor in valores:
+            inserir(valor)
+
+    def inserir(self, valor):
+        if not self.chaves:
+            self._novo_no(valor)
+            return
+
+        # Variáveis locais evitam a busca de atributo a cada passo do laço
+        chaves = self.chaves
+        esquerda = self.esquerda
+        direita = self.direita
+        atual = 0 # a raiz é sempre o índice 0
+
+        while True:
+            chave = chaves[atual]
+            if valor < chave:
+                proximo = esquerda[atual]
+                if proximo == -1:
+                    esquerda[atual] = self._novo_no(valor)
+                    break
+                atual = proximo
+            elif valor > chave:
+                proximo = direita[atual]
+                if proximo == -1:
+                    direita[atual] = self._novo_no(valor)
+                    break
+                atual = proximo
+            else:
+                break # Valor duplicado, Ignorar
+
+    def buscar(self, valor):
+        if not self.chaves:
+            return False
+
+        chaves = self.chaves
+        esquerda = self.esquerda
+        direita = self.direita
+        atual = 0
+
+        while atual != -1:
+            chave = chaves[atual]
+            if valor == chave:
+                return True
+            elif valor < chave:
+                atual = esquerda[atual]
+            else:
+                atual = direita[atual]
+        return False
+
+    def _liberar(self, indice):
+        """
+        Libera a posição de um nó já desligado da árvore: o último nó dos arrays
+        é movido para ela (o ponteiro do pai dele é corrigido), mantendo os
+        arrays densos, sem buracos.
+        """
+        ultimo = len(self.chaves) - 1
+        if indice != ultimo:
+            chave = self.chaves[ultimo]
+            # localiza o pai do último nó descendo pela chave dele
+            atual = 0
+            while True:
+                proximo = self.esquerda[atual] if chave < self.chaves[atual] else self.direita[atual]
+                if proximo == ultimo:
+                    break
+                atual = proximo
+            if self.esquerda[atual] == ultimo:
+                self.esquerda[atual] = indice
+            else:
+                self.direita[atual] = indice
+            self.chaves[indice] = chave
+            self.esquerda[indice] = self.esquerda[ultimo]
+            self.direita[indice] = self.direita[ultimo]
+        self.chaves.pop()
+        self.esquerda.pop()
+        self.direita.pop()
+
+    def remover(self, valor):
+        """
+        Remove um valor da árvore (troca pelo sucessor quando há dois filhos,
+        como na Arvore). A raiz continua sempre no índice 0.
+
+        Parâmetros:
+        - valor: valor a ser removido.
+
+        Retorna:
+        - True se o valor existia, False caso contrário.
+        """
+        chaves = self.chaves
+        esquerda = self.esquerda
+        direita = self.direita
+        pai = -1
+        atual = 0 if chaves else -1
+        while atual != -1 and chaves[atual] != valor:
+            pai = atual
+            atual = esquerda[atual] if valor < chaves[atual] else direita[atual]
+        if atual == -1:
+            return False
+
+        # Dois filhos: copia o sucessor e passa a remover o nó dele
+        if esquerda[atual] != -1 and direita[atual] != -1:
+            pai_sucessor = atual
+            sucessor = direita[atual]
+            while esquerda[sucessor] != -1:
+                pai_sucessor = sucessor
+                sucessor = esquerda[sucessor]
+            chaves[atual] = chaves[sucessor]
+            pai, atual = pai_sucessor, sucessor
+
+        filho = esquerda[atual] if esquerda[atual] != -1 else direita[atual]
+        if pai == -1:
+            # removendo a raiz (índice 0): o filho é copiado para o índice 0
+            if filho == -1:
+                self.chaves, self.esquerda, self.direita = array('q'), array('q'), array('q')
+                return True
+            chaves[0] = chaves[filho]
+            esquerda[0] = esquerda[filho]
+            direita[0] = direita[filho]
+            self._liberar(filho)
+            return True
+
+        if esquerda[pai] == atual:
+            esquerda[pai] = filho
+        else:
+            direita[pai] = filho
+        self._liberar(atual)
+        return True
+
+    def buscar_varios(self, valores):
+        """
+        Busca um lote de valores percorrendo a árvore uma única vez
+        (mesma estratégia de Arvore.buscar_varios, usando índices).
+
+        Parâmetros:
+        - valores: lote de valores a serem buscados.
+
+        Retorna:
+        - lista de booleanos, na mesma ordem de valores.
+        """
+        consultas = sorted(set(valores))
+        encontrados = set()
+        pilha = [(0, 0, len(consultas))] if self.chaves else []
+
+        while pilha:
+            atual, inicio, fim = pilha.pop()
+            if atual == -1 or inicio >= fim:
+                continue
+            chave = self.chaves[atual]
+            k = bisect_left(consultas, chave, inicio, fim)
+            pilha.append((self.esquerda[atual], inicio, k))
+            if k < fim and consultas[k] == chave:
+                encontrados.add(chave)
+                k += 1
+            pilha.append((self.direita[atual], k, fim))
+
+        return [valor in encontrados for valor in valores]
+
+    def _percorrer(self):
+        """Gera (índice do nó, profundidade) de todos os nós (raiz = índice 0, profundidade 1)."""
+        pilha = [(0, 1)] if self.chaves else []
+        while pilha:
+            atual, profundidade = pilha.pop()
+            yield atual, profundidade
+            for filho in (self.esquerda[atual], self.direita[atual]):
+                if filho != self.SEM_FILHO:
+                    pilha.append((filho, profundidade + 1))
+
+    def altura(self):
+        """Número de nós no caminho mais longo da raiz (índice 0) até uma folha (0 se vazia)."""
+        return max((profundidade for _, profundidade in self._percorrer()), default=0)
+
+    def chaves_pior_caso(self, qtd):
+        """Até qtd chaves dos nós mais profundos (as mais caras primeiro)."""
+        return [self.chaves[i] for i, _ in heapq.nlargest(qtd, self._percorrer(), key=lambda item: item[1])]
+
+    def bytes_por_elemento(self):
+        """
+        Memória dos três arrays (incluindo a sobra de capacidade reservada)
+        dividida pela quantidade de chaves.
+
+        Retorna:
+        - média de bytes por chave armazenada (0 se a árvore estiver vazia).
+        """
+        if not self.chaves:
+            return 0
+        total_bytes = sum(sys.getsizeof(a) for a in (self.chaves, self.esquerda, self.direita))
+        return total_bytes / len(self.chaves)
+
+class NodeB:
+    """Nó da Árvore B: chaves ordenadas em uma lista contígua e os filhos (vazio se folha)."""
+    __slots__ = ("chaves", "filhos")
+
+    def __init__(self):
+        self.chaves = []
+        self.filhos = []
+
+class ArvoreB:
+    """
+    Árvore B com ordem configurável (número máximo de filhos por nó).
+    Cada nó guarda até ordem - 1 chaves em uma lista ordenada, pesquisada com
+    bisect; com ordem alta a árvore fica muito rasa (poucos saltos entre nós por
+    busca) e as comparações acontecem dentro de listas contíguas.
+    Ordens ímpares são arredondadas para o par abaixo.
+    """
+    def __init__(self, ordem=64):
+        if ordem < 4:
+            raise ValueError("A ordem da Árvore B deve ser pelo menos 4")
+        self.ordem = ordem
+        self.grau_minimo = ordem // 2 # t: nós (exceto a raiz) têm entre t-1 e 2t-1 chaves
+        self.raiz = NodeB()
+
+    def _dividir_filho(self, pai, i):
+        """Divide o filho cheio pai.filhos[i], subindo a chave do meio para o pai."""
+        t = self.grau_minimo
+        cheio = pai.filhos[i]
+        novo = NodeB()
+
+        chave_meio = cheio.chaves[t - 1]
+        novo.chaves = cheio.chaves[t:]
+        cheio.chaves = cheio.chaves[:t - 1]
+        if cheio.filhos:
+            novo.filhos = cheio.filhos[t:]
+            cheio.filhos = cheio.filhos[:t]
+
+        pai.chaves.insert(i, chave_meio)
+        pai.filhos.insert(i + 1, novo)
+
+    def inserir(self, valor):
+        maximo_chaves = 2 * self.grau_minimo - 1
+
+        # Raiz cheia: a árvore cresce para cima
+        if len(self.raiz.chaves) == maximo_chaves:
+            nova_raiz = NodeB()
+            nova_raiz.filhos.append(self.raiz)
+            self.raiz = nova_raiz
+            self._dividir_filho(nova_raiz, 0)
+
+        # Desce dividindo preventivamente os filhos cheios (uma única passada)
+        no = self.raiz
+        while True:
+            i = bisect_left(no.chaves, valor)
+            if i < len(no.chaves) and no.chaves[i] == valor:
+                return # Valor duplicado, Ignorar
+            if not no.filhos:
+                no.chaves.insert(i, valor)
+                return
+            if len(no.filhos[i].chaves) == maximo_chaves:
+                self._dividir_filho(no, i)
+                if valor == no.chaves[i]:
+                    return # a chave que subiu era o próprio valor
+                if valor > no.chaves[i]:
+                    i += 1
+            no = no.filhos[i]
+
+    def inserirVarios(self, valores):
+        """
+        Insere múltiplos valores na árvore.
+        
+        Parâmetros:
+        - valores: lista de valores a ser inserido.
+        """
+        for valor in valores:
+            self.inserir(valor)
+
+    def buscar(self, valor):
+        no = self.raiz
+        while True:
+            chaves = no.chaves
+            i = bisect_left(chaves, valor)
+            if i < len(chaves) and chaves[i] == valor:
+                return True
+            if not no.filhos:
+                return False
+            no = no.filhos[i]
+
+    def _garantir_minimo(self, pai, i):
+        """
+        Garante que pai.filhos[i] tenha pelo menos t chaves antes de descer nele,
+        emprestando de um irmão ou fundindo com ele.
+
+        Retorna:
+        - índice (em pai.filhos) do filho onde a descida deve continuar.
+        """
+        t = self.grau_minimo
+        filho = pai.filhos[i]
+        if len(filho.chaves) >= t:
+            return i
+
+        # Empresta do irmão esquerdo (rotação à direita)
+        if i > 0 and len(pai.filhos[i - 1].chaves) >= t:
+            irmao = pai.filhos[i - 1]
+            filho.chaves.insert(0, pai.chaves[i - 1])
+            pai.chaves[i - 1] = irmao.chaves.pop()
+            if irmao.filhos:
+                filho.filhos.insert(0, irmao.filhos.pop())
+            return i
+
+        # Empresta do irmão direito (rotação à esquerda)
+        if i < len(pai.filhos) - 1 and len(pai.filhos[i + 1].chaves) >= t:
+            irmao = pai.filhos[i + 1]
+            filho.chaves.append(pai.chaves[i])
+            pai.chaves[i] = irmao.chaves.pop(0)
+            if irmao.filhos:
+                filho.filhos.append(irmao.filhos.pop(0))
+            return i
+
+        # Os dois irmãos estão no mínimo: funde com um deles (a chave do pai desce)
+        if i == len(pai.filhos) - 1:
+            i -= 1
+        self._fundir(pai, i)
+        return i
+
+    def _fundir(self, pai, i):
+        """Funde pai.filhos[i], pai.chaves[i] e pai.filhos[i + 1] em um único nó."""
+        esquerdo = pai.filhos[i]
+        direito = pai.filhos.pop(i + 1)
+        esquerdo.chaves.append(pai.chaves.pop(i))
+        esquerdo.chaves.extend(direito.chaves)
+        esquerdo.filhos.extend(direito.filhos)
+
+    def remover(self, valor):
+        """
+        Remove um valor em uma única descida: antes de entrar em um filho,
+        garante que ele tenha chaves de sobra (emprestando de um irmão ou
+        fundindo), então a remoção nunca precisa voltar para cima.
+
+        Parâmetros:
+        - valor: valor a ser removido.
+
+        Retorna:
+        - True se o valor existia, False caso contrário.
+        """
+        t = self.grau_minimo
+        no = self.raiz
+        removido = False
+
+        while True:
+            i = bisect_left(no.chaves, valor)
+            encontrado = i < len(no.chaves) and no.chaves[i] == valor
+
+            if not no.filhos:
+                if encontrado:
+                    del no.chaves[i]
+                    removido = True
+                break
+
+            if encontrado:
+                if len(no.filhos[i].chaves) >= t:
+                    # substitui pelo predecessor e passa a remover o predecessor
+                    predecessor = no.filhos[i]
+                    while predecessor.filhos:
+                        predecessor = predecessor.filhos[-1]
+                    valor = no.chaves[i] = predecessor.chaves[-1]
+                    no = no.filhos[i]
+                elif len(no.filhos[i + 1].chaves) >= t:
+                    # substitui pelo sucessor e passa a remover o sucessor
+                    sucessor = no.filhos[i + 1]
+                    while sucessor.filhos:
+                        sucessor = sucessor.filhos[0]
+                    valor = no.chaves[i] = sucessor.chaves[0]
+                    no = no.filhos[i + 1]
+                else:
+                    # os dois filhos no mínimo: funde e continua no nó fundido
+                    self._fundir(no, i)
+                    no = no.filhos[i]
+                continue
+
+            no = no.filhos[self._garantir_minimo(no, i)]
+
+        # A raiz pode ter ficado vazia após uma fusão: a árvore diminui um nível
+        if not self.raiz.chaves and self.raiz.filhos:
+            self.raiz = self.raiz.filhos[0]
+        return removido
+
+    def buscar_varios(self, valores):
+        """
+        Busca um lote de valores.
+
+        Parâmetros:
+        - valores: lote de valores a serem buscados.
+
+        Retorna:
+        - lista de booleanos, na mesma ordem de valores.
+        """
+        buscar = self.buscar
+        return [buscar(valor) for valor in valores]
+
+    def chaves_pior_caso(self, qtd):
+        """
+        Até qtd chaves das folhas: toda busca que termina nelas desce todos os
+        níveis (as folhas ficam na mesma profundidade) e faz um bisect a mais por nível.
+        """
+        chaves = []
+        pilha = [self.raiz]
+        while pilha and len(chaves) < qtd:
+            no = pilha.pop()
+            if no.filhos:
+                pilha.extend(no.filhos)
+            else:
+                chaves.extend(no.chaves[:qtd - len(chaves)])
+        return chaves
+
+    def altura(self):
+        """Número de níveis da árvore (todas as folhas ficam na mesma profundidade)."""
+        niveis = 1
+        no = self.raiz
+        while no.filhos:
+            no = no.filhos[0]
+            niveis += 1
+        return niveis
+
+class Lista:
+    """Implementação padrão de lista sequencial (Wrapper para list do Python)."""
+    
+    def __init__(self):
+      self.items = []
+      
+    def inserir(self, valor):
+        """
+        Insere um valor ao final da lista.
+        
+        Parâmetros:
+        - valor: valor a ser inserido.
+        """
+        self.items.append(valor)
+    
+    def inserirVarios(self, valores):
+        """
+        Insere múltiplos valores ao final da lista.
+        
+        Parâmetros:
+        - valores: lista de valores a ser inserido.
+        """
+        self.items.extend(valores) # extend é mais rápido que um loop for append
+    
+    def buscar(self, valor):
+        # Busca Linear: O(n)
+        for item in self.items:
+            if item == valor:
+                return True
+        return False
+
+    def chaves_pior_caso(self, qtd):
+        """
+        Até qtd chaves com a primeira ocorrência mais ao fim da lista (a varredura
+        para na primeira ocorrência), as mais caras primeiro.
+        """
+        distintas = list(dict.fromkeys(self.items))
+        return distintas[:-qtd - 1:-1] if qtd > 0 else []
+
+    def remover(self, valor):
+        """
+        Remove a primeira ocorrência do valor (busca linear + deslocamento).
+
+        Parâmetros:
+        - valor: valor a ser removido.
+
+        Retorna:
+        - True se o valor existia, False caso contrário.
+        """
+        try:
+            self.items.remove(valor)
+            return True
+        except ValueError:
+            return False
+
+    def buscar_varios(self, valores):
+        """
+        Busca um lote de valores montando um set uma única vez por lote,
+        em vez de uma varredura linear por consulta.
+
+        Parâmetros:
+        - valores: lote de valores a serem buscados.
+
+        Retorna:
+        - lista de booleanos, na mesma ordem de valores.
+        """
+        conjunto = set(self.items)
+        return [valor in conjunto for valor in valores]
+
+def _servir_comandos(conexao, tratadores):
+    """
+    Laço dos processos trabalhadores: recebe (comando, dados) pelo Pipe e responde
+    ("ok", resultado) ou ("erro", traceback) até receber "fechar". Comandos
+    desconhecidos e exceções viram resposta de erro, para o processo pai falhar
+    em vez de esperar para sempre no recv().
+
+    Parâmetros:
+    - conexao: ponta do Pipe do processo trabalhador.
+    - tratadores: dicionário comando -> função dados -> resultado.
+    """
+    while True:
+        comando, dados = conexao.recv()
+        if comando == "fechar":
+            conexao.close()
+            return
+        try:
+            tratador = tratadores.get(comando)
+            if tratador is None:
+                raise ValueError(f"comando desconhecido: {comando!r}")
+            resposta = ("ok", tratador(dados))
+        except Exception:
+            resposta = ("erro", traceback.format_exc())
+        conexao.send(resposta)
+
+def _receber_respostas(conexoes):
+    """
+    Recebe uma resposta de cada conexão (todas, para nenhuma ficar pendente no
+    Pipe) e lança RuntimeError se algum processo trabalhador falhou ou terminou.
+
+    Retorna:
+    - lista de resultados, na ordem das conexões.
+    """
+    respostas, erros = [], []
+    for conexao in conexoes:
+        try:
+            estado, resposta = conexao.recv()
+        except EOFError:
+            estado, resposta = "erro", "o processo terminou sem responder"
+        if estado == "erro":
+            erros.append(resposta)
+        respostas.append(resposta)
+    if erros:
+        raise RuntimeError(f"Falha em processo trabalhador:\n{erros[0]}")
+    return respostas
+
+def _varrer_trecho(memoria, inicio, fim, consultas, achados, tamanho_bloco):
+    """
+    Processo trabalhador da ListaParalela: varre items[inicio:fim] na memória
+    compartilhada procurando as consultas ainda não encontradas.
+    A cada bloco consulta as flags compartilhadas e abandona as consultas que
+    outro processo já achou (cancelamento antecipado); termina quando não
+    sobra nenhuma.
+
+    Parâmetros:
+    - memoria: SharedMemory com os valores em int64.
+    - inicio, fim: trecho (em elementos) sob responsabilidade deste processo.
+    - consultas: lote de valores buscados.
+    - achados: array compartilhado de flags (1 = consulta já encontrada).
+    - tamanho_bloco: elementos varridos entre duas verificações das flags.
+    """
+    indice_da_consulta = {valor: i for i, valor in enumerate(consultas)}
+    if np is not None:
+        items = np.ndarray((fim,), dtype=np.int64, buffer=memoria.buf)
+    else:
+        items = memoria.buf.cast('q')
+
+    try:
+        for bloco_inicio in range(inicio, fim, tamanho_bloco):
+            # remove o que outros processos já encontraram
+            for valor in [v for v, i in indice_da_consulta.items() if achados[i]]:
+                del indice_da_consulta[valor]
+            if not indice_da_consulta:
+                return
+
+            bloco = items[bloco_inicio:min(bloco_inicio + tamanho_bloco, fim)]
+            if np is not None:
+                pendentes = np.fromiter(indice_da_consulta, dtype=np.int64)
+                encontrados_bloco = np.unique(bloco[np.isin(bloco, pendentes)]).tolist()
+            else:
+                encontrados_bloco = set(bloco).intersection(indice_da_consulta)
+
+            for valor in encontrados_bloco:
+                achados[indice_da_consulta.pop(valor)] = 1
+    finally:
+        # solta as referências ao buffer antes do processo terminar
+        del items
+
+def _servir_trecho(conexao, memoria, achados, inicio, fim, tamanho_bloco):
+    """
+    Processo permanente da ListaParalela: fica ligado à memória compartilhada
+    e varre o próprio trecho a cada lote recebido pelo Pipe, até receber "fechar".
+    Os lotes trafegam como bytes de array('q'); a resposta só avisa o término
+    (os resultados ficam nas flags compartilhadas de achados).
+    """
+    def buscar_varios(dados):
+        consultas = array('q')
+        consultas.frombytes(dados)
+        _varrer_trecho(memoria, inicio, fim, consultas.tolist(), achados, tamanho_bloco)
+
+    _servir_comandos(conexao, {"buscar_varios": buscar_varios})
+
+class ListaParalela(Lista):
+    """
+    Lista sequencial com busca linear paralela em vários processos.
+    Os valores são copiados uma única vez para um array int64 em memória
+    compartilhada (multiprocessing.shared_memory) e os processos, um por
+    trecho do array, são criados na primeira busca em lote e reaproveitados nas
+    seguintes; cada consulta é cancelada assim que algum processo a encontra.
+    A busca individual é a varredura local da Lista (ida e volta aos processos
+    custaria mais que ela). É a referência para "dados desordenados, muitos núcleos".
+    Chame fechar() (ou use com with) para encerrar os processos e liberar a memória.
+    """
+    TAMANHO_BLOCO = 1 << 16
+    CAPACIDADE_INICIAL_LOTE = 1024 # flags de achados; dobra quando um lote não cabe
+
+    def __init__(self, trabalhadores=None):
+        super().__init__()
+        self.trabalhadores = trabalhadores or os.cpu_count() or 1
+        self._memoria = None
+        self._achados = None
+        self._conexoes = []
+        self._processos = []
+        self._trabalhadores_ativos = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
+
+    def inserir(self, valor):
+        super().inserir(valor)
+        self.fechar() # os dados mudaram, a cópia compartilhada é refeita na próxima busca
+
+    def inserirVarios(self, valores):
+        super().inserirVarios(valores)
+        self.fechar()
+
+    def remover(self, valor):
+        removido = super().remover(valor)
+        if removido:
+            self.fechar()
+        return removido
+
+    def fechar(self):
+        """Encerra os processos e libera a memória compartilhada (se existirem)."""
+        self._encerrar_processos()
+        if self._memoria is not None:
+            self._memoria.close()
+            self._memoria.unlink()
+            self._memoria = None
+
+    def _encerrar_processos(self):
+        for conexao in self._conexoes:
+            try:
+                conexao.send(("fechar", None))
+            except (BrokenPipeError, OSError):
+                pass
+            conexao.close()
+        for processo in self._processos:
+            processo.join()
+        self._conexoes, self._processos, self._achados = [], [], None
+
+    def _iniciar_processos(self, trabalhadores, qtd_consultas):
+        """
+        Garante um processo por trecho ligado à memória compartilhada atual, com
+        flags para ao menos qtd_consultas. Só recria se a quantidade de processos
+        mudou ou o lote não cabe nas flags.
+        """
+        memoria = self._publicar()
+        if self._processos and self._trabalhadores_ativos == trabalhadores and len(self._achados) >= qtd_consultas:
+            return
+        capacidade = len(self._achados) if self._achados else self.CAPACIDADE_INICIAL_LOTE
+        if capacidade < qtd_consultas:
+            capacidade = max(qtd_consultas, 2 * capacidade)
+        self._encerrar_processos()
+        self._trabalhadores_ativos = trabalhadores
+        self._achados = multiprocessing.Array('b', capacidade, lock=False)
+        tamanho = len(self.items)
+        trecho = -(-tamanho // trabalhadores) # divisão arredondando para cima
+        for inicio in range(0, tamanho, trecho):
+            local, remota = multiprocessing.Pipe()
+            processo = multiprocessing.Process(
+                target=_servir_trecho,
+                args=(remota, memoria, self._achados, inicio, min(inicio + trecho, tamanho), self.TAMANHO_BLOCO),
+                daemon=True,
+            )
+            processo.start()
+            remota.close()
+            self._conexoes.append(local)
+            self._processos.append(processo)
+
+    def _publicar(self):
+        """Copia os valores para a memória compartilhada, apenas se ainda não copiou."""
+        if self._memoria is None:
+            dados = array('q', self.items)
+            self._memoria = shared_memory.SharedMemory(create=True, size=max(1, len(dados) * dados.itemsize))
+            self._memoria.buf[:len(dados) * dados.itemsize] = dados.tobytes()
+        return self._memoria
+
+    def buscar_varios(self, valores, trabalhadores=None):
+        """
+        Busca um lote de valores com varredura linear dividida entre processos.
+
+        Parâmetros:
+        - valores: lote de valores a serem buscados.
+        - trabalhadores: quantidade de processos (padrão: o definido no construtor).
+
+        Retorna:
+        - lista de booleanos, na mesma ordem de valores.
+        """
+        consultas = list(dict.fromkeys(valores)) # sem repetidos, mantendo a ordem
+        tamanho = len(self.items)
+        if not consultas or tamanho == 0:
+            return [False] * len(valores)
+
+        trabalhadores = max(1, min(trabalhadores or self.trabalhadores, tamanho))
+        self._iniciar_processos(trabalhadores, len(consultas))
+        achados = self._achados
+        achados[:len(consultas)] = [0] * len(consultas)
+
+        lote = array('q', consultas).tobytes()
+        for conexao in self._conexoes:
+            conexao.send(("buscar_varios", lote))
+        _receber_respostas(self._conexoes)
+
+        encontrados = {valor for valor, achado in zip(consultas, achados[:len(consultas)]) if achado}
+        return [valor in encontrados for valor in valores]
+
+class ListaOtimizada:
+    """
+    Lista que mantém os dados ordenados para permitir Busca Binária.
+    Custo alto de construção (Ordenação), mas custo baixo de busca (O(log n)).
+    Depois de ordenar(), inserir e remover preservam a ordenação.
+    """
+    
+    def __init__(self):
+        self.items = []
+        self.ordenada = True # lista vazia já está ordenada
+        self._copia_numpy = None # cópia em array NumPy para buscar_varios (criada sob demanda)
+        
+    def inserir(self, valor):
+        """
+        Insere um valor na lista: na posição certa (bisect) se ela já estiver
+        ordenada, ou ao final, antes da ordenação.
+        
+        Parâmetros:
+        - valor: valor a ser inserido.
+        """
+        if self.ordenada:
+            self.items.insert(bisect_left(self.items, valor), valor)
+        else:
+            self.items.append(valor)
+        self._copia_numpy = None
+    
+    def inserirVarios(self, valores):
+        """
+        Insere múltiplos valores ao final da lista.
+        
+        Parâmetros:
+        - valores: lista de valores a ser inserido.
+        """
+        self.items.extend(valores) # extend é mais rápido que um loop for append
+        self.ordenada = len(self.items) <= 1
+        self._copia_numpy = None
+    
+    def merge_sort(self, lista):
+    
+        """
+        Método recursivo que implementa o algoritmo de ordenação Merge Sort
+        
+        Parâmetros:
+        - lista: recebe uma lista, ordena e a retorna.
+        """
+        if len(lista) > 1:
+            meio = len(lista) // 2  # meio
+            metade_esquerda = lista[:meio]  # divide na metade esquerda
+            metade_direita = lista[meio:]   # divide na metade direita
+            
+            # recursivamente ordena as duas metades
+            self.merge_sort(metade_esquerda)
+            self.merge_sort(metade_direita)
+            
+            ponteiro_e = ponteiro_d = ponteiro_r = 0
+            
+            # mescla as metades ordenadas
+            while ponteiro_e< len(metade_esquerda) and ponteiro_d < len(metade_direita):
+                if metade_esquerda[ponteiro_e] < metade_direita[ponteiro_d]:
+                    lista[ponteiro_r] = metade_esquerda[ponteiro_e]
+                    ponteiro_e+=1
+                else:
+                    lista[ponteiro_r] = metade_direita[ponteiro_d]
+                    ponteiro_d += 1
+                ponteiro_r += 1
+            
+            # verifica elementos restantes    
+            while ponteiro_e < len(metade_esquerda):
+                lista[ponteiro_r] = metade_esquerda[ponteiro_e]
+                ponteiro_e += 1
+                ponteiro_r += 1
+            
+            while ponteiro_d < len(metade_direita):
+                lista[ponteiro_r] = metade_direita[ponteiro_d]
+                ponteiro_d += 1
+                ponteiro_r += 1
+                
+        return lista
+                
+    def merge_sort_buffer(self, lista):
+        """
+        Merge Sort iterativo (bottom-up) com um único buffer auxiliar.
+        Intercala blocos de tamanho 1, 2, 4, ... alternando origem e destino entre
+        a lista e o buffer, sem recursão e sem criar fatias a cada nível.
+        
+        Parâmetros:
+        - lista: recebe uma lista, ordena e a retorna.
+        """
+        n = len(lista)
+        if n < 2:
+            return lista
+
+        origem = lista
+        destino = [0] * n # buffer único, reaproveitado em todas as passadas
+        largura = 1
+
+        while largura < n:
+            for inicio in range(0, n, 2 * largura):
+                meio = min(inicio + largura, n)
+                fim = min(inicio + 2 * largura, n)
+                ponteiro_e, ponteiro_d, ponteiro_r = inicio, meio, inicio
+
+                # mescla origem[inicio:meio] e origem[meio:fim] no destino
+                while ponteiro_e < meio and ponteiro_d < fim:
+                    if origem[ponteiro_d] < origem[ponteiro_e]:
+                        destino[ponteiro_r] = origem[ponteiro_d]
+                        ponteiro_d += 1
+                    else:
+                        destino[ponteiro_r] = origem[ponteiro_e]
+                        ponteiro_e += 1
+                    ponteiro_r += 1
+
+                # copia o que sobrou de uma das metades (atribuição de fatia é feita em C)
+                if ponteiro_e < meio:
+                    destino[ponteiro_r:fim] = origem[ponteiro_e:meio]
+                elif ponteiro_d < fim:
+                    destino[ponteiro_r:fim] = origem[ponteiro_d:fim]
+
+            origem, destino = destino, origem
+            largura *= 2
+
+        # garante que o resultado termine na lista recebida
+        if origem is not lista:
+            lista[:] = origem
+        return lista
+
+    def radix_sort(self, lista, bits_por_digito=16):
+        """
+        Radix Sort LSD para inteiros não negativos (como os gerados por gerar_dataset).
+        Faz uma passada de contagem estável por dígito, usando um único buffer.
+        
+        Parâmetros:
+        - lista: recebe uma lista de inteiros >= 0, ordena e a retorna.
+        - bits_por_digito: tamanho do dígito em bits (2**bits baldes por passada).
+        """
+        n = len(lista)
+        if n < 2:
+            return lista
+        if min(lista) < 0:
+            raise ValueError("radix_sort só aceita inteiros não negativos")
+
+        baldes = 1 << bits_por_digito
+        mascara = baldes - 1
+        maior = max(lista)
+
+        origem = lista
+        destino = [0] * n
+        deslocamento = 0
+
+        while (maior >> deslocamento) > 0:
+            # conta quantos valores caem em cada balde
+            contagem = [0] * baldes
+            for valor in origem:
+                contagem[(valor >> deslocamento) & mascara] += 1
+
+            # transforma a contagem na posição inicial de cada balde
+            posicao = 0
+            for balde in range(baldes):
+                quantidade = contagem[balde]
+                contagem[balde] = posicao
+                posicao += quantidade
+
+            # distribui de forma estável
+            for valor in origem:
+                balde = (valor >> deslocamento) & mascara
+                destino[contagem[balde]] = valor
+                contagem[balde] += 1
+
+            origem, destino = destino, origem
+            deslocamento += bits_por_digito
+
+        if origem is not lista:
+            lista[:] = origem
+        return lista
+
+    def ordenar_nativo(self, lista):
+        """
+        Ordenação de referência com o Timsort do próprio Python (list.sort).
+        
+        Parâmetros:
+        - lista: recebe uma lista, ordena e a retorna.
+        """
+        lista.sort()
+        return lista
+
+    # Algoritmos disponíveis em ordenar(algoritmo=...) -> nome do método
+    ALGORITMOS_ORDENACAO = {
+        "merge": "merge_sort_buffer",
+        "merge_recursivo": "merge_sort",
+        "radix": "radix_sort",
+        "sorted": "ordenar_nativo",
+    }
+
+    def ordenar(self, algoritmo="merge"):
+        """
+        Método que faz o processo de ordenação do objeto.
+        ele chama o algoritmo escolhido e atualiza a lista interna com o resultado
+        
+        Parâmetros:
+        - algoritmo: chave de ALGORITMOS_ORDENACAO (padrão: merge bottom-up com buffer).
+        """
+        if algoritmo not in self.ALGORITMOS_ORDENACAO:
+            opcoes = ", ".join(self.ALGORITMOS_ORDENACAO)
+            raise ValueError(f"Algoritmo de ordenação desconhecido: {algoritmo!r} (opções: {opcoes})")
+        
+        # chama o algoritmo e armazena
+        metodo = getattr(self, self.ALGORITMOS_ORDENACAO[algoritmo])
+        lista_ordenada = metodo(self.items)
+        
+        # atualiza lista interna
+        self.items = lista_ordenada
+        self.ordenada = True
+        self._copia_numpy = None
+
+    def busca_binaria(self, valor):
+        esquerda = 0
+        direita = len(self.items) - 1
+        
+        while esquerda <= direita:
+            meio = esquerda + (direita - esquerda) // 2
+            
+            if self.items[meio] == valor:
+                return True # achou
+            elif self.items[meio] < valor:
+                esquerda = meio + 1 # metade direita
+            else:
+                direita = meio - 1 # metade esquerda
+        return False # não achou
+
+    def buscar(self, valor):
+        """Mesma interface das outras estruturas (delegando para busca_binaria)."""
+        return self.busca_binaria(valor)
+
+    def chaves_pior_caso(self, qtd):
+        """
+        Até qtd chaves na maior profundidade de bisseção da busca_binaria (as que
+        precisam de mais sondas), as mais caras primeiro. Percorre só os caminhos
+        até a profundidade alvo, começando pela maior (n.bit_length()).
+
+        Retorna:
+        - lista de chaves (a lista precisa estar ordenada).
+        """
+        if not self.ordenada:
+            self.ordenar()
+        items = self.items
+        chaves = []
+        for alvo in range(len(items).bit_length(), 0, -1):
+            pilha = [(0, len(items) - 1, 1)]
+            while pilha and len(chaves) < qtd:
+                esquerda, direita, profundidade = pilha.pop()
+                if esquerda > direita:
+                    continue
+                meio = esquerda + (direita - esquerda) // 2
+                if profundidade == alvo:
+                    chaves.append(items[meio])
+                else:
+                    pilha.append((meio + 1, direita, profundidade + 1))
+                    pilha.append((esquerda, meio - 1, profundidade + 1))
+            if len(chaves) >= qtd:
+                break
+        return chaves
+
+    def remover(self, valor):
+        """
+        Remove uma ocorrência do valor, localizada por busca binária.
+        A remoção desloca o final da lista (memmove em C), sem lápides.
+
+        Parâmetros:
+        - valor: valor a ser removido.
+
+        Retorna:
+        - True se o valor existia, False caso contrário.
+        """
+        if not self.ordenada:
+            try:
+                self.items.remove(valor)
+            except ValueError:
+                return False
+        else:
+            posicao = bisect_left(self.items, valor)
+            if posicao == len(self.items) or self.items[posicao] != valor:
+                return False
+            del self.items[posicao]
+        self._copia_numpy = None
+        return True
+
+    def buscar_varios(self, valores):
+        """
+        Busca um lote de valores na lista ordenada.
+        Com NumPy, usa searchsorted vetorizado sobre uma cópia em array int64
+        (criada uma vez e reaproveitada até a lista mudar). Sem NumPy, usa
+        bisect por consulta.
+
+        Parâmetros:
+        - valores: lote de valores a serem buscados.
+
+        Retorna:
+        - lista de booleanos, na mesma ordem de valores.
+        """
+        if np is None:
+            items = self.items
+            tamanho = len(items)
+            resultado = []
+            for valor in valores:
+                posicao = bisect_left(items, valor)
+                resultado.append(posicao < tamanho and items[posicao] == valor)
+            return resultado
+
+        if self._copia_numpy is None:
+            self._copia_numpy = np.asarray(self.items, dtype=np.int64)
+        items = self._copia_numpy
+        consultas = np.asarray(valores, dtype=np.int64)
+        if len(items) == 0:
+            return [False] * len(consultas)
+
+        posicoes = np.searchsorted(items, consultas)
+        dentro = posicoes < len(items)
+        achados = np.zeros(len(consultas), dtype=bool)
+        achados[dentro] = items[posicoes[dentro]] == consultas[dentro]
+        return achados.tolist()
+
+    def intervalo(self, a, b=None):
+        """
+        Gera, em ordem crescente, os valores da lista ordenada no intervalo [a, b].
+        Os limites são localizados com bisect (O(log n)) e os valores são
+        produzidos um a um, sem copiar o trecho. Valores repetidos na lista
+        aparecem repetidos.
+
+        Parâmetros:
+        - a: limite inferior (inclusivo).
+        - b: limite superior (inclusivo); None para não ter limite.
+        """
+        items = self.items
+        inicio = bisect_left(items, a)
+        fim = len(items) if b is None else bisect_right(items, b)
+        for i in range(inicio, fim):
+            yield items[i]
+
+    def sucessor(self, x):
+        """
+        Retorna o menor valor >= x, ou None se não houver.
+
+        Parâmetros:
+        - x: valor de referência.
+        """
+        posicao = bisect_left(self.items, x)
+        return self.items[posicao] if posicao < len(self.items) else None
+
+class ConjuntoHash:
+    """
+    Conjunto de inteiros com tabela hash de endereçamento aberto (sondagem linear).
+    As chaves ficam direto em um array('q'); a tabela dobra de tamanho quando a
+    ocupação passa de FATOR_CARGA_MAXIMO. Busca e inserção O(1) em média.
+    Os valores precisam caber em um inteiro de 64 bits com sinal.
+    """
+    VAZIO = -(2**63) # marcador de posição livre (menor int64, não usado como chave)
+    FATOR_CARGA_MAXIMO = 0.7
+    CAPACIDADE_INICIAL = 8
+
+    def __init__(self, capacidade=CAPACIDADE_INICIAL):
+        self.quantidade = 0
+        self._alocar(capacidade)
+
+    def __len__(self):
+        return self.quantidade
+
+    def _alocar(self, capacidade):
+        # capacidade sempre potência de 2, para trocar o módulo por uma máscara
+        bits = max(3, (capacidade - 1).bit_length())
+        self._bits = bits
+        self._mascara = (1 << bits) - 1
+        self.slots = array('q', [self.VAZIO]) * (1 << bits)
+
+    def _posicao(self, valor):
+        # Hash de Fibonacci: espalha chaves sequenciais por toda a tabela
+        return ((valor * 11400714819323198485) & 0xFFFFFFFFFFFFFFFF) >> (64 - self._bits)
+
+    def _redimensionar(self):
+        antigos = self.slots
+        self._alocar(len(antigos) * 2)
+        slots = self.slots
+        mascara = self._mascara
+        for valor in antigos:
+            if valor != self.VAZIO:
+                posicao = self._posicao(valor)
+                while slots[posicao] != self.VAZIO:
+                    posicao = (posicao + 1) & mascara
+                slots[posicao] = valor
+
+    def inserir(self, valor):
+        if (self.quantidade + 1) > len(self.slots) * self.FATOR_CARGA_MAXIMO:
+            self._redimensionar()
+
+        slots = self.slots
+        mascara = self._mascara
+        posicao = self._posicao(valor)
+        while True:
+            atual = slots[posicao]
+            if atual == self.VAZIO:
+                slots[posicao] = valor
+                self.quantidade += 1
+                return
+            if atual == valor:
+                return # Valor duplicado, Ignorar
+            posicao = (posicao + 1) & mascara
+
+    def inserirVarios(self, valores):
+        """
+        Insere múltiplos valores no conjunto.
+        
+        Parâmetros:
+        - valores: lista de valores a ser inserido.
+        """
+        # reserva espaço de uma vez para não redimensionar várias vezes no meio
+        necessario = int((self.quantidade + len(valores)) / self.FATOR_CARGA_MAXIMO) + 1
+        if necessario > len(self.slots):
+            antigos = [v for v in self.slots if v != self.VAZIO]
+            self._alocar(necessario)
+            self.quantidade = 0
+            valores = antigos + list(valores)
+        for valor in valores:
+            self.inserir(valor)
+
+    def buscar(self, valor):
+        slots = self.slots
+        mascara = self._mascara
+        posicao = self._posicao(valor)
+        while True:
+            atual = slots[posicao]
+            if atual == valor:
+                return True
+            if atual == self.VAZIO:
+                return False
+            posicao = (posicao + 1) & mascara
+
+    def chaves_pior_caso(self, qtd):
+        """Até qtd chaves com a maior distância entre a posição ideal e a ocupada (mais sondas)."""
+        mascara = self._mascara
+        return [valor for _, valor in heapq.nlargest(qtd, (
+            ((posicao - self._posicao(valor)) & mascara, valor)
+            for posicao, valor in enumerate(self.slots) if valor != self.VAZIO
+        ))]
+
+    def remover(self, valor):
+        """
+        Remove um valor sem marcadores de remoção: as chaves seguintes da mesma
+        sequência de sondagem são puxadas para trás (backward shift), para que
+        nenhuma busca pare cedo demais em uma posição esvaziada.
+
+        Parâmetros:
+        - valor: valor a ser removido.
+
+        Retorna:
+        - True se o valor existia, False caso contrário.
+        """
+        slots = self.slots
+        mascara = self._mascara
+        vazio = self.VAZIO
+        livre = self._posicao(valor)
+        while slots[livre] != valor:
+            if slots[livre] == vazio:
+                return False
+            livre = (livre + 1) & mascara
+
+        seguinte = livre
+        while True:
+            seguinte = (seguinte + 1) & mascara
+            atual = slots[seguinte]
+            if atual == vazio:
+                break
+            # a chave só pode voltar se a posição livre estiver entre a posição ideal dela e onde ela está
+            ideal = self._posicao(atual)
+            if (seguinte - ideal) & mascara >= (seguinte - livre) & mascara:
+                slots[livre] = atual
+                livre = seguinte
+        slots[livre] = vazio
+        self.quantidade -= 1
+        return True
+
+    def buscar_varios(self, valores):
+        """
+        Busca um lote de valores.
+
+        Parâmetros:
+        - valores: lote de valores a serem buscados.
+
+        Retorna:
+        - lista de booleanos, na mesma ordem de valores.
+        """
+        buscar = self.buscar
+        return [buscar(valor) for valor in valores]
+
+    def bytes_por_elemento(self):
+        """
+        Memória do array de slots (incluindo as posições livres) dividida pela
+        quantidade de chaves.
+
+        Retorna:
+        - média de bytes por chave armazenada (0 se o conjunto estiver vazio).
+        """
+        if not self.quantidade:
+            return 0
+        return sys.getsizeof(self.slots) / self.quantidade
+
+class FiltroBloom:
+    """
+    Filtro de Bloom na frente de qualquer estrutura (Lista, Arvore, ListaOtimizada...).
+    Um array de bits e k funções hash respondem "com certeza não existe" sem
+    tocar na estrutura; só os valores que passam pelo filtro (existentes ou
+    falsos positivos) chegam ao buscar da estrutura envolvida.
+    Demais atributos (ex.: ordenar) são repassados para a estrutura.
+    """
+    def __init__(self, estrutura, capacidade, bits_por_chave=BLOOM_BITS_POR_CHAVE, num_hashes=None):
+        """
+        Parâmetros:
+        - estrutura: estrutura envolvida (precisa ter inserir e buscar).
+        - capacidade: quantidade de chaves esperada (dimensiona o array de bits).
+        - bits_por_chave: bits reservados por chave esperada.
+        - num_hashes: quantidade de funções hash (padrão: ótimo, bits_por_chave * ln 2).
+        """
+        self.estrutura = estrutura
+        self.num_bits = max(64, int(capacidade * bits_por_chave))
+        self.num_hashes = num_hashes or max(1, round(bits_por_chave * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.descartes = 0 # buscas respondidas só pelo filtro
+
+    def __getattr__(self, nome):
+        # copy/pickle consultam atributos antes do __init__: sem esta guarda,
+        # self.estrutura chamaria __getattr__ de novo, em recursão infinita
+        if nome == "estrutura":
+            raise AttributeError(nome)
+        return getattr(self.estrutura, nome)
+
+    @staticmethod
+    def _misturar(x):
+        # splitmix64: espalha bem inteiros próximos
+        x = (x + 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+        x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & 0xFFFFFFFFFFFFFFFF
+        x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & 0xFFFFFFFFFFFFFFFF
+        return x ^ (x >> 31)
+
+    def _posicoes(self, valor):
+        # hash duplo: h1 + i*h2 gera as k posições com só duas misturas
+        h1 = self._misturar(valor)
+        h2 = self._misturar(h1) | 1
+        num_bits = self.num_bits
+        return [(h1 + i * h2) % num_bits for i in range(self.num_hashes)]
+
+    def indexar(self, valores):
+        """
+        Marca valores no filtro sem inseri-los na estrutura
+        (para envolver uma estrutura que já foi construída).
+        
+        Parâmetros:
+        - valores: valores já presentes na estrutura.
+        """
+        bits = self.bits
+        for valor in valores:
+            for posicao in self._posicoes(valor):
+                bits[posicao >> 3] |= 1 << (posicao & 7)
+
+    def pode_conter(self, valor):
+        """Retorna False se o valor com certeza não existe; True se talvez exista."""
+        bits = self.bits
+        for posicao in self._posicoes(valor):
+            if not bits[posicao >> 3] & (1 << (posicao & 7)):
+                return False
+        return True
+
+    def inserir(self, valor):
+        self.indexar((valor,))
+        self.estrutura.inserir(valor)
+
+    def inserirVarios(self, valores):
+        """
+        Insere múltiplos valores no filtro e na estrutura.
+        
+        Parâmetros:
+        - valores: lista de valores a ser inserido.
+        """
+        self.indexar(valores)
+        if hasattr(self.estrutura, "inserirVarios"):
+            self.estrutura.inserirVarios(valores)
+        else:
+            for valor in valores:
+                self.estrutura.inserir(valor)
+
+    def buscar(self, valor):
+        if not self.pode_conter(valor):
+            self.descartes += 1
+            return False
+        return self.estrutura.buscar(valor)
+
+    def remover(self, valor):
+        """
+        Remove da estrutura envolvida. Os bits do filtro não podem ser
+        apagados (outras chaves podem usá-los), então o valor removido passa a
+        contar como possível falso positivo; a resposta continua correta.
+        """
+        return self.estrutura.remover(valor)
+
+    def buscar_varios(self, valores):
+        """
+        Busca um lote de valores; só os que passam pelo filtro vão para a estrutura.
+
+        Parâmetros:
+        - valores: lote de valores a serem buscados.
+
+        Retorna:
+        - lista de booleanos, na mesma ordem de valores.
+        """
+        candidatos = [valor for valor in valores if self.pode_conter(valor)]
+        self.descartes += len(valores) - len(candidatos)
+        if not candidatos:
+            return [False] * len(valores)
+        encontrados = {v for v, achado in zip(candidatos, self.estrutura.buscar_varios(candidatos)) if achado}
+        return [valor in encontrados for valor in valores]
+
+    def taxa_falso_positivo(self, inexistentes):
+        """
+        Mede a taxa de falsos positivos com valores sabidamente ausentes.
+        
+        Parâmetros:
+        - inexistentes: valores que não estão na estrutura.
+        
+        Retorna:
+        - fração dos valores que passaram pelo filtro (0.0 a 1.0).
+        """
+        if not inexistentes:
+            return 0.0
+        return sum(1 for valor in inexistentes if self.pode_conter(valor)) / len(inexistentes)
+
+    def bytes_memoria(self):
+        """Memória extra ocupada pelo array de bits do filtro."""
+        return sys.getsizeof(self.bits)
+
+class CacheLRU:
+    """
+    Cache LRU (menos usado recentemente) de resultados de busca na frente de
+    qualquer estrutura. Guarda até `capacidade` respostas (inclusive as
+    negativas) e conta acertos/erros; inserir e remover mantêm o cache coerente.
+    Demais atributos são repassados para a estrutura, como no FiltroBloom.
+    """
+    def __init__(self, estrutura, capacidade=CAPACIDADE_CACHE_LRU):
+        """
+        Parâmetros:
+        - estrutura: estrutura envolvida (precisa ter buscar).
+        - capacidade: quantidade máxima de resultados guardados.
+        """
+        self.estrutura = estrutura
+        self.capacidade = capacidade
+        self.resultados = OrderedDict()
+        self.acertos = 0
+        self.erros = 0
+
+    def __getattr__(self, nome):
+        if nome == "estrutura": # mesma guarda do FiltroBloom (copy/pickle)
+            raise AttributeError(nome)
+        return getattr(self.estrutura, nome)
+
+    def _guardar(self, valor, achado):
+        self.resultados[valor] = achado
+        if len(self.resultados) > self.capacidade:
+            self.resultados.popitem(last=False)
+
+    def buscar(self, valor):
+        resultados = self.resultados
+        if valor in resultados:
+            resultados.move_to_end(valor)
+            self.acertos += 1
+            return resultados[valor]
+        self.erros += 1
+        achado = self.estrutura.buscar(valor)
+        self._guardar(valor, achado)
+        return achado
+
+    def buscar_varios(self, valores):
+        """
+        Busca um lote: os valores em cache são respondidos direto, o resto vai
+        para a estrutura em um único buscar_varios.
+
+        Parâmetros:
+        - valores: lote de valores a serem buscados.
+
+        Retorna:
+        - lista de booleanos, na mesma ordem de valores.
+        """
+        resultados = self.resultados
+        faltantes = [valor for valor in valores if valor not in resultados]
+        self.erros += len(faltantes)
+        self.acertos += len(valores) - len(faltantes)
+        novos = dict(zip(faltantes, self.estrutura.buscar_varios(faltantes))) if faltantes else {}
+
+        resposta = []
+        for valor in valores:
+            if valor in novos:
+                resposta.append(novos[valor])
+            else:
+                resultados.move_to_end(valor)
+                resposta.append(resultados[valor])
+        # só guarda os novos no fim, para não descartar entradas que o lote ainda vai ler
+        for valor, achado in novos.items():
+            self._guardar(valor, achado)
+        return resposta
+
+    def inserir(self, valor):
+        self.estrutura.inserir(valor)
+        if valor in self.resultados:
+            self.resultados[valor] = True
+
+    def inserirVarios(self, valores):
+        self.estrutura.inserirVarios(valores)
+        for valor in valores:
+            if valor in self.resultados:
+                self.resultados[valor] = True
+
+    def remover(self, valor):
+        # a estrutura pode ter duplicatas: descarta a resposta guardada em vez de supor False
+        self.resultados.pop(valor, None)
+        return self.estrutura.remover(valor)
+
+    def taxa_acerto(self):
+        """Fração das buscas respondidas pelo cache (0.0 a 1.0)."""
+        total = self.acertos + self.erros
+        return self.acertos / total if total else 0.0
+
+    def limpar(self):
+        """Esvazia o cache e zera as estatísticas."""
+        self.resultados.clear()
+        self.acertos = 0
+        self.erros = 0
+
+def _servir_particao(conexao, classe):
+    """
+    Processo dono de uma partição do IndiceParticionado: constrói a própria
+    estrutura e responde aos comandos recebidos pelo Pipe até receber "fechar"
+    (ver _servir_comandos). Lotes de valores trafegam como bytes de array('q').
+    """
+    estrutura = classe()
+
+    def construir(dados):
+        valores = array('q')
+        valores.frombytes(dados)
+        estrutura.inserirVarios(valores)
+        if hasattr(estrutura, "ordenar"):
+            estrutura.ordenar()
+        return len(valores)
+
+    def buscar_varios(dados):
+        consultas = array('q')
+        consultas.frombytes(dados)
+        return estrutura.buscar_varios(consultas.tolist())
+
+    _servir_comandos(conexao, {
+        "construir": construir,
+        "buscar_varios": buscar_varios,
+        "buscar": estrutura.buscar,
+        "inserir": estrutura.inserir,
+        "remover": estrutura.remover,
+    })
+
+class IndiceParticionado:
+    """
+    Índice dividido por faixas de valores entre vários processos.
+    O intervalo [minimo, maximo] (por padrão o [1, qtd*10] de gerar_dataset) é
+    cortado em faixas de mesmo tamanho; cada faixa pertence a um processo que
+    constrói e consulta a própria estrutura (em paralelo, cada um com seu heap
+    e seu GIL). Um roteador encaminha cada valor para o dono da faixa; lotes
+    são divididos por partição e enviados a todas antes de esperar respostas.
+    Chame fechar() (ou use com with) para encerrar os processos.
+    """
+    def __init__(self, num_particoes=4, classe=Arvore, minimo=1, maximo=None):
+        """
+        Parâmetros:
+        - num_particoes: quantidade de faixas/processos.
+        - classe: estrutura usada em cada partição (precisa de inserirVarios e buscar_varios).
+        - minimo, maximo: intervalo de valores; maximo=None é definido no construir.
+        """
+        self.num_particoes = num_particoes
+        self.classe = classe
+        self.minimo = minimo
+        self.limites = []
+        self._conexoes = []
+        self._processos = []
+        if maximo is not None:
+            self._definir_faixas(maximo)
+        for _ in range(num_particoes):
+            local, remota = multiprocessing.Pipe()
+            processo = multiprocessing.Process(target=_servir_particao, args=(remota, classe), daemon=True)
+            processo.start()
+            remota.close()
+            self._conexoes.append(local)
+            self._processos.append(processo)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
+
+    def _definir_faixas(self, maximo):
+        # limites[i] = maior valor da faixa i (a última faixa fica com o resto)
+        largura = max(1, (maximo - self.minimo + 1) // self.num_particoes)
+        self.limites = [self.minimo + largura * (i + 1) - 1 for i in range(self.num_particoes - 1)]
+
+    def _particao(self, valor):
+        return bisect_left(self.limites, valor)
+
+    def construir(self, valores):
+        """
+        Distribui os valores pelas faixas e constrói todas as partições em paralelo.
+        
+        Parâmetros:
+        - valores: conjunto de dados.
+        """
+        if not self.limites and self.num_particoes > 1:
+            self._definir_faixas(max(valores) if valores else self.minimo)
+        lotes = [array('q') for _ in range(self.num_particoes)]
+        limites = self.limites
+        for valor in valores:
+            lotes[bisect_left(limites, valor)].append(valor)
+
+        for conexao, lote in zip(self._conexoes, lotes):
+            conexao.send(("construir", lote.tobytes()))
+        _receber_respostas(self._conexoes)
+
+    def inserirVarios(self, valores):
+        self.construir(valores)
+
+    def _enviar(self, comando, valor):
+        conexao = self._conexoes[self._particao(valor)]
+        conexao.send((comando, valor))
+        return _receber_respostas([conexao])[0]
+
+    def inserir(self, valor):
+        self._enviar("inserir", valor)
+
+    def buscar(self, valor):
+        return self._enviar("buscar", valor)
+
+    def remover(self, valor):
+        return self._enviar("remover", valor)
+
+    def buscar_varios(self, valores):
+        """
+        Busca um lote: divide por partição, envia tudo e depois junta as respostas.
+
+        Parâmetros:
+        - valores: lote de valores a serem buscados.
+
+        Retorna:
+        - lista de booleanos, na mesma ordem de valores.
+        """
+        posicoes = [[] for _ in range(self.num_particoes)]
+        consultas = [array('q') for _ in range(self.num_particoes)]
+        for posicao, valor in enumerate(valores):
+            particao = self._particao(valor)
+            posicoes[particao].append(posicao)
+            consultas[particao].append(valor)
+
+        ativas = [i for i in range(self.num_particoes) if consultas[i]]
+        for i in ativas:
+            self._conexoes[i].send(("buscar_varios", consultas[i].tobytes()))
+
+        resultado = [False] * len(valores)
+        for i, achados in zip(ativas, _receber_respostas([self._conexoes[i] for i in ativas])):
+            for posicao, achado in zip(posicoes[i], achados):
+                resultado[posicao] = achado
+        return resultado
+
+    def fechar(self):
+        """Encerra os processos das partições."""
+        for conexao in self._conexoes:
+            try:
+                conexao.send(("fechar", None))
+                conexao.close()
+            except (OSError, BrokenPipeError):
+                pass
+        for processo in self._processos:
+            processo.join(timeout=5)
+        self._conexoes = []
+        self._processos = []
+
+#  === INSTRUMENTAÇÃO (opcional) ===
+# Subclasses que contam operações. As classes comuns não têm nenhum contador,
+# então só paga pela contagem quem instancia a versão instrumentada.
+class ArvoreInstrumentada(Arvore):
+    """
+    Arvore que conta comparações de chaves e nós visitados em buscar e inserir.
+    """
+    def __init__(self):
+        super().__init__()
+        self.zerar_contadores()
+
+    def zerar_contadores(self):
+        self.contadores = {
+            operacao: {"chamadas": 0, "comparacoes": 0, "nos_visitados": 0}
+            for operacao in ("buscar", "inserir")
+        }
+
+    def inserir(self, valor):
+        contador = self.contadores["inserir"]
+        contador["chamadas"] += 1
+        if self.raiz is None:
+            self.raiz = Node(valor)
+            return
+
+        no_atual = self.raiz
+        comparacoes = visitados = 0
+        while True:
+            visitados += 1
+            comparacoes += 1
+            if valor < no_atual.valor:
+                if no_atual.esquerda is None:
+                    no_atual.esquerda = Node(valor)
+                    break
+                no_atual = no_atual.esquerda
+            else:
+                comparacoes += 1
+                if valor > no_atual.valor:
+                    if no_atual.direita is None:
+                        no_atual.direita = Node(valor)
+                        break
+                    no_atual = no_atual.direita
+                else:
+                    break # Valor duplicado, Ignorar
+        contador["comparacoes"] += comparacoes
+        contador["nos_visitados"] += visitados
+
+    def buscar(self, valor):
+        contador = self.contadores["buscar"]
+        contador["chamadas"] += 1
+        no_atual = self.raiz
+        comparacoes = visitados = 0
+        achou = False
+        while no_atual is not None:
+            visitados += 1
+            comparacoes += 1
+            if valor == no_atual.valor:
+                achou = True
+                break
+            comparacoes += 1
+            if valor < no_atual.valor:
+                no_atual = no_atual.esquerda
+            else:
+                no_atual = no_atual.direita
+        contador["comparacoes"] += comparacoes
+        contador["nos_visitados"] += visitados
+        return achou
+
+class ListaOtimizadaInstrumentada(ListaOtimizada):
+    """
+    ListaOtimizada que conta comparações e movimentos de elementos nos merge sorts
+    e sondas (posições consultadas) na busca binária.
+    """
+    def __init__(self):
+        super().__init__()
+        self.zerar_contadores()
+
+    def zerar_contadores(self):
+        self.contadores = {
+            "ordenacao": {"comparacoes": 0, "movimentos": 0},
+            "busca_binaria": {"chamadas": 0, "comparacoes": 0, "sondas": 0},
+        }
+
+    def merge_sort(self, lista):
+        # mesma recursão de ListaOtimizada.merge_sort, contando cada comparação e cópia
+        contador = self.contadores["ordenacao"]
+        if len(lista) > 1:
+            meio = len(lista) // 2
+            metade_esquerda = lista[:meio]
+            metade_direita = lista[meio:]
+            contador["movimentos"] += len(lista) # cópias feitas pelas fatias
+
+            self.merge_sort(metade_esquerda)
+            self.merge_sort(metade_direita)
+
+            ponteiro_e = ponteiro_d = ponteiro_r = 0
+            comparacoes = 0
+            while ponteiro_e < len(metade_esquerda) and ponteiro_d < len(metade_direita):
+                comparacoes += 1
+                if metade_esquerda[ponteiro_e] < metade_direita[ponteiro_d]:
+                    lista[ponteiro_r] = metade_esquerda[ponteiro_e]
+                    ponteiro_e += 1
+                else:
+                    lista[ponteiro_r] = metade_direita[ponteiro_d]
+                    ponteiro_d += 1
+                ponteiro_r += 1
+
+            while ponteiro_e < len(metade_esquerda):
+                lista[ponteiro_r] = metade_esquerda[ponteiro_e]
+                ponteiro_e += 1
+                ponteiro_r += 1
+
+            while ponteiro_d < len(metade_direita):
+                lista[ponteiro_r] = metade_direita[ponteiro_d]
+                ponteiro_d += 1
+                ponteiro_r += 1
+
+            contador["comparacoes"] += comparacoes
+            contador["movimentos"] += len(lista) # cada elemento volta uma vez para a lista
+        return lista
+
+    def merge_sort_buffer(self, lista):
+        # mesmo bottom-up de ListaOtimizada.merge_sort_buffer, contando comparações e cópias
+        contador = self.contadores["ordenacao"]
+        n = len(lista)
+        if n < 2:
+            return lista
+
+        origem = lista
+        destino = [0] * n
+        largura = 1
+        comparacoes = 0
+
+        while largura < n:
+            for inicio in range(0, n, 2 * largura):
+                meio = min(inicio + largura, n)
+                fim = min(inicio + 2 * largura, n)
+                ponteiro_e, ponteiro_d, ponteiro_r = inicio, meio, inicio
+
+                while ponteiro_e < meio and ponteiro_d < fim:
+                    comparacoes += 1
+                    if origem[ponteiro_d] < origem[ponteiro_e]:
+                        destino[ponteiro_r] = origem[ponteiro_d]
+                        ponteiro_d += 1
+                    else:
+                        destino[ponteiro_r] = origem[ponteiro_e]
+                        ponteiro_e += 1
+                    ponteiro_r += 1
+
+                if ponteiro_e < meio:
+                    destino[ponteiro_r:fim] = origem[ponteiro_e:meio]
+                elif ponteiro_d < fim:
+                    destino[ponteiro_r:fim] = origem[ponteiro_d:fim]
+
+            contador["movimentos"] += n # toda passada escreve os n elementos no destino
+            origem, destino = destino, origem
+            largura *= 2
+
+        if origem is not lista:
+            lista[:] = origem
+            contador["movimentos"] += n
+        contador["comparacoes"] += comparacoes
+        return lista
+
+    def busca_binaria(self, valor):
+        contador = self.contadores["busca_binaria"]
+        contador["chamadas"] += 1
+        esquerda = 0
+        direita = len(self.items) - 1
+        sondas = comparacoes = 0
+        achou = False
+
+        while esquerda <= direita:
+            meio = esquerda + (direita - esquerda) // 2
+            sondas += 1
+            comparacoes += 1
+            if self.items[meio] == valor:
+                achou = True
+                break
+            comparacoes += 1
+            if self.items[meio] < valor:
+                esquerda = meio + 1
+            else:
+                direita = meio - 1
+
+        contador["sondas"] += sondas
+        contador["comparacoes"] += comparacoes
+        return achou
+
+def verificar_instrumentadas(valores, consultas):
+    """
+    Confere que as cópias com contadores ainda fazem o mesmo que as originais:
+    mesma forma da Arvore, mesma ordenação nos dois merge sorts e mesmas
+    respostas de buscar/busca_binaria. Uma mudança em Arvore ou ListaOtimizada
+    que não seja repetida nas instrumentadas é acusada aqui, em vez de deixar os
+    contadores descrevendo um algoritmo que não é mais o medido.
+
+    Parâmetros:
+    - valores: conjunto de dados usado na construção.
+    - consultas: valores buscados (existentes e inexistentes).
+
+    Lança:
+    - RuntimeError com o primeiro método divergente.
+    """
+    arvore, instrumentada = Arvore(), ArvoreInstrumentada()
+    arvore.inserirVarios(valores)
+    instrumentada.inserirVarios(valores)
+    if [(no.valor, p) for no, p in arvore._percorrer()] != [(no.valor, p) for no, p in instrumentada._percorrer()]:
+        raise RuntimeError("ArvoreInstrumentada.inserir diverge de Arvore.inserir")
+    if [arvore.buscar(v) for v in consultas] != [instrumentada.buscar(v) for v in consultas]:
+        raise RuntimeError("ArvoreInstrumentada.buscar diverge de Arvore.buscar")
+
+    for metodo in ("merge_sort", "merge_sort_buffer"):
+        if getattr(ListaOtimizada(), metodo)(list(valores)) != getattr(ListaOtimizadaInstrumentada(), metodo)(list(valores)):
+            raise RuntimeError(f"ListaOtimizadaInstrumentada.{metodo} diverge de ListaOtimizada.{metodo}")
+
+    lista, instrumentada = ListaOtimizada(), ListaOtimizadaInstrumentada()
+    lista.items = instrumentada.items = sorted(valores)
+    if [lista.busca_binaria(v) for v in consultas] != [instrumentada.busca_binaria(v) for v in consultas]:
+        raise RuntimeError("ListaOtimizadaInstrumentada.busca_binaria diverge de ListaOtimizada.busca_binaria")
+
+#  === FUNÇÕES AUXILIARES ===
+
+def ler_arquivo(arquivo, usar_binario=True):
+    """
+    Lê um arquivo txt e retorna os valores como uma lista de inteiros.
+    Se existir uma versão binária (.bin) atualizada ao lado do txt, ela é
+    mapeada em memória sem nenhuma conversão de texto; caso contrário o txt é
+    lido e convertido uma única vez para .bin, acelerando as próximas execuções.
+    
+    Parâmetros:
+    - arquivo: nome do arquivo txt a ser lido
+    - usar_binario: se False, ignora o formato binário e sempre lê o txt
+    
+    Retorna:
+    - lista com os valores inteiros do arquivo (memoryview quando vem do .bin)
+    """
+    
+
+    pasta_do_script = os.path.dirname(os.path.abspath(__file__))
+    caminho_completo = os.path.join(pasta_do_script, arquivo)
+    caminho_bin = caminho_binario(caminho_completo)
+    
+    if usar_binario and os.path.exists(caminho_bin) and (
+        not os.path.exists(caminho_completo)
+        or os.path.getmtime(caminho_bin) >= os.path.getmtime(caminho_completo)
+    ):
+        try:
+            return carregar_binario(caminho_bin)
+        except (OSError, ValueError) as e:
+            print(f"\nFalha ao ler {caminho_bin}: {e}. Usando o txt.")
+    
+    if not os.path.exists(caminho_completo):
+        print(f"\nArquivo '{arquivo}' não encontrado. Pulando testes relacionados.")
+        return []
+    
+    try:
+        valores = []
+        with open(caminho_completo, "r") as arq:
+            for linha in arq:
+                valor = int(linha.strip())
+                valores.append(valor)
+    except Exception as e:
+        print(f"\nFalha ao ler {arquivo}: {e}")
+        return
+    
+    if usar_binario:
+        # conversão única: as próximas leituras usam o .bin
+        try:
+            escrever_binario(caminho_bin, valores)
+        except (OSError, OverflowError) as e:
+            print(f"\nNão foi possível gerar {caminho_bin}: {e}")
+    return valores
+
+
+def memoria_rss():
+    """
+    Retorna a memória residente (RSS) atual do processo, em bytes.
+    Usa /proc no Linux; nos outros sistemas recorre ao pico (ru_maxrss).
+    """
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        import resource
+        pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return pico if sys.platform == "darwin" else pico * 1024 # macOS em bytes, Linux em KiB
+
+
+
+
+class CacheDatasets:
+    """
+    Cache dos conjuntos já lidos, compartilhado por todas as fases do benchmark.
+    A chave é (caminho, mtime): se o arquivo mudar, ele é lido de novo.
+    Em memória, os conjuntos ficam em ordem de uso (LRU) e os menos usados são
+    descartados quando o total passa do limite. Em disco, o cache dos valores
+    já interpretados é o próprio .bin gerado por ler_arquivo (opcional).
+    Os valores devolvidos são compartilhados: não devem ser modificados.
+    """
+    def __init__(self, limite_bytes=LIMITE_CACHE_DATASETS, usar_disco=True):
+        """
+        Parâmetros:
+        - limite_bytes: memória máxima estimada dos conjuntos em cache.
+        - usar_disco: se True, usa/gera o .bin (cache em disco dos valores interpretados).
+        """
+        self.limite_bytes = limite_bytes
+        self.usar_disco = usar_disco
+        self._entradas = OrderedDict() # chave -> (valores, bytes estimados, tempo de leitura)
+        self.bytes_em_uso = 0
+        self.acertos = 0
+        self.falhas = 0
+        self.tempo_economizado = 0.0
+
+    @staticmethod
+    def _tamanho(valores):
+        if isinstance(valores, memoryview):
+            return valores.nbytes
+        # lista: ponteiros + objetos int (~28 bytes cada)
+        return sys.getsizeof(valores) + 28 * len(valores)
+
+    def ler(self, arquivo):
+        """
+        Mesma interface de ler_arquivo, passando pelo cache.
         
-        # instancia os objetos pros testes
-        lista_ponto = Lista()
-        arvore_ponto = Arvore()
+        Parâmetros:
+        - arquivo: nome do arquivo txt a ser lido
         
-        # insere os dados nos objetos
-        lista_ponto.inserirVarios(dados_teste)
-        for valor in dados_teste:
-            arvore_ponto.inserir(valor)
-            
-        # gera os valores necessarios pra realizar as buscas    
-        qtd_busca = quantidade // 2
-        busca_inexistentes = gerar_valores_busca(dados_teste, qtd_busca, existente=False)
-        busca_existentes = gerar_valores_busca(dados_teste, qtd_busca) 
+        Retorna:
+        - valores do arquivo (compartilhados, somente leitura)
+        """
+        fonte = _caminho_fonte(arquivo)
+        mtime = os.path.getmtime(fonte) if os.path.exists(fonte) else None
+        chave = (fonte, mtime)
         
-        # inexistentes
-        inicio_lista_inex = time.perf_counter()
-        for v in busca_inexistentes: lista_ponto.buscar(v)
-        tempo_lista_inex = time.perf_counter() - inicio_lista_inex
+        if chave in self._entradas:
+            self._entradas.move_to_end(chave)
+            valores, _, tempo_leitura = self._entradas[chave]
+            self.acertos += 1
+            self.tempo_economizado += tempo_leitura
+            return valores
         
-        inicio_arvore_inex = time.perf_counter()
-        for v in busca_inexistentes: arvore_ponto.buscar(v)
-        tempo_arvore_inex = time.perf_counter() - inicio_arvore_inex
+        self.falhas += 1
+        inicio = time.perf_counter()
+        valores = ler_arquivo(arquivo, usar_binario=self.usar_disco)
+        tempo_leitura = time.perf_counter() - inicio
+        if not valores:
+            return valores # arquivo ausente ou com erro: nada a guardar
         
-        # Existentes
-        inicio_lista_ex = time.perf_counter()
-        for v in busca_existentes: lista_ponto.buscar(v)
-        tempo_lista_ex = time.perf_counter() - inicio_lista_ex
-
-        inicio_arvore_ex = time.perf_counter()
-        for v in busca_existentes: arvore_ponto.buscar(v)
-        tempo_arvore_ex = time.perf_counter() - inicio_arvore_ex
+        tamanho = self._tamanho(valores)
+        if tamanho <= self.limite_bytes:
+            self._entradas[chave] = (valores, tamanho, tempo_leitura)
+            self.bytes_em_uso += tamanho
+            while self.bytes_em_uso > self.limite_bytes:
+                _, (_, tamanho_antigo, _) = self._entradas.popitem(last=False)
+                self.bytes_em_uso -= tamanho_antigo
+        return valores
+
+    def resumo(self):
+        """Texto com acertos, falhas e tempo de leitura economizado."""
+        return (f"acertos {self.acertos} | falhas {self.falhas} | "
+                f"tempo de leitura economizado {self.tempo_economizado:.6f}s | "
+                f"em memoria {self.bytes_em_uso / 2**20:.1f} MiB ({len(self._entradas)} conjuntos)")
+
+
+# Instância única, usada por todas as fases
+cache_datasets = CacheDatasets()
+
+
+def ler_arquivo_em_lotes(arquivo, tamanho_lote=TAMANHO_LOTE_LEITURA, usar_binario=True):
+    """
+    Lê um arquivo de valores em lotes de tamanho fixo, sem materializar o
+    conjunto inteiro. Usa o .bin atualizado quando existir (mesma regra de
+    ler_arquivo), senão interpreta o txt linha a linha.
+    
+    Parâmetros:
+    - arquivo: nome do arquivo txt a ser lido
+    - tamanho_lote: quantidade de valores por lote
+    - usar_binario: se False, ignora o formato binário e sempre lê o txt
+    
+    Retorna:
+    - gerador de listas de inteiros (o último lote pode ser menor)
+    """
+    pasta_do_script = os.path.dirname(os.path.abspath(__file__))
+    caminho_completo = os.path.join(pasta_do_script, arquivo)
+    caminho_bin = caminho_binario(caminho_completo)
+    
+    if usar_binario and os.path.exists(caminho_bin) and (
+        not os.path.exists(caminho_completo)
+        or os.path.getmtime(caminho_bin) >= os.path.getmtime(caminho_completo)
+    ):
+        valores = carregar_binario(caminho_bin)
+        for inicio in range(0, len(valores), tamanho_lote):
+            yield valores[inicio:inicio + tamanho_lote].tolist()
+        return
+    
+    if not os.path.exists(caminho_completo):
+        print(f"\nArquivo '{arquivo}' não encontrado. Pulando testes relacionados.")
+        return
+    
+    lote = []
+    with open(caminho_completo, "r") as arq:
+        for linha in arq:
+            lote.append(int(linha))
+            if len(lote) == tamanho_lote:
+                yield lote
+                lote = []
+    if lote:
+        yield lote
+
+
+def _produzir_lotes(arquivo, tamanho_lote, usar_binario, fila):
+    """
+    Produtor do pipeline (thread ou processo): lê os lotes e os coloca na fila.
+    Em processo, os lotes viajam como bytes de array('q') (bem mais baratos de
+    serializar que listas). None sinaliza o fim; uma exceção é repassada.
+    """
+    em_processo = not isinstance(fila, queue.Queue)
+    try:
+        for lote in ler_arquivo_em_lotes(arquivo, tamanho_lote, usar_binario):
+            fila.put(array('q', lote).tobytes() if em_processo else lote)
+        fila.put(None)
+    except Exception as e:
+        fila.put(e)
+
+
+def ler_em_segundo_plano(arquivo, tamanho_lote=TAMANHO_LOTE_LEITURA, modo="thread",
+                         max_lotes=MAX_LOTES_NA_FILA, usar_binario=True):
+    """
+    Lê o arquivo em lotes em uma thread ou processo separado, entregando-os
+    por uma fila limitada: a leitura do próximo lote acontece enquanto o
+    anterior é consumido, e no máximo max_lotes ficam em memória esperando.
+    
+    Parâmetros:
+    - arquivo: nome do arquivo txt a ser lido
+    - tamanho_lote: quantidade de valores por lote
+    - modo: "thread" ou "processo" (processo não disputa o GIL com o consumidor)
+    - max_lotes: capacidade da fila
+    - usar_binario: se False, ignora o formato binário e sempre lê o txt
+    
+    Retorna:
+    - gerador de listas de inteiros
+    """
+    if modo == "thread":
+        fila = queue.Queue(max_lotes)
+        produtor = threading.Thread(target=_produzir_lotes, args=(arquivo, tamanho_lote, usar_binario, fila), daemon=True)
+    elif modo == "processo":
+        fila = multiprocessing.Queue(max_lotes)
+        produtor = multiprocessing.Process(target=_produzir_lotes, args=(arquivo, tamanho_lote, usar_binario, fila), daemon=True)
+    else:
+        raise ValueError(f"Modo de leitura desconhecido: {modo!r} (opções: thread, processo)")
+    
+    produtor.start()
+    try:
+        while True:
+            lote = fila.get()
+            if lote is None:
+                break
+            if isinstance(lote, Exception):
+                raise lote
+            yield array('q', lote).tolist() if isinstance(lote, bytes) else lote
+    finally:
+        # consumidor parou antes do fim: não deixa o processo produtor pendurado na fila
+        if modo == "processo" and produtor.is_alive():
+            produtor.terminate()
+        produtor.join(timeout=1)
+
+
+def construir_em_fluxo(estrutura, lotes):
+    """
+    Constrói a estrutura consumindo os lotes à medida que chegam.
+    Estruturas com ordenar (ListaOtimizada) são ordenadas no final.
+    
+    Parâmetros:
+    - estrutura: estrutura a ser preenchida (precisa ter inserirVarios).
+    - lotes: iterável de listas de valores (ex.: ler_em_segundo_plano).
+    
+    Retorna:
+    - tupla (tempo total em segundos, pico de RSS observado em bytes)
+    """
+    inicio = time.perf_counter()
+    pico_rss = memoria_rss()
+    for lote in lotes:
+        estrutura.inserirVarios(lote)
+        pico_rss = max(pico_rss, memoria_rss())
+    if hasattr(estrutura, "ordenar"):
+        estrutura.ordenar()
+        pico_rss = max(pico_rss, memoria_rss())
+    return time.perf_counter() - inicio, pico_rss
+
+
+def construir_tradicional(classe, arquivo):
+    """
+    Lê o txt inteiro e só então constrói a estrutura (a referência da construção em fluxo).
+    
+    Parâmetros:
+    - classe: classe da estrutura (precisa ter inserirVarios).
+    - arquivo: nome do arquivo txt.
+    
+    Retorna:
+    - tupla (tempo total em segundos, pico de RSS observado em bytes)
+    """
+    inicio = time.perf_counter()
+    valores = ler_arquivo(arquivo, usar_binario=False)
+    pico_rss = memoria_rss()
+    estrutura = classe()
+    estrutura.inserirVarios(valores)
+    if hasattr(estrutura, "ordenar"):
+        estrutura.ordenar()
+    return time.perf_counter() - inicio, max(pico_rss, memoria_rss())
+
+
+def gerar_operacoes_carga(valores, mistura=(80, 15, 5), qtd_operacoes=QTD_OPERACOES_CARGA, semente=42):
+    """
+    Gera uma sequência reprodutível de operações para a carga mista.
+    Buscas e remoções usam metade valores existentes no conjunto e metade
+    sorteados no mesmo intervalo; inserções usam valores sorteados.
+    
+    Parâmetros:
+    - valores: conjunto de dados usado para construir a estrutura.
+    - mistura: porcentagens de (buscar, inserir, remover).
+    - qtd_operacoes: quantidade total de operações.
+    - semente: semente do sorteio.
+    
+    Retorna:
+    - lista de tuplas (nome do método, valor)
+    """
+    gerador = random.Random(semente)
+    maximo = max(valores) if valores else 1
+    operacoes = []
+    for nome in gerador.choices(("buscar", "inserir", "remover"), weights=mistura, k=qtd_operacoes):
+        if nome != "inserir" and valores and gerador.random() < 0.5:
+            valor = valores[gerador.randrange(len(valores))]
+        else:
+            valor = gerador.randint(1, maximo)
+        operacoes.append((nome, valor))
+    return operacoes
+
+
+def executar_carga(estrutura, operacoes):
+    """
+    Reproduz as operações na estrutura e mede a vazão.
+    
+    Parâmetros:
+    - estrutura: estrutura já construída (precisa de buscar, inserir e remover).
+    - operacoes: lista gerada por gerar_operacoes_carga.
+    
+    Retorna:
+    - tupla (tempo em segundos, operações por segundo)
+    """
+    # resolve os métodos uma vez, fora do laço medido
+    metodos = {"buscar": estrutura.buscar, "inserir": estrutura.inserir, "remover": estrutura.remover}
+    inicio = time.perf_counter()
+    for nome, valor in operacoes:
+        metodos[nome](valor)
+    tempo = time.perf_counter() - inicio
+    return tempo, (len(operacoes) / tempo if tempo else float("inf"))
+
+
+def gerar_valores_busca(valores, qtd, existente=True):
+    """
+    Gera valores para teste de busca em uma lista de dados selecionada.
+
+    Parâmetros:
+    - valores: A lista inteira de onde tirar a amostra.
+    - quantidade: O número de valores a serem gerados.
+    - existente: boolean que define se gera valores existentes ou não existentes na estrutura alvo
+
+    Retorna:
+    - Uma lista com a amostra de valores na lista passada como parâmetro (padrão: existentes).
+    """
+    
+    if not valores: return []
+    
+    resultado = []
+    if existente:
+        # calcula um intervalo pra fazer o incremento nos indices de acordo com a quantidade passada
+        intervalo = len(valores) // qtd
         
+        # gera valores existentes na lista, pegando eles da propria lista por indice
+        for i in range(qtd):
+            indice = i * intervalo
+            resultado.append(valores[indice])
+
+    else:
+        maior = max(valores)
+        for x in range(maior + 1, (maior + (qtd + 1))):
+            resultado.append(x)
+    
+    return resultado
+
+
+def gerar_consultas_uniformes(valores, qtd, semente=42):
+    """
+    Sorteia consultas uniformemente entre os valores existentes (com repetição).
+
+    Parâmetros:
+    - valores: conjunto de dados.
+    - qtd: quantidade de consultas.
+    - semente: semente do sorteio (reprodutível).
+
+    Retorna:
+    - lista de valores a buscar.
+    """
+    if not valores: return []
+    gerador = random.Random(semente)
+    n = len(valores)
+    return [valores[gerador.randrange(n)] for _ in range(qtd)]
+
+
+def gerar_consultas_zipf(valores, qtd, expoente=ZIPF_EXPOENTE, semente=42):
+    """
+    Sorteia consultas com distribuição de Zipf: a chave de posto r no ranking
+    de popularidade aparece com probabilidade proporcional a 1 / r^expoente.
+    O ranking é uma amostra embaralhada de até ZIPF_MAX_CHAVES valores.
+
+    Parâmetros:
+    - valores: conjunto de dados.
+    - qtd: quantidade de consultas.
+    - expoente: concentração da distribuição.
+    - semente: semente do sorteio (reprodutível).
+
+    Retorna:
+    - lista de valores a buscar.
+    """
+    if not valores: return []
+    gerador = random.Random(semente)
+    posicoes = gerador.sample(range(len(valores)), min(len(valores), ZIPF_MAX_CHAVES))
+    ranking = [valores[i] for i in posicoes]
+
+    acumulado = []
+    total = 0.0
+    for posto in range(1, len(ranking) + 1):
+        total += 1.0 / posto ** expoente
+        acumulado.append(total)
+    return gerador.choices(ranking, cum_weights=acumulado, k=qtd)
+
+
+def gerar_consultas_quentes(valores, qtd, fracao_quente=0.01, prob_quente=0.9, semente=42):
+    """
+    Sorteia consultas de um conjunto "quente": uma fração pequena das chaves
+    recebe a maior parte do tráfego; o restante é uniforme entre todas.
+
+    Parâmetros:
+    - valores: conjunto de dados.
+    - qtd: quantidade de consultas.
+    - fracao_quente: fração das chaves que formam o conjunto quente.
+    - prob_quente: probabilidade de uma consulta ir para o conjunto quente.
+    - semente: semente do sorteio (reprodutível).
+
+    Retorna:
+    - lista de valores a buscar.
+    """
+    if not valores: return []
+    gerador = random.Random(semente)
+    n = len(valores)
+    quentes = [valores[gerador.randrange(n)] for _ in range(max(1, int(n * fracao_quente)))]
+    return [
+        gerador.choice(quentes) if gerador.random() < prob_quente else valores[gerador.randrange(n)]
+        for _ in range(qtd)
+    ]
+
+
+def gerar_consultas_adversariais(estrutura, qtd):
+    """
+    Gera o pior caso de busca da estrutura, a partir do chaves_pior_caso de cada
+    classe (nós mais profundos nas árvores, maior profundidade de bisseção na
+    ListaOtimizada, fim da varredura na Lista, sondagens mais longas no ConjuntoHash).
+    Se houver menos chaves candidatas que qtd, elas se repetem em ciclo.
+
+    Parâmetros:
+    - estrutura: estrutura já construída que tenha chaves_pior_caso.
+    - qtd: quantidade de consultas.
+
+    Retorna:
+    - lista de valores a buscar (os mais caros primeiro).
+    """
+    pior_caso = getattr(estrutura, "chaves_pior_caso", None)
+    if pior_caso is None:
+        raise TypeError(f"{type(estrutura).__name__} não suporta consultas adversariais (falta chaves_pior_caso)")
+    candidatos = pior_caso(qtd)
+
+    if not candidatos: return []
+    return [candidatos[i % len(candidatos)] for i in range(qtd)]
+
+
+def imprimir_separador(titulo):
+    print(f"\n{'='*60}")
+    print(f"{titulo.center(60)}")
+    print(f"{'='*60}")
+
+
+#  === SNAPSHOTS (estruturas construídas salvas em disco) ===
+
+ASSINATURA_SNAPSHOT = b"ADSN"
+VERSAO_SNAPSHOT = 2 # 2: ListaOtimizada guarda o estado de ordenação
+CABECALHO_SNAPSHOT = struct.Struct("<4sHI") # assinatura, versão, tamanho do JSON de metadados
+# Classes que salvar_snapshot sabe converter em arrays e carregar_snapshot sabe reconstruir
+CLASSES_SNAPSHOT = {classe.__name__: classe for classe in (Arvore, ArvoreAVL, ArvoreCompacta, Lista, ListaOtimizada)}
+
+
+def chave_dataset(caminho, calcular_hash=True):
+    """
+    Identifica o conteúdo de um arquivo de dados para invalidar snapshots.
+    
+    Parâmetros:
+    - caminho: arquivo do conjunto de dados.
+    - calcular_hash: se False, devolve só tamanho e mtime (barato).
+    
+    Retorna:
+    - dicionário com tamanho, mtime_ns e (opcionalmente) o hash blake2b do conteúdo
+    """
+    info = os.stat(caminho)
+    chave = {"tamanho": info.st_size, "mtime_ns": info.st_mtime_ns}
+    if calcular_hash:
+        resumo = hashlib.blake2b(digest_size=16)
+        with open(caminho, "rb") as arq:
+            for bloco in iter(lambda: arq.read(1 << 20), b""):
+                resumo.update(bloco)
+        chave["hash"] = resumo.hexdigest()
+    return chave
+
+
+def _arrays_da_estrutura(estrutura):
+    """Converte a estrutura em arrays int64 compactos (sem pickle de objetos)."""
+    if type(estrutura).__name__ not in CLASSES_SNAPSHOT:
+        raise TypeError(f"Snapshot não suportado para {type(estrutura).__name__} "
+                        f"(suportados: {', '.join(CLASSES_SNAPSHOT)})")
+    if isinstance(estrutura, ArvoreCompacta):
+        return "tabela_nos", [estrutura.chaves, estrutura.esquerda, estrutura.direita]
+    if isinstance(estrutura, Arvore):
+        # percurso pré-ordem iterativo: a ordem permite reconstruir a mesma forma em O(n)
+        pre_ordem = array('q')
+        pilha = [estrutura.raiz] if estrutura.raiz is not None else []
+        while pilha:
+            no = pilha.pop()
+            pre_ordem.append(no.valor)
+            if no.direita is not None:
+                pilha.append(no.direita)
+            if no.esquerda is not None:
+                pilha.append(no.esquerda)
+        return "pre_ordem", [pre_ordem]
+    return "valores", [array('q', estrutura.items)]
+
+
+def _arvore_da_pre_ordem(pre_ordem, classe=Arvore):
+    """
+    Reconstrói a árvore a partir da pré-ordem em O(n), com uma pilha dos nós
+    que ainda podem receber filho direito (sem descer da raiz a cada valor).
+    Na ArvoreAVL as alturas são recalculadas em pré-ordem reversa, que visita
+    todos os descendentes antes do nó.
+    """
+    arvore = classe()
+    if not pre_ordem:
+        return arvore
+    classe_no = classe.classe_no
+    arvore.raiz = classe_no(pre_ordem[0])
+    nos = [arvore.raiz]
+    pilha = [arvore.raiz]
+    for valor in pre_ordem[1:]:
+        no = classe_no(valor)
+        nos.append(no)
+        if valor < pilha[-1].valor:
+            pilha[-1].esquerda = no
+        else:
+            # sobe até o último ancestral menor que o valor: ele é o pai à direita
+            while pilha and pilha[-1].valor < valor:
+                pai = pilha.pop()
+            pai.direita = no
+        pilha.append(no)
+    if isinstance(arvore, ArvoreAVL):
+        for no in reversed(nos):
+            arvore._atualizar_altura(no)
+    return arvore
+
+
+def salvar_snapshot(estrutura, caminho, chave=None):
+    """
+    Salva uma estrutura construída em um arquivo compacto.
+    
+    Parâmetros:
+    - estrutura: uma das classes de CLASSES_SNAPSHOT.
+    - caminho: arquivo de destino.
+    - chave: chave_dataset do conjunto de origem (guardada para validação).
+    """
+    formato, arrays = _arrays_da_estrutura(estrutura)
+    metadados = json.dumps({
+        "classe": type(estrutura).__name__,
+        "formato": formato,
+        "tamanhos": [len(a) for a in arrays],
+        "ordem_bytes": sys.byteorder,
+        "chave": chave,
+        # a ListaOtimizada só usa bisect em inserir/remover se estiver ordenada
+        "ordenada": getattr(estrutura, "ordenada", None),
+    }).encode()
+    
+    os.makedirs(os.path.dirname(caminho) or ".", exist_ok=True)
+    temporario = caminho + ".tmp"
+    with open(temporario, "wb") as arq:
+        arq.write(CABECALHO_SNAPSHOT.pack(ASSINATURA_SNAPSHOT, VERSAO_SNAPSHOT, len(metadados)))
+        arq.write(metadados)
+        for dados in arrays:
+            dados.tofile(arq)
+    os.replace(temporario, caminho)
+
+
+def _ler_metadados(arq, caminho):
+    """Lê cabeçalho e metadados JSON, deixando o arquivo no início dos arrays."""
+    assinatura, versao, tamanho_meta = CABECALHO_SNAPSHOT.unpack(arq.read(CABECALHO_SNAPSHOT.size))
+    if assinatura != ASSINATURA_SNAPSHOT or versao != VERSAO_SNAPSHOT:
+        raise ValueError(f"{caminho}: snapshot inválido ou de outra versão")
+    return json.loads(arq.read(tamanho_meta))
+
+
+def ler_metadados_snapshot(caminho):
+    """
+    Lê só os metadados de um snapshot (classe, formato, tamanhos e chave do
+    conjunto), sem carregar os arrays nem reconstruir a estrutura.
+    
+    Parâmetros:
+    - caminho: arquivo do snapshot.
+    
+    Retorna:
+    - dicionário de metadados
+    """
+    with open(caminho, "rb") as arq:
+        return _ler_metadados(arq, caminho)
+
+
+def carregar_snapshot(caminho):
+    """
+    Carrega uma estrutura salva por salvar_snapshot.
+    
+    Parâmetros:
+    - caminho: arquivo do snapshot.
+    
+    Retorna:
+    - tupla (estrutura, metadados)
+    """
+    with open(caminho, "rb") as arq:
+        metadados = _ler_metadados(arq, caminho)
+        arrays = []
+        for tamanho in metadados["tamanhos"]:
+            dados = array('q')
+            dados.fromfile(arq, tamanho)
+            if metadados["ordem_bytes"] != sys.byteorder:
+                dados.byteswap()
+            arrays.append(dados)
+    
+    classe = CLASSES_SNAPSHOT.get(metadados["classe"])
+    if classe is None:
+        raise ValueError(f"{caminho}: classe desconhecida no snapshot: {metadados['classe']}")
+    if issubclass(classe, ArvoreCompacta):
+        estrutura = classe()
+        estrutura.chaves, estrutura.esquerda, estrutura.direita = arrays
+    elif issubclass(classe, Arvore):
+        estrutura = _arvore_da_pre_ordem(arrays[0], classe)
+    else:
+        estrutura = classe()
+        estrutura.items = arrays[0].tolist()
+        if metadados["ordenada"] is not None:
+            estrutura.ordenada = metadados["ordenada"]
+    return estrutura, metadados
+
+
+def _caminho_fonte(arquivo):
+    """Caminho do arquivo de dados (txt, ou o .bin quando só ele existe)."""
+    pasta_do_script = os.path.dirname(os.path.abspath(__file__))
+    caminho = os.path.join(pasta_do_script, arquivo)
+    if not os.path.exists(caminho) and os.path.exists(caminho_binario(caminho)):
+        return caminho_binario(caminho)
+    return caminho
+
+
+def _construir_padrao(classe, valores):
+    estrutura = classe()
+    estrutura.inserirVarios(valores)
+    if hasattr(estrutura, "ordenar"):
+        estrutura.ordenar()
+    return estrutura
+
+
+def obter_estrutura(classe, arquivo, construir=None):
+    """
+    Devolve a estrutura construída a partir do arquivo, reaproveitando o snapshot
+    em disco quando ele corresponde ao conjunto atual. A chave é conferida só pelos
+    metadados (os arrays são lidos apenas se ela bate). Tamanho e mtime iguais
+    bastam; se só o mtime mudou, o hash do conteúdo decide. Snapshots
+    desatualizados são reconstruídos e salvos de novo automaticamente.
+    
+    Parâmetros:
+    - classe: uma das classes de CLASSES_SNAPSHOT.
+    - arquivo: nome do arquivo de dados (como em ler_arquivo).
+    - construir: função valores -> estrutura (padrão: inserirVarios + ordenar se houver).
+    
+    Retorna:
+    - tupla (estrutura, True se veio do snapshot)
+    """
+    fonte = _caminho_fonte(arquivo)
+    pasta = os.path.join(os.path.dirname(os.path.abspath(__file__)), PASTA_SNAPSHOTS)
+    caminho_snapshot = os.path.join(pasta, f"{os.path.splitext(arquivo)[0]}.{classe.__name__}.snap")
+    
+    if os.path.exists(fonte) and os.path.exists(caminho_snapshot):
+        try:
+            salva = ler_metadados_snapshot(caminho_snapshot).get("chave") or {}
+            atual = chave_dataset(fonte, calcular_hash=False)
+            if salva.get("tamanho") == atual["tamanho"]:
+                if salva.get("mtime_ns") == atual["mtime_ns"]:
+                    return carregar_snapshot(caminho_snapshot)[0], True
+                chave = chave_dataset(fonte)
+                if salva.get("hash") == chave["hash"]:
+                    # mesmo conteúdo com outro mtime: atualiza a chave para não recalcular o hash de novo
+                    estrutura, _ = carregar_snapshot(caminho_snapshot)
+                    salvar_snapshot(estrutura, caminho_snapshot, chave)
+                    return estrutura, True
+        except (OSError, ValueError, KeyError) as e:
+            print(f"\nSnapshot {caminho_snapshot} ignorado: {e}")
+    
+    valores = cache_datasets.ler(arquivo)
+    if not valores:
+        return classe(), False
+    estrutura = construir(valores) if construir else _construir_padrao(classe, valores)
+    try:
+        salvar_snapshot(estrutura, caminho_snapshot, chave_dataset(fonte))
+    except (OSError, TypeError, OverflowError) as e:
+        print(f"\nNão foi possível salvar o snapshot {caminho_snapshot}: {e}")
+    return estrutura, False
+
+
+#  === BENCHMARK DECLARATIVO ===
+def estruturas_benchmark():
+    """
+    Estruturas medidas pelo benchmark, respeitando as opções EXECUTAR_*.
+    Para incluir uma estrutura nova, basta acrescentar uma entrada aqui.
 
-        if ponto_virada_inexistentes is None and tempo_arvore_inex < tempo_lista_inex:
-            ponto_virada_inexistentes = n
-        if ponto_virada_existentes is None and tempo_arvore_ex < tempo_lista_ex:
-            ponto_virada_existentes = n
-  
-    
-        quantidade += 10 
-    
-    if ponto_virada_inexistentes:
-        print(f"[.] Buscas INEXISTENTES : Árvore supera Lista em N = {ponto_virada_inexistentes}")
-    else:
-        print(f"[x] Buscas INEXISTENTES : Ponto de virada não encontrado neste dataset.")
-        
-    if ponto_virada_existentes:
-        print(f"[.] Buscas EXISTENTES   : Árvore supera Lista em N = {ponto_virada_existentes}")
-    else:
-        print(f"[x] Buscas EXISTENTES   : Ponto de virada não encontrado neste dataset.")
+    Retorna:
+    - dicionário nome -> função que recebe os valores e devolve a estrutura pronta para buscas.
+    """
+    estruturas = {
+        "ARVORE": lambda valores: _construir_padrao(Arvore, valores),
+        "ARVORE LOTE": Arvore.from_iterable,
+    }
+    if EXECUTAR_ARVORE_AVL:
+        estruturas["ARVORE AVL"] = lambda valores: _construir_padrao(ArvoreAVL, valores)
+    if EXECUTAR_ARVORE_COMPACTA:
+        estruturas["ARVORE COMPACTA"] = lambda valores: _construir_padrao(ArvoreCompacta, valores)
+    estruturas["ARVORE B (64)"] = lambda valores: _construir_padrao(lambda: ArvoreB(64), valores)
+    if EXECUTAR_CONJUNTO_HASH:
+        estruturas["CONJUNTO HASH"] = lambda valores: _construir_padrao(ConjuntoHash, valores)
+    estruturas["LISTA"] = lambda valores: _construir_padrao(Lista, valores)
+    estruturas["LISTA OTIMIZADA"] = lambda valores: _construir_padrao(ListaOtimizada, valores)
+    # merge sort recursivo: as fatias temporárias de cada nível aparecem no pico de memória
+    estruturas["LISTA OTIM. RECURSIVA"] = lambda valores: _construir_lista_otimizada(valores, "merge_recursivo")
+    return estruturas
+
+
+def _construir_lista_otimizada(valores, algoritmo):
+    lista = _lista_nao_ordenada(valores)
+    lista.ordenar(algoritmo)
+    return lista
+
+
+def _lista_nao_ordenada(valores):
+    lista = ListaOtimizada()
+    lista.inserirVarios(valores)
+    return lista
+
+
+# Cenários de consulta: nome -> função (valores, qtd) -> consultas
+CENARIOS_BUSCA = {
+    "existentes": lambda valores, qtd: gerar_valores_busca(valores, qtd),
+    "inexistentes": lambda valores, qtd: gerar_valores_busca(valores, qtd, existente=False),
+    "uniforme": gerar_consultas_uniformes,
+    "zipf": gerar_consultas_zipf,
+    "quentes": gerar_consultas_quentes,
+}
+
+
+def _buscar_um_a_um(estrutura, consultas):
+    buscar = estrutura.buscar
+    for n in consultas:
+        resposta = buscar(n)
+
+
+# Operações de busca: nome -> função (estrutura, consultas); "construcao" é medida à parte
+OPERACOES_BUSCA = {
+    "buscar": _buscar_um_a_um,
+    "buscar_varios": lambda estrutura, consultas: estrutura.buscar_varios(consultas),
+}
+
+
+def medir(funcao, repeticoes=REPETICOES_BENCHMARK, aquecimento=AQUECIMENTO_BENCHMARK, preparar=None):
+    """
+    Executa a função várias vezes e resume os tempos.
+
+    Parâmetros:
+    - funcao: função a ser medida (sem parâmetros, ou recebendo o retorno de preparar).
+    - repeticoes: execuções medidas.
+    - aquecimento: execuções descartadas antes das medidas.
+    - preparar: função sem parâmetros chamada antes de cada execução, fora da medida
+      (ex.: construir de novo uma estrutura que a função modifica).
+
+    Retorna:
+    - tupla (dicionário com tempos, min, mediana e desvio em segundos; retorno da última execução)
+    """
+    executar = funcao if preparar is None else (lambda: funcao(entrada))
+    for _ in range(aquecimento):
+        entrada = preparar() if preparar else None
+        retorno = executar()
+    tempos = []
+    for _ in range(max(1, repeticoes)):
+        entrada = preparar() if preparar else None
+        inicio = time.perf_counter()
+        retorno = executar()
+        tempos.append(time.perf_counter() - inicio)
+    estatisticas = {
+        "tempos": tempos,
+        "min": min(tempos),
+        "mediana": statistics.median(tempos),
+        "desvio": statistics.stdev(tempos) if len(tempos) > 1 else 0.0,
+    }
+    return estatisticas, retorno
+
+
+def medir_memoria(funcao):
+    """
+    Executa a função duas vezes, fora das medidas de tempo: a primeira sem
+    rastreamento, para o delta de RSS (as tabelas do tracemalloc também ocupam
+    memória do processo), e a segunda com o tracemalloc ligado, para pico e
+    memória retida.
+
+    Parâmetros:
+    - funcao: função sem parâmetros (ex.: a construção de uma estrutura).
+
+    Retorna:
+    - tupla (dicionário com pico e memória retida pelo tracemalloc e delta de RSS, em bytes;
+      retorno da função)
+    """
+    gc.collect()
+    rss_antes = memoria_rss()
+    retorno = funcao()
+    # o RSS só cresce quando o alocador pede memória nova ao sistema (reuso de memória liberada não aparece)
+    delta_rss = memoria_rss() - rss_antes
+    del retorno
+    gc.collect()
+    tracemalloc.start()
+    try:
+        retorno = funcao()
+        retida, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"pico_tracemalloc": pico, "retida": retida, "delta_rss": delta_rss}, retorno
+
+
+def executar_benchmark(estruturas=None, conjuntos=CONJUNTOS_BENCHMARK, operacoes=OPERACOES_BENCHMARK,
+                       cenarios=CENARIOS_BENCHMARK, repeticoes=REPETICOES_BENCHMARK,
+                       aquecimento=AQUECIMENTO_BENCHMARK, qtd_buscas=QTD_BUSCAS_BENCHMARK,
+                       medir_memoria_construcao=MEDIR_MEMORIA_BENCHMARK):
+    """
+    Mede a matriz estruturas x conjuntos x operações x cenários.
+    A construção é medida uma vez por estrutura e conjunto (cada repetição constrói
+    do zero); as buscas usam a última estrutura construída. Com medir_memoria_construcao,
+    duas construções extras (antes das de tempo) registram delta de RSS, pico do
+    tracemalloc e bytes retidos por valor do conjunto (sem os int das chaves, que são
+    do conjunto e não da estrutura).
+
+    Parâmetros:
+    - estruturas: dicionário nome -> construtor (padrão: estruturas_benchmark()).
+    - conjuntos: pares (nome, arquivo).
+    - operacoes: "construcao" e/ou chaves de OPERACOES_BUSCA.
+    - cenarios: chaves de CENARIOS_BUSCA.
+    - repeticoes, aquecimento: como em medir.
+    - qtd_buscas: consultas por cenário.
+    - medir_memoria_construcao: inclui as medidas de memória nas linhas de construção.
+
+    Retorna:
+    - tupla (lista de resultados, dicionário (estrutura, conjunto) -> estrutura construída)
+    """
+    estruturas = estruturas if estruturas is not None else estruturas_benchmark()
+    resultados = []
+    construidas = {}
+
+    def registrar(nome_estrutura, nome_conjunto, operacao, cenario, n, ops, estatisticas, memoria=None):
+        resultados.append({
+            "estrutura": nome_estrutura, "conjunto": nome_conjunto, "operacao": operacao,
+            "cenario": cenario, "n": n, "ops": ops, "repeticoes": len(estatisticas["tempos"]),
+            "min": estatisticas["min"], "mediana": estatisticas["mediana"], "desvio": estatisticas["desvio"],
+            "ns_por_op": estatisticas["mediana"] / ops * 1e9 if ops else 0.0,
+            "tempos": estatisticas["tempos"],  # cada repetição (usado na comparação com as baselines)
+            "pico_tracemalloc": memoria["pico_tracemalloc"] if memoria else None,
+            "delta_rss": memoria["delta_rss"] if memoria else None,
+            "bytes_por_chave": memoria["retida"] / n if memoria and n else None,
+        })
+
+    for nome_conjunto, arquivo in conjuntos:
+        valores = cache_datasets.ler(arquivo)
+        if not valores:
+            continue
+        consultas = {cenario: CENARIOS_BUSCA[cenario](valores, qtd_buscas) for cenario in cenarios}
+
+        for nome_estrutura, construir in estruturas.items():
+            if "construcao" in operacoes:
+                memoria = None
+                if medir_memoria_construcao:
+                    # com os valores já em lista, os int das chaves existem antes do rastreamento
+                    # e ficam fora da memória retida qualquer que seja o carregador do conjunto
+                    # (uma memoryview criaria os int dentro da construção)
+                    valores_em_lista = valores if isinstance(valores, list) else list(valores)
+                    memoria, _ = medir_memoria(lambda: construir(valores_em_lista))
+                    del valores_em_lista
+                estatisticas, estrutura = medir(lambda: construir(valores), repeticoes, aquecimento)
+                registrar(nome_estrutura, nome_conjunto, "construcao", "-", len(valores), len(valores), estatisticas, memoria)
+            else:
+                estrutura = construir(valores)
+            construidas[nome_estrutura, nome_conjunto] = estrutura
+
+            for operacao in operacoes:
+                if operacao == "construcao":
+                    continue
+                executar = OPERACOES_BUSCA[operacao]
+                for cenario, lote in consultas.items():
+                    estatisticas, _ = medir(lambda: executar(estrutura, lote), repeticoes, aquecimento)
+                    registrar(nome_estrutura, nome_conjunto, operacao, cenario, len(valores), len(lote), estatisticas)
+
+    return resultados, construidas
+
+
+def medir_contadores(conjuntos=CONJUNTOS_BENCHMARK, cenarios=CENARIOS_BENCHMARK, qtd_buscas=QTD_BUSCAS_BENCHMARK):
+    """
+    Repete construção e buscas com as estruturas instrumentadas para explicar os
+    tempos: comparações e nós visitados da Arvore, comparações/movimentos dos
+    merge sorts e sondas da busca binária, além da forma da Arvore. Antes de
+    contar, verificar_instrumentadas confere que elas equivalem às originais.
+
+    Parâmetros:
+    - conjuntos: pares (nome, arquivo).
+    - cenarios: chaves de CENARIOS_BUSCA.
+    - qtd_buscas: consultas por cenário.
+
+    Retorna:
+    - dicionário com "contadores" (uma linha por conjunto/estrutura/operação/cenário,
+      com médias por chamada) e "forma_arvore" (conjunto -> estatisticas_forma()).
+    """
+    linhas = []
+    formas = {}
+    for nome_conjunto, arquivo in conjuntos:
+        valores = cache_datasets.ler(arquivo)
+        if not valores:
+            continue
+        n = len(valores)
+        todas_consultas = [v for cenario in cenarios for v in CENARIOS_BUSCA[cenario](valores, qtd_buscas)]
+        verificar_instrumentadas(valores, todas_consultas)
+
+        arvore = ArvoreInstrumentada()
+        arvore.inserirVarios(valores)
+        formas[nome_conjunto] = arvore.estatisticas_forma()
+        inserir = arvore.contadores["inserir"]
+        linhas.append({"conjunto": nome_conjunto, "estrutura": "ARVORE", "operacao": "inserir", "cenario": "-",
+                       "comparacoes_por_op": inserir["comparacoes"] / n, "nos_por_op": inserir["nos_visitados"] / n})
+
+        for algoritmo in ("merge", "merge_recursivo"):
+            lista = ListaOtimizadaInstrumentada()
+            lista.inserirVarios(valores)
+            lista.ordenar(algoritmo)
+            ordenacao = lista.contadores["ordenacao"]
+            linhas.append({"conjunto": nome_conjunto, "estrutura": "LISTA OTIMIZADA", "operacao": f"ordenar ({algoritmo})",
+                           "cenario": "-", "comparacoes_por_op": ordenacao["comparacoes"] / n,
+                           "movimentos_por_op": ordenacao["movimentos"] / n})
+
+        for cenario in cenarios:
+            consultas = CENARIOS_BUSCA[cenario](valores, qtd_buscas)
+            if not consultas:
+                continue
+            arvore.zerar_contadores()
+            lista.zerar_contadores()
+            for v in consultas:
+                arvore.buscar(v)
+                lista.buscar(v)
+            buscar = arvore.contadores["buscar"]
+            binaria = lista.contadores["busca_binaria"]
+            linhas.append({"conjunto": nome_conjunto, "estrutura": "ARVORE", "operacao": "buscar", "cenario": cenario,
+                           "comparacoes_por_op": buscar["comparacoes"] / len(consultas),
+                           "nos_por_op": buscar["nos_visitados"] / len(consultas)})
+            linhas.append({"conjunto": nome_conjunto, "estrutura": "LISTA OTIMIZADA", "operacao": "busca_binaria", "cenario": cenario,
+                           "comparacoes_por_op": binaria["comparacoes"] / len(consultas),
+                           "sondas_por_op": binaria["sondas"] / len(consultas)})
+    return {"contadores": linhas, "forma_arvore": formas}
+
+
+def imprimir_contadores(perfil):
+    """Imprime o resultado de medir_contadores."""
+    for linha in perfil["contadores"]:
+        extras = "".join(
+            f" | {rotulo} {linha[campo]:.1f}"
+            for campo, rotulo in (("nos_por_op", "nos/op"), ("movimentos_por_op", "movimentos/elemento"), ("sondas_por_op", "sondas/op"))
+            if campo in linha
+        )
+        print(f"{linha['estrutura']:<16} {linha['conjunto']:<8} {linha['operacao']:<26} {linha['cenario']:<12} "
+              f"comparacoes/op {linha['comparacoes_por_op']:.1f}{extras}")
+    for nome_conjunto, forma in perfil["forma_arvore"].items():
+        histograma = " ".join(f"{p}:{q}" for p, q in forma["histograma"].items())
+        print(f"forma ARVORE {nome_conjunto:<8} altura {forma['altura']} | profundidade media {forma['profundidade_media']:.2f} "
+              f"(log2 n = {math.log2(max(2, sum(forma['histograma'].values()))):.1f})")
+        print(f"    histograma (profundidade:nos) {histograma}")
+
+
+def imprimir_benchmark(resultados):
+    """Imprime os resultados do benchmark, uma linha por célula da matriz."""
+    for r in resultados:
+        memoria = ""
+        if r.get("pico_tracemalloc") is not None:
+            memoria = (f" | pico {r['pico_tracemalloc'] / 2**20:.2f} MiB | RSS +{r['delta_rss'] / 2**20:.2f} MiB"
+                       f" | {r['bytes_por_chave']:.1f} B/chave")
+        print(f"{r['estrutura']:<21} {r['conjunto']:<8} {r['operacao']:<13} {r['cenario']:<12} "
+              f"min {r['min']:.6f} | mediana {r['mediana']:.6f} | desvio {r['desvio']:.6f} | {r['ns_por_op']:>12,.0f} ns/op{memoria}")
+
+
+def salvar_benchmark(resultados, pasta=None, nome="benchmark", extras=None):
+    """
+    Grava os resultados em JSON (com a configuração da execução) e em CSV.
+
+    Parâmetros:
+    - resultados: lista devolvida por executar_benchmark.
+    - pasta: destino (padrão: PASTA_RESULTADOS ao lado do script).
+    - nome: prefixo dos arquivos; recebe a data/hora da execução.
+    - extras: dados adicionais gravados só no JSON (ex.: resultado de medir_contadores).
+
+    Retorna:
+    - tupla (caminho do JSON, caminho do CSV)
+    """
+    pasta = pasta or os.path.join(os.path.dirname(os.path.abspath(__file__)), PASTA_RESULTADOS)
+    os.makedirs(pasta, exist_ok=True)
+    base = os.path.join(pasta, f"{nome}_{time.strftime('%Y%m%d_%H%M%S')}")
+
+    with open(base + ".json", "w") as f:
+        json.dump({
+            "data": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": sys.version.split()[0],
+            "plataforma": sys.platform,
+            "cpus": os.cpu_count(),
+            "repeticoes": REPETICOES_BENCHMARK,
+            "aquecimento": AQUECIMENTO_BENCHMARK,
+            "resultados": resultados,
+            **(extras or {}),
+        }, f, indent=2)
+
+    colunas = ("estrutura", "conjunto", "operacao", "cenario", "n", "ops", "repeticoes", "min", "mediana", "desvio", "ns_por_op",
+               "pico_tracemalloc", "delta_rss", "bytes_por_chave")
+    with open(base + ".csv", "w", newline="") as f:
+        escritor = csv.DictWriter(f, fieldnames=colunas, extrasaction="ignore")
+        escritor.writeheader()
+        escritor.writerows(resultados)
+    return base + ".json", base + ".csv"
+
+
+#  === FUNÇÕES PARA TESTES DO PONTO DE VIRADA ===
+# Valores críticos da distribuição t de Student (95%, bicaudal) para 1..30 graus de liberdade
+T_CRITICO_95 = (12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+                2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+                2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042)
+
+
+def t_critico_95(graus):
+    """
+    Valor crítico t de Student (95%, bicaudal). Graus fracionários (Welch) são
+    arredondados para baixo, o lado conservador; acima da tabela usa a expansão
+    de Cornish-Fisher em torno da normal (erro < 0.001 a partir de 30 graus).
+
+    Parâmetros:
+    - graus: graus de liberdade (>= 1).
+
+    Retorna:
+    - valor crítico t.
+    """
+    graus = max(1, int(graus))
+    if graus <= len(T_CRITICO_95):
+        return T_CRITICO_95[graus - 1]
+    z = statistics.NormalDist().inv_cdf(0.975)
+    return z + (z ** 3 + z) / (4 * graus) + (5 * z ** 5 + 16 * z ** 3 + 3 * z) / (96 * graus ** 2)
+
+
+def _decidir(diferencas):
+    """
+    Teste t pareado sobre as diferenças (candidata - referência) de cada repetição.
+
+    Retorna:
+    - -1 se a candidata é mais rápida com 95% de confiança, 1 se é mais lenta, 0 se indefinido.
+    """
+    if len(diferencas) < 2:
+        return 0
+    graus = len(diferencas) - 1
+    t = t_critico_95(graus)
+    media = statistics.fmean(diferencas)
+    margem = t * statistics.stdev(diferencas) / math.sqrt(len(diferencas))
+    if media + margem < 0:
+        return -1
+    if media - margem > 0:
+        return 1
+    return 0
+
+
+def _comparar(medir_candidata, medir_referencia):
+    """
+    Mede as duas alternativas intercaladas (a ordem alterna a cada repetição) até
+    o teste ser conclusivo ou atingir MAX_REPETICOES_VIRADA.
+
+    Parâmetros:
+    - medir_candidata, medir_referencia: funções sem parâmetros que devolvem um tempo em segundos.
+
+    Retorna:
+    - tupla (decisão de _decidir, mediana da candidata, mediana da referência)
+    """
+    tempos_candidata, tempos_referencia = [], []
+    while True:
+        for _ in range(REPETICOES_VIRADA):
+            if len(tempos_candidata) % 2:
+                tempos_referencia.append(medir_referencia())
+                tempos_candidata.append(medir_candidata())
+            else:
+                tempos_candidata.append(medir_candidata())
+                tempos_referencia.append(medir_referencia())
+        decisao = _decidir([c - r for c, r in zip(tempos_candidata, tempos_referencia)])
+        if decisao or len(tempos_candidata) >= MAX_REPETICOES_VIRADA:
+            return decisao, statistics.median(tempos_candidata), statistics.median(tempos_referencia)
+
+
+def _estimar_virada(decidir, n_maximo, n_inicial=N_INICIAL_VIRADA, tolerancia=TOLERANCIA_VIRADA):
+    """
+    Busca exponencial (n, 2n, 4n...) até a candidata vencer com confiança e depois
+    duas buscas binárias: o menor N em que a candidata vence com confiança e o
+    maior N em que a referência ainda vence com confiança. Entre os dois as
+    medidas não distinguem as alternativas: é a barra de erro da virada.
+    Supõe que, depois da virada, a candidata continua vencendo.
+
+    Parâmetros:
+    - decidir: função n -> -1 (candidata vence), 1 (referência vence) ou 0 (indefinido).
+    - n_maximo: maior tamanho disponível.
+    - n_inicial: primeiro tamanho testado.
+    - tolerancia: largura relativa em que as buscas binárias param.
+
+    Nenhuma sonda fica abaixo de n_inicial: se a candidata já vence ali, o menor
+    N em que ela vence é o próprio n_inicial.
+
+    Retorna:
+    - tupla (maior N em que a referência vence, menor N em que a candidata vence),
+      ou None se a candidata não vencer até n_maximo. O primeiro elemento é None
+      se a referência não venceu em nenhum N testado (ver _formatar_virada).
+    """
+    decisoes = {}
+    def decisao(n):
+        if n not in decisoes:
+            decisoes[n] = decidir(n)
+        return decisoes[n]
+
+    anterior = n = min(n_inicial, n_maximo)
+    while decisao(n) != -1:
+        if n >= n_maximo:
+            return None
+        anterior, n = n, min(2 * n, n_maximo)
+
+    # menor N em que a candidata vence, entre a última sonda sem vitória e a primeira com vitória
+    abaixo, acima = anterior, n
+    while acima - abaixo > max(1, int(tolerancia * acima)):
+        meio = (abaixo + acima) // 2
+        if decisao(meio) == -1:
+            acima = meio
+        else:
+            abaixo = meio
+
+    # maior N em que a referência ainda vence, partindo da maior sonda em que ela venceu
+    vitorias_referencia = [m for m, d in decisoes.items() if d == 1 and m < acima]
+    if not vitorias_referencia:
+        return None, acima
+    perde, limite = max(vitorias_referencia), acima
+    while limite - perde > max(1, int(tolerancia * limite)):
+        meio = (perde + limite) // 2
+        if decisao(meio) == 1:
+            perde = meio
+        else:
+            limite = meio
+    return perde, acima
+
+
+class _EstruturasPorPrefixo:
+    """
+    Mantém estruturas com exatamente os n primeiros valores distintos do conjunto.
+    Entre uma sonda e outra elas crescem (inserir) ou encolhem (remover, do último
+    inserido para o primeiro) em vez de serem reconstruídas. Na árvore o último
+    valor inserido é sempre uma folha e na lista fica no fim, então encolher
+    devolve a mesma forma de quem só cresceu até n. O ConjuntoHash não diminui a
+    tabela ao remover (o fator de carga dependeria da ordem das sondas), então é
+    reconstruído inserindo o prefixo, o mesmo caminho de quem só cresceu.
+    """
+    RECONSTRUIR_AO_ENCOLHER = (ConjuntoHash,)
+
+    def __init__(self, chaves, classes):
+        self.chaves = chaves
+        self.classes = classes
+        self.estruturas = {nome: classe() for nome, classe in classes.items()}
+        self.n = 0
+
+    def __getitem__(self, nome):
+        return self.estruturas[nome]
+
+    def ajustar(self, n):
+        chaves = self.chaves
+        for nome, estrutura in self.estruturas.items():
+            if n > self.n:
+                for valor in chaves[self.n:n]:
+                    estrutura.inserir(valor)
+            elif isinstance(estrutura, self.RECONSTRUIR_AO_ENCOLHER):
+                estrutura = self.estruturas[nome] = self.classes[nome]()
+                for valor in chaves[:n]:
+                    estrutura.inserir(valor)
+            else:
+                for valor in reversed(chaves[n:self.n]):
+                    estrutura.remover(valor)
+        self.n = n
+
+
+def _consultas_virada(prefixo, qtd):
+    """Consultas existentes (espalhadas pelo prefixo, mesmo se qtd > n) e inexistentes."""
+    n = len(prefixo)
+    return {
+        "inexistentes": gerar_valores_busca(prefixo, qtd, existente=False),
+        "existentes": [prefixo[(i * n) // qtd] for i in range(qtd)],
+    }
+
+
+def _tempo_buscas(estrutura, consultas):
+    inicio = time.perf_counter()
+    for v in consultas: estrutura.buscar(v)
+    return time.perf_counter() - inicio
+
+
+def _formatar_virada(intervalo, n_inicial=N_INICIAL_VIRADA):
+    perde, vence = intervalo
+    if perde is None and vence <= n_inicial:
+        return f"N <= {vence} (vence desde o primeiro N testado)"
+    if perde is None:
+        # a referência nunca venceu com confiança: a região abaixo de vence ficou sem decisão
+        return f"N <= {vence} (inconclusivo de {n_inicial} a {vence}: a referência não venceu em nenhum N testado)"
+    return f"N = {(perde + vence) / 2:.0f} ± {(vence - perde) / 2:.0f} (perde em {perde}, vence em {vence})"
+
+
+def encontrar_ponto_virada_busca():
+    """
+    Descobre a partir de qual N a Árvore supera a Lista (e o Conjunto Hash supera
+    a Árvore) na busca de dados existentes e não existentes (considerando apenas tempo de busca).
+    Cada tamanho testado é medido várias vezes com teste de confiança; as
+    estruturas crescem/encolhem entre os tamanhos em vez de serem reconstruídas.
+
+    Retorna:
+    - dicionário (candidata, referência, cenário) -> intervalo (abaixo, acima) da virada
+      (abaixo None se a candidata vence desde o primeiro N testado), ou None.
+    """
+    dados = cache_datasets.ler(ARQUIVO_PEQUENO)
+    chaves = list(dict.fromkeys(dados)) # distintos, na ordem do arquivo
+    if not chaves:
+        return {}  # conjunto ausente (ler_arquivo já avisou)
+    estruturas = _EstruturasPorPrefixo(chaves, {"arvore": Arvore, "lista": Lista, "hash": ConjuntoHash})
+    pontos = {}
+    
+    print("--> Busca exponencial + binária com repetições...", end="", flush=True)
+    # o Hash é comparado ao contrário: com N pequeno a Árvore vence, com N grande o Hash
+    for candidata, referencia in (("arvore", "lista"), ("hash", "arvore")):
+        for cenario in ("inexistentes", "existentes"):
+            def decidir(n):
+                estruturas.ajustar(n)
+                consultas = _consultas_virada(chaves[:n], QTD_BUSCAS_VIRADA)[cenario]
+                decisao, _, _ = _comparar(lambda: _tempo_buscas(estruturas[candidata], consultas),
+                                          lambda: _tempo_buscas(estruturas[referencia], consultas))
+                return decisao
+            pontos[candidata, referencia, cenario] = _estimar_virada(decidir, len(chaves))
+    print(" Concluído!")
+    
+    for candidata, referencia, texto, sem_virada in (
+        ("arvore", "lista", "Árvore supera Lista", "Ponto de virada não encontrado neste dataset."),
+        ("hash", "arvore", "Hash supera Árvore", "Árvore mais rápida que o Hash em todos os N testados."),
+    ):
+        for cenario in ("inexistentes", "existentes"):
+            rotulo = f"Buscas {cenario.upper():<12}:"
+            intervalo = pontos[candidata, referencia, cenario]
+            if intervalo:
+                print(f"[.] {rotulo} {texto} em {_formatar_virada(intervalo)}")
+            else:
+                print(f"[x] {rotulo} {sem_virada}")
     print("-" * 60)
+    return pontos
             
 def encontrar_ponto_virada_total(tamanho):
-    # ... configurações iniciais ...
+    """
+    Descobre a partir de qual N a Árvore supera a Lista (e o Conjunto Hash supera
+    a Árvore) somando construção + busca. Cada repetição constrói a estrutura do zero (a
+    construção faz parte da medida), mas só nos tamanhos sondados pela busca
+    exponencial + binária.
+
+    Parâmetros:
+    - tamanho: 'pequeno' (N/2 buscas por tamanho) ou 'medio' (1000 buscas por tamanho).
+
+    Retorna:
+    - dicionário (candidata, referência, cenário) -> intervalo (abaixo, acima) da virada
+      (abaixo None se a candidata vence desde o primeiro N testado), ou None.
+    """
     if tamanho == "pequeno":
-        dados = ler_arquivo("conjunto_pequeno.txt")
-        quantidade = 100
+        dados = cache_datasets.ler(ARQUIVO_PEQUENO)
     elif tamanho == "medio":
-        dados = ler_arquivo("conjunto_medio.txt")
-        quantidade = 500000
-    
-    ponto_virada_inexistentes = None
-    ponto_virada_existentes = None
-    
-    stats_inexistentes = {}
-    stats_existentes = {}
-    
-    print(f"--> Iniciando Testes Incrementais ({tamanho.upper()})")
-    while True:
-        dados_teste = gerar_valores_busca(dados, quantidade)
-        n = len(dados_teste)
-        
-        if n <= 0 or (ponto_virada_inexistentes and ponto_virada_existentes):
-            break
-            
-        # ... instanciação e construção ...
-        lista_ponto_total = Lista()
-        arvore_ponto = Arvore()
-        
-        inicio_build_lista = time.perf_counter()
-        lista_ponto_total.inserirVarios(dados_teste)
-        tempo_build_lista = time.perf_counter() - inicio_build_lista
-        
-        inicio_build_arvore = time.perf_counter()
-        for valor in dados_teste:
-            arvore_ponto.inserir(valor)
-        tempo_build_arvore = time.perf_counter() - inicio_build_arvore
-        
-        # ... preparação das buscas ...
-        if tamanho == 'pequeno':
-            qtd_busca = quantidade // 2
-        elif tamanho == 'medio':
-            qtd_busca = 1000
-
-        busca_inexistentes = gerar_valores_busca(dados_teste, qtd_busca, existente=False)
-        busca_existentes = gerar_valores_busca(dados_teste, qtd_busca)
-        
-        # ... execução das buscas ...
-        inicio_lista_inex = time.perf_counter()
-        for v in busca_inexistentes: lista_ponto_total.buscar(v)
-        tempo_lista_inex = time.perf_counter() - inicio_lista_inex
-        
-        inicio_arvore_inex = time.perf_counter()
-        for v in busca_inexistentes: arvore_ponto.buscar(v)
-        tempo_arvore_inex = time.perf_counter() - inicio_arvore_inex
-        
-        inicio_lista_ex = time.perf_counter()
-        for v in busca_existentes: lista_ponto_total.buscar(v)
-        tempo_lista_ex = time.perf_counter() - inicio_lista_ex
-
-        inicio_arvore_ex = time.perf_counter()
-        for v in busca_existentes: arvore_ponto.buscar(v)
-        tempo_arvore_ex = time.perf_counter() - inicio_arvore_ex
-        
-        # Totais
-        tempo_total_lista_inex = tempo_build_lista + tempo_lista_inex
-        tempo_total_arvore_inex = tempo_build_arvore + tempo_arvore_inex
-        tempo_total_lista_ex = tempo_build_lista + tempo_lista_ex
-        tempo_total_arvore_ex = tempo_build_arvore + tempo_arvore_ex
-
-        # --- DETECÇÃO ---
-
-        # Para INEXISTENTES
-        if ponto_virada_inexistentes is None and tempo_total_arvore_inex < tempo_total_lista_inex:
-            ponto_virada_inexistentes = n
-            stats_inexistentes = {'arv': tempo_total_arvore_inex, 'lst': tempo_total_lista_inex}
-            # O \t dá um tab para indentar, fica bonito
-            print(f"[!] Virada (INEXISTENTES) detectada em N = {n}")
-            
-        # Para EXISTENTES
-        if ponto_virada_existentes is None and tempo_total_arvore_ex < tempo_total_lista_ex:
-            ponto_virada_existentes = n
-            stats_existentes = {'arv': tempo_total_arvore_ex, 'lst': tempo_total_lista_ex}
-            print(f"[!] Virada (EXISTENTES)   detectada em N = {n}")
-        
-        # Incremento
-        if tamanho == 'pequeno':
-            quantidade += 10
-        elif tamanho == 'medio':
-            quantidade += 1000
+        dados = cache_datasets.ler(ARQUIVO_MEDIO)
+    chaves = list(dict.fromkeys(dados))
+    if not chaves:
+        return {}  # conjunto ausente (ler_arquivo já avisou)
+    
+    def medir_total(classe, prefixo, consultas):
+        def medir():
+            inicio = time.perf_counter()
+            estrutura = classe()
+            estrutura.inserirVarios(prefixo)
+            for v in consultas: estrutura.buscar(v)
+            return time.perf_counter() - inicio
+        return medir
+    
+    pontos = {}
+    tempos_na_virada = {}
+    
+    print(f"--> Iniciando busca exponencial + binária ({tamanho.upper()})")
+    # o Hash é comparado ao contrário: com N pequeno a Árvore vence, com N grande o Hash
+    for candidata, referencia in ((Arvore, Lista), (ConjuntoHash, Arvore)):
+        for cenario in ("inexistentes", "existentes"):
+            chave = (candidata.__name__, referencia.__name__, cenario)
+            medidas = {}
+            def decidir(n):
+                prefixo = chaves[:n]
+                qtd_busca = max(1, n // 2) if tamanho == "pequeno" else 1000
+                consultas = _consultas_virada(prefixo, qtd_busca)[cenario]
+                decisao, t_cand, t_ref = _comparar(medir_total(candidata, prefixo, consultas),
+                                                   medir_total(referencia, prefixo, consultas))
+                medidas[n] = (t_cand, t_ref)
+                return decisao
+            pontos[chave] = _estimar_virada(decidir, len(chaves))
+            if pontos[chave]:
+                tempos_na_virada[chave] = medidas[pontos[chave][1]]
+                if referencia is Lista:
+                    print(f"[!] Virada ({cenario.upper()}) detectada em {_formatar_virada(pontos[chave])}")
 
     # --- RELATÓRIO FINAL ---
 
     print(f"\n{'RELATÓRIO FINAL DE PERFORMANCE':^60}\n") # Centraliza o texto
     print("-"*60)
 
-    
-    if ponto_virada_inexistentes:
-        t_arv = stats_inexistentes['arv']
-        t_lst = stats_inexistentes['lst']
+    for numero, cenario in ((1, "inexistentes"), (2, "existentes")):
+        if not pontos["Arvore", "Lista", cenario]:
+            continue
+        t_arv, t_lst = tempos_na_virada["Arvore", "Lista", cenario]
         diff = (t_lst - t_arv) / t_lst * 100 # Calcula % de melhoria só pra mostrar
         
-        print("\n>>> CENÁRIO 1: BUSCA POR VALORES INEXISTENTES")
-        print(f"    A Árvore supera a Lista (incluindo tempo de construção) a partir de:")
-        print(f"    N = {ponto_virada_inexistentes} elementos")
-        print(f"    --------------------------------------------------")
-        print(f"    Tempo Árvore : {t_arv:.6f}s")
-        print(f"    Tempo Lista  : {t_lst:.6f}s")
-        print(f"    Vantagem     : A árvore foi {diff:.1f}% mais rápida neste ponto.")
-
-    if ponto_virada_existentes:
-        t_arv = stats_existentes['arv']
-        t_lst = stats_existentes['lst']
-        diff = (t_lst - t_arv) / t_lst * 100
-        
-        print("\n>>> CENÁRIO 2: BUSCA POR VALORES EXISTENTES")
+        print(f"\n>>> CENÁRIO {numero}: BUSCA POR VALORES {cenario.upper()}")
         print(f"    A Árvore supera a Lista (incluindo tempo de construção) a partir de:")
-        print(f"    N = {ponto_virada_existentes} elementos")
+        print(f"    {_formatar_virada(pontos['Arvore', 'Lista', cenario])}")
         print(f"    --------------------------------------------------")
-        print(f"    Tempo Árvore : {t_arv:.6f}s")
-        print(f"    Tempo Lista  : {t_lst:.6f}s")
+        print(f"    Tempo Árvore : {t_arv:.6f}s (mediana)")
+        print(f"    Tempo Lista  : {t_lst:.6f}s (mediana)")
         print(f"    Vantagem     : A árvore foi {diff:.1f}% mais rápida neste ponto.")
     
-   
+    print("\n>>> ÁRVORE x CONJUNTO HASH (construção + busca)")
+    for cenario in ("inexistentes", "existentes"):
+        if pontos["ConjuntoHash", "Arvore", cenario]:
+            print(f"    {cenario.upper():<13}: Hash supera a Árvore em {_formatar_virada(pontos['ConjuntoHash', 'Arvore', cenario])}")
+        else:
+            print(f"    {cenario.upper():<13}: Árvore mais rápida que o Hash em todos os N testados")
+    return pontos
+
 
-        
-        
-    
-        
-        
 if __name__ == "__main__":
 
     random.seed(42)  # Reprodutibilidade
@@ -490,258 +3744,280 @@ if __name__ == "__main__":
     imprimir_separador("Ponto de virada (tempo de busca + construcao)")
     encontrar_ponto_virada_total('pequeno')
     
-    # com muitos dados a lista já não 'compensa' independente da quantidade, mesmo com o tempo de construção da arvore maior, a diferença na busca é ainda mais bruta, fazendo
-    # qualquer teste com praticamente qualquer quantidade dar como ponto de virada pra árvore na 1° rodada.
-    # então comentado.
-        # print(f"Considerando tempo de construção + busca para MUITOS DADOS:\n")
-        # encontrar_ponto_virada_total('medio')
+    # com muitos dados (1000 buscas por tamanho) a árvore vence logo nos primeiros N;
+    # com a busca exponencial + binária o teste termina rápido e mostra onde
+    print(f"\nConsiderando tempo de construção + busca para MUITOS DADOS:\n")
+    encontrar_ponto_virada_total('medio')
     
     
     # Armazenando valores dos arquivos disponibilizados
     imprimir_separador("2 - 4 Análise de tempo (construcao, busca)")
-    valores_pequeno = ler_arquivo("conjunto_pequeno.txt")
-    valores_medio = ler_arquivo("conjunto_medio.txt")
-    # valores_grande = ler_arquivo("conjunto_grande.txt")
+    print(f"\nTempos de Carregamento dos conjuntos (.bin mapeado quando disponivel)")
+    print("="*60)
 
+    # Conjuntos de CONJUNTOS_BENCHMARK presentes no disco; os ausentes são pulados em todas as seções
+    conjuntos = {}
+    for nome_conjunto, arquivo in CONJUNTOS_BENCHMARK:
+        rss_antes = memoria_rss()
+        inicio_leitura = time.perf_counter()
+        valores = cache_datasets.ler(arquivo)
+        if not valores:
+            continue
+        print(f"tempo conjunto {nome_conjunto} {time.perf_counter() - inicio_leitura:.6f} ({type(valores).__name__}, RSS +{(memoria_rss() - rss_antes) / 2**20:.1f} MiB)")
+        conjuntos[nome_conjunto] = valores
+    arquivos_conjuntos = {nome_conjunto: arquivo for nome_conjunto, arquivo in CONJUNTOS_BENCHMARK if nome_conjunto in conjuntos}
 
-    # Instanciar as Árvores Binárias
-    arvore_p = Arvore()
-    arvore_m = Arvore()
-    arvore_g = Arvore()
-    
-    # Instanciar as Listas
-    lista_p = Lista()
-    lista_m = Lista()
-    lista_g = Lista()
-    
-    # Instanciar as Listas Otimizadas
-    lista_otimizada_p = ListaOtimizada()
-    lista_otimizada_m = ListaOtimizada()
-    lista_otimizada_g = ListaOtimizada()
-    
-    
-    # **2** -- ANÁLISE TEMPORAL DETALHADA (Testes do conjunto grande estão comentados, devido ao tempo para execução)
-    
-    
-    # ====INSERINDO valores====
-    print(f"\nTempos de Construcao - ARVORE")
+    # ====Testes de BUSCA====
+    # consultas de cada conjunto: (existentes, NAO existentes)
+    buscas = {
+        nome_conjunto: (gerar_valores_busca(valores, QTD_BUSCAS_BENCHMARK),
+                        gerar_valores_busca(valores, QTD_BUSCAS_BENCHMARK, existente=False))
+        for nome_conjunto, valores in conjuntos.items()
+    }
+
+
+    # **2** -- ANÁLISE TEMPORAL DETALHADA: construção e buscas de todas as estruturas
+    # (a matriz é configurada em estruturas_benchmark e nas constantes *_BENCHMARK;
+    # as seções seguintes também medem com medir, sobre os mesmos conjuntos)
+    print(f"\nBENCHMARK - {REPETICOES_BENCHMARK} repeticoes (+{AQUECIMENTO_BENCHMARK} de aquecimento), mediana por celula")
     print("="*60)
-    
-    # Inserir valores pequenos na Árvore
-    inicio_arvore_p = time.perf_counter()
-    for valor in valores_pequeno:
-        arvore_p.inserir(valor)
-    print(f"tempo conjunto PEQUENO {time.perf_counter() - inicio_arvore_p:.6f}")
-    
-    # Inserir valores medios na Árvore
-    inicio_arvore_m = time.perf_counter()
-    for valor in valores_medio:
-        arvore_m.inserir(valor)
-    print(f"tempo conjunto MEDIO {time.perf_counter() - inicio_arvore_m:.6f}")
-    
-    # # Inserir valores grandes na Árvore
-    # inicio_arvore_g = time.perf_counter()
-    # for valor in valores_grande:
-    #     arvore_g.inserir(valor)
-    # print(f"tempo conjunto GRANDE {time.perf_counter() - inicio_arvore_g:.6f}")
-    
-    
-    print(f"\nTempos de Construcao - LISTA")
+    resultados_benchmark, construidas = executar_benchmark()
+    imprimir_benchmark(resultados_benchmark)
+
+    print(f"\nCONTADORES de operacoes (ArvoreInstrumentada / ListaOtimizadaInstrumentada)")
     print("="*60)
-    
-    # Inserir valores pequenos na Lista
-    inicio_lista_p =  time.perf_counter()
-    lista_p.inserirVarios(valores_pequeno)
-    print(f"tempo conjunto PEQUENO {time.perf_counter() - inicio_lista_p:.6f}")
-    
-    # Inserir valores medios na Lista
-    inicio_lista_m =  time.perf_counter()
-    lista_m.inserirVarios(valores_medio)
-    print(f"tempo conjunto MEDIO {time.perf_counter() - inicio_lista_m:.6f}")
-    
-    # # Inserir valores grandes na Lista
-    # inicio_lista_g =  time.perf_counter()
-    # lista_g.inserirVarios(valores_grande)
-    # print(f"tempo conjunto GRANDE {time.perf_counter() - inicio_lista_g:.6f}")
-    
-    
-    print(f"\nTempos de Construcao + Ordenacao - LISTA OTIMIZADA")
+    perfil_operacoes = medir_contadores()
+    imprimir_contadores(perfil_operacoes)
+    caminho_json, caminho_csv = salvar_benchmark(resultados_benchmark, extras=perfil_operacoes)
+    print(f"Resultados salvos em {caminho_json} e {caminho_csv}")
+
+
+    if EXECUTAR_ARVORE_COMPACTA:
+        print(f"\nMemoria por elemento - ARVORE x ARVORE COMPACTA")
+        print("="*60)
+        for nome_conjunto in conjuntos:
+            print(f"conjunto {nome_conjunto:<8} Arvore: {construidas['ARVORE', nome_conjunto].bytes_por_elemento():.1f} B/chave | "
+                  f"Compacta: {construidas['ARVORE COMPACTA', nome_conjunto].bytes_por_elemento():.1f} B/chave")
+
+
+    print(f"\nTempos de Ordenacao por algoritmo - LISTA OTIMIZADA (mediana)")
     print("="*60)
-    
-    # Inserir conjunto PEQUENO na Lista otimizada e depois ORDENAR
-    inicio_insercao_p = time.perf_counter()
-    lista_otimizada_p.inserirVarios(valores_pequeno)
-    tempo_insercao_p = time.perf_counter() - inicio_insercao_p
-    
-    inicio_ordenacao_p = time.perf_counter()
-    lista_otimizada_p.ordenar()
-    tempo_ordenacao_p = time.perf_counter() - inicio_ordenacao_p
-    tempo_total_build_p = tempo_insercao_p + tempo_ordenacao_p
-    print(f"tempo conjunto PEQUENO {tempo_total_build_p:.6f} (Insercao: {tempo_insercao_p:.6f}s + Ordenacao: {tempo_ordenacao_p:.6f})")
 
-    # Inserir conjunto MÉDIO na Lista otimizada e depois ORDENAR
-    inicio_insercao_m = time.perf_counter()
-    lista_otimizada_m.inserirVarios(valores_medio)
-    tempo_insercao_m = time.perf_counter() - inicio_insercao_m
+    # Cada execução ordena uma cópia nova do conjunto (a cópia fica fora da medida)
+    for algoritmo in ListaOtimizada.ALGORITMOS_ORDENACAO:
+        for nome_conjunto, valores in conjuntos.items():
+            estatisticas, _ = medir(lambda lista: lista.ordenar(algoritmo), preparar=lambda: _lista_nao_ordenada(valores))
+            print(f"{algoritmo:<16} conjunto {nome_conjunto:<8} {estatisticas['mediana']:.6f}")
 
-    inicio_ordenacao_m = time.perf_counter()
-    lista_otimizada_m.ordenar()
-    tempo_ordenacao_m = time.perf_counter() - inicio_ordenacao_m
-    tempo_total_build_m = tempo_insercao_m + tempo_ordenacao_m
-    print(f"tempo conjunto MEDIO {tempo_total_build_m:.6f} (Insercao: {tempo_insercao_m:.6f} + Ordenacao: {tempo_ordenacao_m:.6f})")
-    
-    # # Inserir conjunto GRANDE na Lista otimizada e depois ORDENAR
-    # inicio_insercao_g = time.perf_counter()
-    # lista_otimizada_g.inserirVarios(valores_grande)
-    # tempo_insercao_g = time.perf_counter() - inicio_insercao_g
 
-    # inicio_ordenacao_g = time.perf_counter()
-    # lista_otimizada_g.ordenar()
-    # tempo_ordenacao_g = time.perf_counter() - inicio_ordenacao_g
-    # tempo_total_build_g = tempo_insercao_g + tempo_ordenacao_g
-    # print(f"tempo conjunto GRANDE {tempo_total_build_g:.6f} (Insercao: {tempo_insercao_g:.6f} + Ordenacao: {tempo_ordenacao_g:.6f})")
+    print(f"\nTempos por ORDEM (fanout) - ARVORE B (mediana)")
+    print("="*60)
 
-    
+    # Construção e busca (existentes + NAO existentes) para cada ordem configurada
+    for ordem in ORDENS_ARVORE_B:
+        for nome_conjunto, valores in conjuntos.items():
+            existentes, inexistentes = buscas[nome_conjunto]
+            estatisticas_build, arvore_b = medir(lambda: _construir_padrao(lambda: ArvoreB(ordem), valores))
+            estatisticas_busca, _ = medir(lambda: (_buscar_um_a_um(arvore_b, existentes), _buscar_um_a_um(arvore_b, inexistentes)))
+            print(f"ordem {ordem:<4} conjunto {nome_conjunto:<8} construcao -> {estatisticas_build['mediana']:.6f} | "
+                  f"busca -> {estatisticas_busca['mediana']:.6f} (altura {arvore_b.altura()})")
 
 
-    
+    print(f"\nEscalabilidade da busca linear PARALELA - LISTA (mediana)")
+    print("="*60)
 
-    # ====Testes de BUSCA====
-    
-    # ==Criando valores de busca de CONJUNTO PEQUENO==
-    
-    
-    # cria/armazena 500 valores existentes no arquivo
-    valores_busca_existentes_pequeno = gerar_valores_busca(valores_pequeno, 500)
-    
-    
-    # cria/armazena 500 valores NÃO existentes no arquivo
-    valores_busca_nexistentes_pequeno = gerar_valores_busca(valores_pequeno, 500, existente=False)   
-        
-        
-    # ==Criando valores de busca de CONJUNTO MEDIO==
-    
+    # Mesmo lote de consultas, variando a quantidade de processos; os processos são
+    # criados no aquecimento do medir e reaproveitados nas repetições medidas
+    for nome_conjunto, valores in conjuntos.items():
+        existentes, inexistentes = buscas[nome_conjunto]
+        with ListaParalela() as lista_paralela:
+            lista_paralela.inserirVarios(valores)
+            for trabalhadores in sorted(set(TRABALHADORES_VARREDURA)):
+                estatisticas_e, _ = medir(lambda: lista_paralela.buscar_varios(existentes, trabalhadores))
+                estatisticas_ne, _ = medir(lambda: lista_paralela.buscar_varios(inexistentes, trabalhadores))
+                print(f"conjunto {nome_conjunto:<8} {trabalhadores:>3} processo(s) -> Existentes {estatisticas_e['mediana']:.6f} | "
+                      f"NAO Existentes {estatisticas_ne['mediana']:.6f}")
 
-    # cria/armazena 500 valores existentes no arquivo
-    valores_busca_existentes_medio = gerar_valores_busca(valores_medio, 500)
 
-    # cria/armazena 500 valores NÃO existentes no arquivo
-    valores_busca_nexistentes_medio = gerar_valores_busca(valores_medio, 500, existente=False) 
-    
-    
-    # ==Criando valores de busca de CONJUNTO GRANDE==
-    
-    # cria/armazena 500 valores existentes no arquivo
-    #valores_busca_existentes_grande = gerar_valores_busca(valores_grande, 500)
-    # cria/armazena 500 valores NÃO existentes no arquivo
-    #valores_busca_nexistentes_grande = gerar_valores_busca(valores_grande, 500, existente=False) 
+    print(f"\nBuscas NAO Existentes com FILTRO DE BLOOM ({BLOOM_BITS_POR_CHAVE} bits/chave, mediana)")
+    print("="*60)
+
+    # O filtro envolve as estruturas já construídas; só os bits são preenchidos aqui
+    for nome_estrutura in ("ARVORE", "LISTA", "LISTA OTIMIZADA"):
+        for nome_conjunto, valores in conjuntos.items():
+            estrutura = construidas[nome_estrutura, nome_conjunto]
+            inexistentes = buscas[nome_conjunto][1]
+            filtro = FiltroBloom(estrutura, len(valores))
+            filtro.indexar(valores)
+
+            sem_filtro, _ = medir(lambda: _buscar_um_a_um(estrutura, inexistentes))
+            com_filtro, _ = medir(lambda: _buscar_um_a_um(filtro, inexistentes))
+
+            # falsos positivos medidos com uma amostra maior de valores ausentes
+            maior = max(valores)
+            taxa_fp = filtro.taxa_falso_positivo(range(maior + 1, maior + 10_001))
+            aceleracao = sem_filtro["mediana"] / com_filtro["mediana"] if com_filtro["mediana"] else float("inf")
+            print(f"{nome_estrutura:<16} {nome_conjunto:<8} sem filtro {sem_filtro['mediana']:.6f} | com filtro {com_filtro['mediana']:.6f} "
+                  f"({aceleracao:.1f}x) | falsos positivos {taxa_fp:.2%} | +{filtro.bytes_memoria() / 1024:.1f} KiB")
 
 
-    print(f"\nTempos de Buscas - ARVORE")
+    print(f"\nConsultas de INTERVALO e SUCESSOR - ARVORE x LISTA OTIMIZADA (mediana)")
     print("="*60)
-    inicio_busca_e_p = time.perf_counter()
-    for n in valores_busca_existentes_pequeno:
-        resposta = arvore_p.buscar(n)
-    print(f"Tempo Conjunto PEQUENO, valores Existentes -> {time.perf_counter() - inicio_busca_e_p:.6f}")
-    
-    inicio_busca_e_m = time.perf_counter()
-    for n in valores_busca_existentes_medio:
-        resposta = arvore_m.buscar(n)
-    print(f"Tempo Conjunto MEDIO, valores Existentes -> {time.perf_counter() - inicio_busca_e_m:.6f}")
-    
-    # inicio_busca_e_g = time.perf_counter()
-    # for n in valores_busca_existentes_grande:
-    #     resposta = arvore_g.buscar(n)
-    # print(f"Tempo Conjunto GRANDE, valores Existentes -> {time.perf_counter() - inicio_busca_e_g:.6f}")
 
+    # Intervalos [a, a + largura] com início em valores existentes; a largura cobre ~100 chaves
+    for nome_conjunto, valores in conjuntos.items():
+        largura = max(1, (max(valores) // len(valores)) * 100)
+        inicios = gerar_valores_busca(valores, QTD_CONSULTAS_INTERVALO)
 
+        for nome_estrutura in ("ARVORE", "LISTA OTIMIZADA"):
+            estrutura = construidas[nome_estrutura, nome_conjunto]
+            intervalo, total_chaves = medir(lambda: sum(1 for a in inicios for chave in estrutura.intervalo(a, a + largura)))
+            sucessor, _ = medir(lambda: [estrutura.sucessor(a + 1) for a in inicios])
 
-    inicio_busca_ne_p = time.perf_counter()
-    for n in valores_busca_nexistentes_pequeno:
-        resposta = arvore_p.buscar(n)
-    print(f"tempo Conjunto PEQUENO, valores NAO Existentes -> {time.perf_counter() - inicio_busca_ne_p:.6f}")
-    
-    inicio_busca_ne_m = time.perf_counter()
-    for n in valores_busca_nexistentes_medio:
-        resposta = arvore_m.buscar(n)
-    print(f"tempo Conjunto MEDIO, valores NAO Existentes -> {time.perf_counter() - inicio_busca_ne_m:.6f}")
-    
-    # inicio_busca_ne_g = time.perf_counter()
-    # for n in valores_busca_nexistentes_grande:
-    #     resposta = arvore_g.buscar(n)
-    # print(f"tempo Conjunto GRANDE, valores NAO Existentes -> {time.perf_counter() - inicio_busca_ne_g:.6f}")
-    
-    
-    print(f"\nTempos de Buscas - LISTA")
+            vazao = len(inicios) / intervalo["mediana"] if intervalo["mediana"] else float("inf")
+            print(f"{nome_estrutura:<16} {nome_conjunto:<8} intervalo {intervalo['mediana']:.6f} ({vazao:,.0f} consultas/s, "
+                  f"{total_chaves} chaves) | sucessor {sucessor['mediana']:.6f}")
+
+
+    print(f"\nConstrucao em FLUXO (leitura do txt sobreposta a construcao, mediana)")
     print("="*60)
-    l_inicio_busca_e_p = time.perf_counter()
-    for n in valores_busca_existentes_pequeno:
-        resposta = lista_p.buscar(n)
-    print(f"Tempo Conjunto PEQUENO, valores Existentes -> {time.perf_counter() - l_inicio_busca_e_p:.6f}")
-    
-    l_inicio_busca_e_m = time.perf_counter()
-    for n in valores_busca_existentes_medio:
-        resposta = lista_m.buscar(n)
-    print(f"Tempo Conjunto MEDIO, valores Existentes -> {time.perf_counter() - l_inicio_busca_e_m:.6f}")
-    
-    # l_inicio_busca_e_g = time.perf_counter()
-    # for n in valores_busca_existentes_grande:
-    #     resposta = lista_g.buscar(n)
-    # print(f"Tempo Conjunto GRANDE, valores Existentes -> {time.perf_counter() - l_inicio_busca_e_g:.6f}")
 
+    # Tradicional: lê o arquivo inteiro e só então constrói; Fluxo: consome lotes de uma fila limitada
+    for nome_conjunto, arquivo in arquivos_conjuntos.items():
+        for nome_estrutura, classe in (("ARVORE", Arvore), ("LISTA", Lista)):
+            rss_base = memoria_rss()
+            tradicional, (_, pico_tradicional) = medir(lambda: construir_tradicional(classe, arquivo))
+            print(f"{nome_estrutura:<8} {nome_conjunto:<8} tradicional      -> {tradicional['mediana']:.6f} "
+                  f"(pico RSS +{(pico_tradicional - rss_base) / 2**20:.1f} MiB)")
 
+            for modo in ("thread", "processo"):
+                rss_base = memoria_rss()
+                fluxo, (_, pico_fluxo) = medir(lambda: construir_em_fluxo(
+                    classe(), ler_em_segundo_plano(arquivo, modo=modo, usar_binario=False)))
+                print(f"{nome_estrutura:<8} {nome_conjunto:<8} fluxo ({modo:<8}) -> {fluxo['mediana']:.6f} "
+                      f"(pico RSS +{(pico_fluxo - rss_base) / 2**20:.1f} MiB)")
 
-    l_inicio_busca_ne_p = time.perf_counter()
-    for n in valores_busca_nexistentes_pequeno:
-        resposta = lista_p.buscar(n)
-    print(f"tempo Conjunto PEQUENO, valores NAO Existentes -> {time.perf_counter() - l_inicio_busca_ne_p:.6f}")
-    
-    l_inicio_busca_ne_m = time.perf_counter()
-    for n in valores_busca_nexistentes_medio:
-        resposta = lista_m.buscar(n)
-    print(f"tempo Conjunto MEDIO, valores NAO Existentes -> {time.perf_counter() - l_inicio_busca_ne_m:.6f}")
-    
-    # l_inicio_busca_ne_g = time.perf_counter()
-    # for n in valores_busca_nexistentes_grande:
-    #     resposta = lista_g.buscar(n)
-    # print(f"tempo Conjunto GRANDE, valores NAO Existentes -> {time.perf_counter() - l_inicio_busca_ne_g:.6f}")
-    
 
-    print(f"\nTempos de Buscas - LISTA OTIMIZADA")
+    print(f"\nSNAPSHOTS - construcao x recarga da estrutura salva em disco")
     print("="*60)
-    
-    # Teste de busca com valores existentes
-    lo_inicio_busca_e_p = time.perf_counter()
-    for n in valores_busca_existentes_pequeno:
-        resposta = lista_otimizada_p.busca_binaria(n)
-    print(f"Tempo Conjunto PEQUENO, valores Existentes -> {time.perf_counter() - lo_inicio_busca_e_p:.6f}")
-    
-    lo_inicio_busca_e_m = time.perf_counter()
-    for n in valores_busca_existentes_medio:
-        resposta = lista_otimizada_m.busca_binaria(n)
-    print(f"Tempo Conjunto MEDIO, valores Existentes -> {time.perf_counter() - lo_inicio_busca_e_m:.6f}")
-    
-    # lo_inicio_busca_e_g = time.perf_counter()
-    # for n in valores_busca_existentes_grande:
-    #     resposta = lista_otimizada_g.busca_binaria(n)
-    # print(f"Tempo Conjunto GRANDE, valores Existentes -> {time.perf_counter() - lo_inicio_busca_e_g:.6f}")
-    
 
-    
-    # Teste de busca com valores NÃO existentes
-    lo_inicio_busca_ne_p = time.perf_counter()
-    for n in valores_busca_nexistentes_pequeno:
-        resposta = lista_otimizada_p.busca_binaria(n)
-    print(f"tempo Conjunto PEQUENO, valores NAO Existentes -> {time.perf_counter() - lo_inicio_busca_ne_p:.6f}")
-    
-    lo_inicio_busca_ne_m = time.perf_counter()
-    for n in valores_busca_nexistentes_medio:
-        resposta = lista_otimizada_m.busca_binaria(n)
-    print(f"tempo Conjunto MEDIO, valores NAO Existentes -> {time.perf_counter() - lo_inicio_busca_ne_m:.6f}")
-    
-    # lo_inicio_busca_ne_g = time.perf_counter()
-    # for n in valores_busca_nexistentes_grande:
-    #     resposta = lista_otimizada_g.busca_binaria(n)
-    # print(f"tempo Conjunto GRANDE, valores NAO Existentes -> {time.perf_counter() - lo_inicio_busca_ne_g:.6f}")
-    
-    
+    # A 1ª execução constrói e salva; as seguintes recarregam (até o conjunto mudar).
+    # Uma única medida por estrutura: repetir transformaria toda construção em recarga
+    for nome_conjunto, arquivo in arquivos_conjuntos.items():
+        for classe in (Arvore, ListaOtimizada, Lista):
+            inicio_snapshot = time.perf_counter()
+            estrutura_snapshot, do_snapshot = obter_estrutura(classe, arquivo)
+            origem = "recarregada do snapshot" if do_snapshot else "construida e salva"
+            print(f"{classe.__name__:<15} {nome_conjunto:<8} {time.perf_counter() - inicio_snapshot:.6f} ({origem})")
+
+
+    # A carga mista roda só no menor conjunto: na LISTA cada busca/remoção é uma varredura linear
+    nome_carga = min(conjuntos, key=lambda nome_conjunto: len(conjuntos[nome_conjunto]), default=None)
+    if nome_carga is not None:
+        print(f"\nCarga MISTA (buscar/inserir/remover) - {QTD_OPERACOES_CARGA} operacoes sobre o conjunto {nome_carga} (mediana)")
+        print("="*60)
+
+        # Cada execução recebe a estrutura construída de novo (fora da medida), já que a carga a modifica
+        construtores_carga = (
+            ("ARVORE", lambda v: _construir_padrao(Arvore, v)),
+            ("ARVORE AVL", lambda v: _construir_padrao(ArvoreAVL, v)),
+            ("ARVORE COMPACTA", lambda v: _construir_padrao(ArvoreCompacta, v)),
+            ("ARVORE B (64)", lambda v: _construir_padrao(lambda: ArvoreB(64), v)),
+            ("CONJUNTO HASH", lambda v: _construir_padrao(ConjuntoHash, v)),
+            ("LISTA", lambda v: _construir_padrao(Lista, v)),
+            ("LISTA OTIMIZADA", lambda v: _construir_padrao(ListaOtimizada, v)),
+        )
+        valores_carga = conjuntos[nome_carga]
+        for mistura in MISTURAS_CARGA:
+            operacoes = gerar_operacoes_carga(valores_carga, mistura)
+            rotulo = "/".join(str(p) for p in mistura)
+            for nome_estrutura, construir in construtores_carga:
+                carga, _ = medir(lambda estrutura: executar_carga(estrutura, operacoes), preparar=lambda: construir(valores_carga))
+                vazao = len(operacoes) / carga["mediana"] if carga["mediana"] else float("inf")
+                print(f"mistura {rotulo:<9} {nome_estrutura:<16} {carga['mediana']:.6f}s -> {vazao:,.0f} ops/s")
+
+
+    if EXECUTAR_PERFIS_ENTRADA:
+        print(f"\nPERFIS de entrada ({TAMANHO_PERFIS} valores) - construcao, busca e altura (mediana)")
+        print("="*60)
+
+        # Mesmas estruturas, mudando só a ordem/distribuição dos valores inseridos
+        estruturas_perfis = [("ARVORE", Arvore), ("ARVORE COMPACTA", ArvoreCompacta)]
+        if EXECUTAR_ARVORE_AVL:
+            estruturas_perfis.append(("ARVORE AVL", ArvoreAVL))
+        estruturas_perfis += [("ARVORE B", ArvoreB), ("LISTA", Lista), ("LISTA OTIMIZADA", ListaOtimizada)]
+        if EXECUTAR_CONJUNTO_HASH:
+            estruturas_perfis.append(("CONJUNTO HASH", ConjuntoHash))
+
+        for perfil in PERFIS:
+            valores_perfil = gerar_valores(TAMANHO_PERFIS, perfil).tolist()
+            busca_perfil = gerar_valores_busca(valores_perfil, 500) + gerar_valores_busca(valores_perfil, 500, existente=False)
+            print(f"-- {perfil}")
+            for nome_estrutura, classe in estruturas_perfis:
+                construcao, estrutura = medir(lambda: _construir_padrao(classe, valores_perfil))
+                busca, _ = medir(lambda: _buscar_um_a_um(estrutura, busca_perfil))
+                altura = f" | altura {estrutura.altura()}" if hasattr(estrutura, "altura") else ""
+                print(f"   {nome_estrutura:<16} construcao {construcao['mediana']:.6f} | busca {busca['mediana']:.6f}{altura}")
+
+
+    print(f"\nDISTRIBUICOES de consultas e CACHE LRU ({CAPACIDADE_CACHE_LRU} resultados, mediana)")
+    print("="*60)
+
+    # Tráfego assimétrico: mesmo número de consultas, com e sem o cache na frente da estrutura
+    # (a LISTA, com busca linear, só no menor conjunto)
+    celulas_distribuicao = [(nome_estrutura, nome_conjunto) for nome_conjunto in conjuntos
+                            for nome_estrutura in ("ARVORE", "LISTA OTIMIZADA")]
+    if nome_carga is not None:
+        celulas_distribuicao.append(("LISTA", nome_carga))
+    for nome_estrutura, nome_conjunto in celulas_distribuicao:
+        estrutura, valores = construidas[nome_estrutura, nome_conjunto], conjuntos[nome_conjunto]
+        for nome_distribuicao, consultas in (
+            ("uniforme", gerar_consultas_uniformes(valores, QTD_CONSULTAS_DISTRIBUICAO)),
+            ("zipf", gerar_consultas_zipf(valores, QTD_CONSULTAS_DISTRIBUICAO)),
+            ("quentes", gerar_consultas_quentes(valores, QTD_CONSULTAS_DISTRIBUICAO)),
+            ("adversarial", gerar_consultas_adversariais(estrutura, QTD_CONSULTAS_DISTRIBUICAO)),
+        ):
+            if not consultas:
+                continue
+            sem_cache, _ = medir(lambda: _buscar_um_a_um(estrutura, consultas))
+            # cada execução começa com o cache vazio
+            com_cache, cache = medir(lambda cache: (_buscar_um_a_um(cache, consultas), cache)[1],
+                                     preparar=lambda: CacheLRU(estrutura))
+
+            print(f"{nome_estrutura:<16} {nome_conjunto:<8} {nome_distribuicao:<12} sem cache {sem_cache['mediana'] / len(consultas) * 1e9:>9,.0f} ns/busca | "
+                  f"com cache {com_cache['mediana'] / len(consultas) * 1e9:>9,.0f} ns/busca | acertos {cache.taxa_acerto():.1%}")
+
+
+    print(f"\nIndice PARTICIONADO por faixas (ARVORE por particao, mediana)")
+    print("="*60)
+
+    # Construção paralela e vazão de buscas conforme o número de partições cresce.
+    # construir acrescenta à estrutura de cada partição, então cada repetição recebe
+    # um índice novo pelo preparar (processos criados fora da medida, o anterior é
+    # fechado) e as buscas usam o último construído
+    for nome_conjunto, valores in conjuntos.items():
+        consultas_particionado = buscas[nome_conjunto][0] + buscas[nome_conjunto][1]
+        for num_particoes in QTD_PARTICOES:
+            abertos = []
+            def novo_indice():
+                while abertos:
+                    abertos.pop().fechar()
+                abertos.append(IndiceParticionado(num_particoes, Arvore, maximo=len(valores) * 10))
+                return abertos[-1]
+            def construir_indice(indice):
+                indice.construir(valores)
+                return indice
+            try:
+                construcao, indice = medir(construir_indice, preparar=novo_indice)
+                lote, _ = medir(lambda: indice.buscar_varios(consultas_particionado))
+                individual, _ = medir(lambda: _buscar_um_a_um(indice, consultas_particionado))
+            finally:
+                while abertos:
+                    abertos.pop().fechar()
+            print(f"conjunto {nome_conjunto:<8} {num_particoes:>2} particao(oes) construcao {construcao['mediana']:.6f} | "
+                  f"lote {len(consultas_particionado) / lote['mediana']:,.0f} buscas/s | "
+                  f"individual {len(consultas_particionado) / individual['mediana']:,.0f} buscas/s")
+
+
+    imprimir_separador("Resumo da execucao")
+    print(f"Cache de conjuntos: {cache_datasets.resumo()}")
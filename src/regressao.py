@@ -0,0 +1,484 @@
+"""
+Acompanhamento de regressões de desempenho com baselines versionadas.
+
+Cada baseline é um JSON numerado (baselines/baseline_v001.json, v002...) com os
+resultados do benchmark declarativo de main.py, incluindo a mediana de cada
+execução (cada execução roda em um processo novo). Uma execução nova é comparada
+célula a célula (estrutura, conjunto, operação, cenário) com a baseline, usando
+a mediana de cada execução como uma amostra: a célula regrediu quando a mediana
+piorou mais que o limiar, o teste t de Welch confirma a diferença com 95% de
+confiança E todas as execuções novas foram mais lentas que todas as da baseline.
+Havendo regressões, o script termina com código 1 (útil em CI).
+
+Os gráficos de assets/ (construção e buscas existentes/inexistentes) são gerados
+a partir dos resultados guardados, em vez de montados à mão. O matplotlib é
+opcional: sem ele, a comparação funciona e os gráficos são apenas pulados.
+
+Uso:
+    python regressao.py salvar                       # roda o benchmark e grava a próxima baseline (e os gráficos)
+    python regressao.py comparar --limiar 0.10       # roda de novo e compara com a última baseline
+    python regressao.py comparar --resultados resultados/benchmark_20260101_120000.json
+    python regressao.py graficos                     # regenera os gráficos a partir da última baseline
+"""
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+from main import CONJUNTOS_BENCHMARK, executar_benchmark, imprimir_benchmark, salvar_benchmark, t_critico_95
+
+# matplotlib é opcional: só é usado para regenerar os gráficos
+try:
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+except ImportError:
+    plt = None
+
+PASTA_SCRIPT = os.path.dirname(os.path.abspath(__file__))
+PASTA_BASELINES = os.path.join(PASTA_SCRIPT, "baselines")
+PASTA_GRAFICOS = os.path.join(PASTA_SCRIPT, os.pardir, "assets")
+VERSAO_FORMATO_BASELINE = 1
+LIMIAR_REGRESSAO = 0.10  # Piora relativa mínima da mediana para contar como regressão (10%)
+EXECUCOES_REGRESSAO = 7  # Execuções independentes (processos) em cada lado; cada uma vira uma amostra
+NORMALIZAR_MAQUINA = True  # Desconta a lentidão geral da máquina (fator_maquina), que varia entre execuções distantes no tempo
+
+# Estruturas dos gráficos: nome no benchmark -> (rótulo, cor)
+ESTRUTURAS_GRAFICOS = {
+    "LISTA": ("Lista", "#4285F4"),
+    "ARVORE": ("Árvore", "#EA4335"),
+    "LISTA OTIMIZADA": ("Lista Otimizada", "#FBBC04"),
+}
+# Gráficos gerados: (arquivo, operação, cenário, título)
+GRAFICOS = (
+    ("benchmark-construcao.png", "construcao", "-", "Tempo de Construção"),
+    ("benchmark-busca-existente.png", "buscar", "existentes", "Tempo de Busca (existentes)"),
+    ("benchmark-busca-inexistente.png", "buscar", "inexistentes", "Tempo de Busca (inexistentes)"),
+)
+
+
+#  === BASELINES ===
+def _versoes_baseline(pasta=PASTA_BASELINES):
+    """Retorna a lista ordenada de (versão, caminho) das baselines existentes."""
+    if not os.path.isdir(pasta):
+        return []
+    versoes = []
+    for arquivo in os.listdir(pasta):
+        encontrado = re.fullmatch(r"baseline_v(\d+)\.json", arquivo)
+        if encontrado:
+            versoes.append((int(encontrado.group(1)), os.path.join(pasta, arquivo)))
+    return sorted(versoes)
+
+
+def _commit_atual():
+    try:
+        saida = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=PASTA_SCRIPT,
+                               capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return saida.stdout.strip() or None
+
+
+def salvar_baseline(execucao, pasta=PASTA_BASELINES, descricao=""):
+    """
+    Grava os resultados como a próxima versão de baseline.
+
+    Parâmetros:
+    - execucao: dicionário com "resultados" (como o JSON de salvar_benchmark).
+    - pasta: pasta das baselines.
+    - descricao: texto livre guardado junto (ex.: o que mudou desde a anterior).
+
+    Retorna:
+    - caminho do arquivo gravado.
+    """
+    os.makedirs(pasta, exist_ok=True)
+    versoes = _versoes_baseline(pasta)
+    versao = versoes[-1][0] + 1 if versoes else 1
+    caminho = os.path.join(pasta, f"baseline_v{versao:03d}.json")
+    with open(caminho, "w") as f:
+        json.dump({
+            "formato": VERSAO_FORMATO_BASELINE,
+            "versao": versao,
+            "descricao": descricao,
+            "commit": _commit_atual(),
+            **{chave: execucao.get(chave) for chave in ("data", "python", "plataforma", "cpus", "repeticoes", "aquecimento")},
+            "resultados": execucao["resultados"],
+        }, f, indent=2)
+    return caminho
+
+
+def carregar_resultados(caminho):
+    """
+    Lê uma baseline ou um JSON de salvar_benchmark.
+
+    Retorna:
+    - dicionário com pelo menos a chave "resultados".
+    """
+    with open(caminho) as f:
+        dados = json.load(f)
+    if "resultados" not in dados:
+        raise ValueError(f"{caminho}: não contém resultados de benchmark")
+    if dados.get("formato", VERSAO_FORMATO_BASELINE) > VERSAO_FORMATO_BASELINE:
+        raise ValueError(f"{caminho}: formato de baseline v{dados['formato']} não suportado")
+    return dados
+
+
+def ultima_baseline(pasta=PASTA_BASELINES):
+    """Retorna o caminho da baseline mais recente (ou None, se não houver)."""
+    versoes = _versoes_baseline(pasta)
+    return versoes[-1][1] if versoes else None
+
+
+#  === COMPARAÇÃO ===
+def _chave(linha):
+    return linha["estrutura"], linha["conjunto"], linha["operacao"], linha["cenario"]
+
+
+def _comparaveis(base, linha):
+    # outro conjunto de dados ou outra quantidade de consultas: os tempos não são comparáveis
+    return base["n"] == linha["n"] and base["ops"] == linha["ops"] and base["mediana"] > 0
+
+
+def _amostras(linha, escala=1.0):
+    """
+    Uma amostra por execução independente: a mediana de cada execução. As repetições
+    de dentro de um mesmo processo são correlacionadas (mesmas consultas, mesma
+    disposição da memória) e não servem como amostras independentes. Resultados de
+    uma única execução (ex.: os de main.py) têm só uma amostra e nunca decidem.
+    """
+    medianas = linha.get("medianas_execucoes") or [linha["mediana"]]
+    return [mediana * escala for mediana in medianas]
+
+
+def _amostras_normalizadas(resultados):
+    """
+    Amostras de cada célula com a velocidade de cada execução descontada: a
+    execução i tem fator igual à mediana, entre as células, de (mediana da célula na
+    execução i / mediana da célula). Oscilações da máquina entre execuções atingem
+    todas as células da execução e se cancelam; a piora de uma estrutura, presente
+    em todas as execuções, continua.
+
+    Retorna:
+    - dicionário chave da célula -> lista de amostras.
+    """
+    amostras = {_chave(linha): _amostras(linha) for linha in resultados}
+    execucoes = {len(valores) for valores in amostras.values()}
+    if len(execucoes) != 1 or execucoes == {1}:
+        return amostras
+    fatores = [
+        statistics.median(valores[i] / statistics.median(valores) for valores in amostras.values()
+                          if statistics.median(valores) > 0)
+        for i in range(execucoes.pop())
+    ]
+    return {chave: [valor / fator for valor, fator in zip(valores, fatores)] for chave, valores in amostras.items()}
+
+
+def _welch(base, nova):
+    """
+    Teste t de Welch (variâncias diferentes) entre as amostras de duas células.
+
+    Parâmetros:
+    - base, nova: listas de amostras (ver _amostras).
+
+    Retorna:
+    - 1 se a nova é mais lenta com 95% de confiança, -1 se é mais rápida, 0 se indefinido.
+    """
+    if len(base) < 2 or len(nova) < 2:
+        return 0
+    var_base = statistics.variance(base) / len(base)
+    var_nova = statistics.variance(nova) / len(nova)
+    erro = math.sqrt(var_base + var_nova)
+    diferenca = statistics.fmean(nova) - statistics.fmean(base)
+    if erro == 0:
+        return (diferenca > 0) - (diferenca < 0)
+    # graus de liberdade de Welch-Satterthwaite
+    graus = (var_base + var_nova) ** 2 / (var_base ** 2 / (len(base) - 1) + var_nova ** 2 / (len(nova) - 1))
+    t = t_critico_95(graus)
+    if diferenca / erro > t:
+        return 1
+    if diferenca / erro < -t:
+        return -1
+    return 0
+
+
+def _mudou(base, nova, limiar):
+    """
+    Retorna 1 (mais lenta) ou -1 (mais rápida) quando a mediana mudou mais que o
+    limiar, o teste de Welch confirma e todas as execuções concordam (as amostras
+    não se sobrepõem); 0 caso contrário.
+    """
+    variacao = statistics.median(nova) / statistics.median(base) - 1
+    decisao = _welch(base, nova)
+    if variacao > limiar and decisao > 0 and min(nova) > max(base):
+        return 1
+    if variacao < -limiar and decisao < 0 and max(nova) < min(base):
+        return -1
+    return 0
+
+
+def fator_maquina(baseline, nova):
+    """
+    Mediana das razões nova/baseline entre as células comparáveis: quanto a máquina
+    inteira estava mais lenta (>1) ou mais rápida (<1) na execução nova. Uma
+    mudança em uma estrutura afeta só as suas células e quase não move a mediana;
+    já oscilações da máquina (frequência da CPU, outros processos) afetam todas.
+
+    Retorna:
+    - o fator (1.0 se não houver células em comum).
+    """
+    referencias = {_chave(linha): linha for linha in baseline}
+    razoes = [linha["mediana"] / referencias[_chave(linha)]["mediana"] for linha in nova
+              if _chave(linha) in referencias and _comparaveis(referencias[_chave(linha)], linha)]
+    return statistics.median(razoes) if razoes else 1.0
+
+
+def comparar(baseline, nova, limiar=LIMIAR_REGRESSAO, normalizar=NORMALIZAR_MAQUINA):
+    """
+    Compara cada célula da execução nova com a mesma célula da baseline.
+
+    Parâmetros:
+    - baseline, nova: listas de resultados (como as de executar_benchmark).
+    - limiar: piora (ou melhora) relativa mínima da mediana para a célula mudar de estado.
+    - normalizar: desconta a velocidade de cada execução (_amostras_normalizadas) e o
+      fator_maquina dos tempos da baseline antes de comparar. O fator_maquina
+      só desculpa diferenças: uma máquina mais rápida não transforma em regressão uma célula
+      que manteve o tempo absoluto, e uma mais lenta não a transforma em melhora.
+
+    Retorna:
+    - tupla (fator aplicado, lista de dicionários com estrutura, conjunto, operacao, cenario,
+      base, nova, variacao e estado), com estado "regressao", "melhora", "ok",
+      "n diferente" ou "nova" (sem célula na baseline).
+    """
+    fator = fator_maquina(baseline, nova) if normalizar else 1.0
+    referencias = {_chave(linha): linha for linha in baseline}
+    if normalizar:
+        amostras = {**{("base",) + chave: valores for chave, valores in _amostras_normalizadas(baseline).items()},
+                    **{("nova",) + chave: valores for chave, valores in _amostras_normalizadas(nova).items()}}
+    else:
+        amostras = {**{("base", *_chave(linha)): _amostras(linha) for linha in baseline},
+                    **{("nova", *_chave(linha)): _amostras(linha) for linha in nova}}
+    comparacoes = []
+    for linha in nova:
+        base = referencias.get(_chave(linha))
+        estrutura, conjunto, operacao, cenario = _chave(linha)
+        comparacao = {"estrutura": estrutura, "conjunto": conjunto, "operacao": operacao, "cenario": cenario,
+                      "base": None, "nova": linha["mediana"], "variacao": None}
+        if base is None:
+            comparacao["estado"] = "nova"
+        elif not _comparaveis(base, linha):
+            comparacao.update(base=base["mediana"], estado="n diferente")
+        else:
+            amostras_base, amostras_nova = amostras[("base", *_chave(base))], amostras[("nova", *_chave(linha))]
+            piorou = _mudou([valor * max(1.0, fator) for valor in amostras_base], amostras_nova, limiar)
+            melhorou = _mudou([valor * min(1.0, fator) for valor in amostras_base], amostras_nova, limiar)
+            estado = "regressao" if piorou > 0 else "melhora" if melhorou < 0 else "ok"
+            variacao = statistics.median(amostras_nova) / (statistics.median(amostras_base) * fator) - 1
+            comparacao.update(base=base["mediana"], variacao=variacao, estado=estado)
+        comparacoes.append(comparacao)
+    return fator, comparacoes
+
+
+def juntar_execucoes(execucoes):
+    """
+    Junta várias execuções do benchmark em uma. Cada célula guarda a mediana de
+    cada execução (medianas_execucoes, as amostras da comparação); a mediana da
+    célula passa a ser a mediana dessas medianas, e min/desvio/tempos vêm de todas
+    as repetições.
+
+    Parâmetros:
+    - execucoes: listas de resultados de executar_benchmark.
+
+    Retorna:
+    - lista de resultados no mesmo formato, com medianas_execucoes.
+    """
+    juntas = {}
+    for resultados in execucoes:
+        for linha in resultados:
+            chave = _chave(linha)
+            if chave not in juntas:
+                juntas[chave] = dict(linha, tempos=list(linha["tempos"]), medianas_execucoes=[linha["mediana"]])
+            else:
+                juntas[chave]["tempos"].extend(linha["tempos"])
+                juntas[chave]["medianas_execucoes"].append(linha["mediana"])
+    for linha in juntas.values():
+        tempos = linha["tempos"]
+        linha.update(repeticoes=len(tempos), min=min(tempos), mediana=statistics.median(linha["medianas_execucoes"]),
+                     desvio=statistics.stdev(tempos) if len(tempos) > 1 else 0.0)
+        linha["ns_por_op"] = linha["mediana"] / linha["ops"] * 1e9 if linha["ops"] else 0.0
+    return list(juntas.values())
+
+
+def imprimir_comparacao(comparacoes):
+    """Imprime a comparação, uma linha por célula, e um resumo por estado."""
+    for c in comparacoes:
+        base = f"{c['base']:.6f}" if c["base"] is not None else "-"
+        variacao = f"{c['variacao']:+7.1%}" if c["variacao"] is not None else "-"
+        destaque = " <<<" if c["estado"] == "regressao" else ""
+        print(f"{c['estrutura']:<21} {c['conjunto']:<8} {c['operacao']:<13} {c['cenario']:<12} "
+              f"base {base:>10} | nova {c['nova']:.6f} | {variacao:>7} | {c['estado']}{destaque}")
+    contagem = {}
+    for c in comparacoes:
+        contagem[c["estado"]] = contagem.get(c["estado"], 0) + 1
+    print("\nResumo: " + ", ".join(f"{estado} {qtd}" for estado, qtd in sorted(contagem.items())))
+
+
+#  === GRÁFICOS ===
+def gerar_graficos(resultados, pasta=PASTA_GRAFICOS, estruturas=ESTRUTURAS_GRAFICOS):
+    """
+    Gera os gráficos de barras de GRAFICOS (mediana de cada estrutura por conjunto).
+
+    Parâmetros:
+    - resultados: lista de resultados do benchmark.
+    - pasta: destino das imagens (padrão: assets/ na raiz do repositório).
+    - estruturas: dicionário nome -> (rótulo, cor) das estruturas desenhadas.
+
+    Retorna:
+    - lista com os caminhos gerados (vazia sem matplotlib).
+    """
+    if plt is None:
+        print("matplotlib não está instalado: os gráficos não foram gerados (pip install matplotlib).")
+        return []
+    os.makedirs(pasta, exist_ok=True)
+    conjuntos = list(dict.fromkeys(r["conjunto"] for r in resultados))
+    gerados = []
+    for arquivo, operacao, cenario, titulo in GRAFICOS:
+        medianas = {(r["estrutura"], r["conjunto"]): r["mediana"] for r in resultados
+                    if r["operacao"] == operacao and r["cenario"] == cenario}
+        presentes = [nome for nome in estruturas if any((nome, conjunto) in medianas for conjunto in conjuntos)]
+        if not presentes:
+            continue
+
+        figura, eixo = plt.subplots(figsize=(7, 4.3))
+        largura = 0.8 / len(presentes)
+        for i, nome in enumerate(presentes):
+            rotulo, cor = estruturas[nome]
+            posicoes = [j + (i - (len(presentes) - 1) / 2) * largura for j in range(len(conjuntos))]
+            eixo.bar(posicoes, [medianas.get((nome, conjunto), 0.0) for conjunto in conjuntos], largura,
+                     color=cor, label=f"Tempo {rotulo} (s)")
+        eixo.set_xticks(range(len(conjuntos)), [conjunto.capitalize() for conjunto in conjuntos])
+        eixo.set_title(f"{titulo}: {' VS '.join(estruturas[nome][0] for nome in presentes)}\n(em segundos)",
+                       loc="left", pad=26)
+        eixo.legend(loc="lower center", bbox_to_anchor=(0.5, 1.0), ncol=len(presentes), frameon=False)
+        eixo.grid(axis="y", alpha=0.3)
+        eixo.set_axisbelow(True)
+        for lado in ("top", "right"):
+            eixo.spines[lado].set_visible(False)
+        figura.tight_layout()
+
+        caminho = os.path.join(pasta, arquivo)
+        figura.savefig(caminho, dpi=100)
+        plt.close(figura)
+        gerados.append(caminho)
+    return gerados
+
+
+#  === EXECUÇÃO ===
+def _executar_benchmark(conjuntos):
+    return executar_benchmark(conjuntos=conjuntos, medir_memoria_construcao=False)[0]
+
+
+def executar_e_salvar(conjuntos, execucoes=EXECUCOES_REGRESSAO):
+    """
+    Roda o benchmark (sem medidas de memória) várias vezes, junta as execuções,
+    grava em resultados/ e devolve o JSON gravado.
+    """
+    resultados = []
+    for i in range(max(1, execucoes)):
+        print(f"Execucao {i + 1} de {execucoes}...")
+        # cada execução em um interpretador novo ("spawn"): a variação entre processos
+        # (consultas sorteadas, disposição da memória) também entra nas repetições
+        with multiprocessing.get_context("spawn").Pool(1) as pool:
+            resultados.append(pool.apply(_executar_benchmark, (conjuntos,)))
+    resultados = juntar_execucoes(resultados)
+    imprimir_benchmark(resultados)
+    caminho_json, _ = salvar_benchmark(resultados)
+    print(f"\nResultados salvos em {caminho_json}")
+    return carregar_resultados(caminho_json)
+
+
+def _avisar_ambiente(baseline, nova):
+    diferencas = [f"{chave} {baseline.get(chave)} -> {nova.get(chave)}" for chave in ("python", "plataforma", "cpus")
+                  if baseline.get(chave) != nova.get(chave)]
+    if diferencas:
+        print(f"Aviso: ambiente diferente do da baseline ({'; '.join(diferencas)}); os tempos podem não ser comparáveis.")
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Baselines de desempenho, detecção de regressões e gráficos.")
+    subcomandos = parser.add_subparsers(dest="modo", required=True)
+
+    salvar = subcomandos.add_parser("salvar", help="grava a próxima versão de baseline e regenera os gráficos")
+    salvar.add_argument("--descricao", default="", help="texto guardado na baseline")
+    salvar.add_argument("--sem-graficos", dest="graficos", action="store_false")
+    comparar_cli = subcomandos.add_parser("comparar", help="compara com uma baseline (código 1 se houver regressões)")
+    comparar_cli.add_argument("--baseline", default=None, help="arquivo de baseline (padrão: a mais recente)")
+    comparar_cli.add_argument("--limiar", type=float, default=LIMIAR_REGRESSAO, help="piora relativa mínima (0.10 = 10%%)")
+    comparar_cli.add_argument("--normalizar", action=argparse.BooleanOptionalAction, default=NORMALIZAR_MAQUINA,
+                              help="desconta a lentidão geral da máquina (mediana das razões nova/base)")
+    graficos = subcomandos.add_parser("graficos", help="regenera os gráficos a partir de resultados guardados")
+    graficos.add_argument("--pasta", default=PASTA_GRAFICOS, help="destino das imagens")
+
+    for sub in (salvar, comparar_cli, graficos):
+        sub.add_argument("--resultados", default=None,
+                         help="JSON já gravado (baseline ou resultados/benchmark_*.json) em vez de rodar o benchmark")
+    for sub in (salvar, comparar_cli):
+        sub.add_argument("--conjuntos", nargs="+", choices=[nome for nome, _ in CONJUNTOS_BENCHMARK],
+                         default=None, help="conjuntos medidos (padrão: todos de CONJUNTOS_BENCHMARK)")
+        sub.add_argument("--execucoes", type=int, default=EXECUCOES_REGRESSAO, help="execuções independentes juntadas")
+    args = parser.parse_args()
+
+    if args.modo == "graficos":
+        caminho = args.resultados or ultima_baseline()
+        if caminho is None:
+            parser.error(f"nenhuma baseline em {PASTA_BASELINES}; use --resultados")
+        for gerado in gerar_graficos(carregar_resultados(caminho)["resultados"], args.pasta):
+            print(f"Gerado {gerado}")
+        sys.exit(0)
+
+    caminho_baseline = None
+    if args.modo == "comparar":
+        caminho_baseline = args.baseline or ultima_baseline()
+        if caminho_baseline is None:
+            parser.error(f"nenhuma baseline em {PASTA_BASELINES}; grave uma com 'python regressao.py salvar'")
+
+    conjuntos = CONJUNTOS_BENCHMARK
+    if args.conjuntos:
+        conjuntos = tuple((nome, arquivo) for nome, arquivo in CONJUNTOS_BENCHMARK if nome in args.conjuntos)
+    inicio = time.perf_counter()
+    execucao = carregar_resultados(args.resultados) if args.resultados else executar_e_salvar(conjuntos, args.execucoes)
+
+    if args.modo == "salvar":
+        print(f"Baseline gravada em {salvar_baseline(execucao, descricao=args.descricao)}")
+        if args.graficos:
+            for gerado in gerar_graficos(execucao["resultados"]):
+                print(f"Gerado {gerado}")
+        sys.exit(0)
+
+    baseline = carregar_resultados(caminho_baseline)
+    print(f"\nComparando com {os.path.basename(caminho_baseline)} "
+          f"(commit {baseline.get('commit') or '?'}, {baseline.get('data') or 'data desconhecida'}), limiar {args.limiar:.0%}")
+    _avisar_ambiente(baseline, execucao)
+    for nome, dados in (("baseline", baseline), ("execucao nova", execucao)):
+        if any(len(_amostras(linha)) < 2 for linha in dados["resultados"]):
+            print(f"Aviso: a {nome} tem celulas de uma unica execucao; elas nunca contam como regressao.")
+    fator, comparacoes = comparar(baseline["resultados"], execucao["resultados"], args.limiar, args.normalizar)
+    if not args.normalizar:
+        fator = fator_maquina(baseline["resultados"], execucao["resultados"])
+    print(f"Fator da maquina (mediana nova/base): {fator:.3f}{' (descontado da baseline)' if args.normalizar else ''}")
+    if args.normalizar and abs(fator - 1) > args.limiar:
+        # uma piora igual em todas as células também move o fator: vale conferir com --no-normalizar
+        print(f"Aviso: a execucao inteira ficou {fator - 1:+.0%} em relacao a baseline (maquina ou mudanca geral?).")
+    imprimir_comparacao(comparacoes)
+    print(f"Tempo total: {time.perf_counter() - inicio:.1f}s")
+
+    regressoes = [c for c in comparacoes if c["estado"] == "regressao"]
+    if regressoes:
+        print(f"\n{len(regressoes)} regressão(ões) acima de {args.limiar:.0%} com 95% de confiança.")
+        sys.exit(1)
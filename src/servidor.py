@@ -0,0 +1,280 @@
+"""
+Servidor local de consultas de pertinência (asyncio) e gerador de carga.
+
+Protocolo binário (little-endian), por requisição:
+- cabeçalho "<II": id da requisição e quantidade de valores;
+- em seguida, os valores como int64.
+A resposta tem o mesmo cabeçalho seguido de 1 byte (0/1) por valor, na ordem.
+
+O cliente pode enviar várias requisições sem esperar as respostas (pipelining);
+o servidor junta as requisições pendentes de cada conexão em um único
+buscar_varios (batching) e responde na ordem em que chegaram.
+
+Uso:
+    python servidor.py servir --estrutura ListaOtimizada --arquivo conjunto_medio.txt
+    python servidor.py carga --arquivo conjunto_medio.txt --conexoes 4 --profundidade 32
+(use --unix CAMINHO nos dois lados para um socket Unix em vez de TCP)
+"""
+import argparse
+import asyncio
+import os
+import struct
+import time
+from array import array
+
+import main
+from main import CLASSES_SNAPSHOT, cache_datasets, gerar_consultas_uniformes, gerar_valores_busca, obter_estrutura
+
+HOST_PADRAO = "127.0.0.1"
+PORTA_PADRAO = 8765
+MAX_VALORES_POR_LOTE = 4096  # Limite de valores juntados em um único buscar_varios
+CABECALHO = struct.Struct("<II")
+
+# Estruturas que podem ser servidas (as de main.CLASSES_SNAPSHOT são carregadas do disco quando possível)
+ESTRUTURAS = {
+    "Arvore": main.Arvore,
+    "ArvoreAVL": main.ArvoreAVL,
+    "ArvoreCompacta": main.ArvoreCompacta,
+    "ArvoreB": main.ArvoreB,
+    "Lista": main.Lista,
+    "ListaOtimizada": main.ListaOtimizada,
+    "ConjuntoHash": main.ConjuntoHash,
+}
+
+
+def _valores_do_payload(dados):
+    valores = array('q')
+    valores.frombytes(dados)
+    return valores
+
+
+def carregar_estrutura(nome, arquivo):
+    """
+    Constrói (ou carrega do snapshot) a estrutura escolhida com o conjunto de dados.
+
+    Parâmetros:
+    - nome: nome da classe, uma das chaves de ESTRUTURAS.
+    - arquivo: nome do arquivo de dados (como em ler_arquivo).
+
+    Retorna:
+    - a estrutura pronta para buscas.
+    """
+    classe = ESTRUTURAS[nome]
+    if nome in CLASSES_SNAPSHOT:
+        estrutura, _ = obter_estrutura(classe, arquivo)
+        return estrutura
+    return main._construir_padrao(classe, cache_datasets.ler(arquivo))
+
+
+#  === SERVIDOR ===
+async def _ler_requisicoes(leitor, fila):
+    """Lê requisições da conexão e as enfileira; None sinaliza o fim da conexão."""
+    try:
+        while True:
+            cabecalho = await leitor.readexactly(CABECALHO.size)
+            id_requisicao, quantidade = CABECALHO.unpack(cabecalho)
+            dados = await leitor.readexactly(quantidade * 8)
+            await fila.put((id_requisicao, _valores_do_payload(dados)))
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        await fila.put(None)
+
+
+async def _responder(estrutura, fila, escritor):
+    """Junta as requisições já enfileiradas em um lote, busca e responde na ordem."""
+    try:
+        await _responder_lotes(estrutura, fila, escritor)
+    except ConnectionError:
+        pass # o cliente desconectou com respostas pendentes
+    finally:
+        escritor.close()
+
+
+async def _responder_lotes(estrutura, fila, escritor):
+    fim = False
+    while not fim:
+        pendentes = [await fila.get()]
+        total = 0 if pendentes[0] is None else len(pendentes[0][1])
+        while total < MAX_VALORES_POR_LOTE and not fila.empty():
+            requisicao = fila.get_nowait()
+            pendentes.append(requisicao)
+            if requisicao is None:
+                break
+            total += len(requisicao[1])
+
+        if pendentes[-1] is None:
+            fim = True
+            pendentes.pop()
+        if not pendentes:
+            break
+
+        lote = array('q')
+        for _, valores in pendentes:
+            lote.extend(valores)
+        achados = bytes(estrutura.buscar_varios(lote.tolist()))
+
+        inicio = 0
+        for id_requisicao, valores in pendentes:
+            fim_trecho = inicio + len(valores)
+            escritor.write(CABECALHO.pack(id_requisicao, len(valores)) + achados[inicio:fim_trecho])
+            inicio = fim_trecho
+        await escritor.drain()
+
+
+async def servir(estrutura, host=HOST_PADRAO, porta=PORTA_PADRAO, unix=None, pronto=None):
+    """
+    Atende consultas à estrutura até ser cancelado.
+
+    Parâmetros:
+    - estrutura: qualquer estrutura com buscar_varios.
+    - host, porta: endereço TCP local (ignorados se unix for passado).
+    - unix: caminho de um socket Unix.
+    - pronto: asyncio.Event opcional, sinalizado quando o servidor começa a aceitar conexões.
+    """
+    async def atender(leitor, escritor):
+        fila = asyncio.Queue()
+        await asyncio.gather(_ler_requisicoes(leitor, fila), _responder(estrutura, fila, escritor))
+
+    if unix:
+        if os.path.exists(unix):
+            os.unlink(unix)
+        servidor = await asyncio.start_unix_server(atender, path=unix)
+    else:
+        servidor = await asyncio.start_server(atender, host, porta)
+    async with servidor:
+        if pronto is not None:
+            pronto.set()
+        await servidor.serve_forever()
+
+
+#  === GERADOR DE CARGA ===
+async def _conexao_carga(consultas, tamanho_requisicao, profundidade, host, porta, unix, latencias):
+    """
+    Uma conexão do gerador de carga: mantém até `profundidade` requisições em voo
+    e registra a latência de cada uma (do envio até a resposta).
+    """
+    if unix:
+        leitor, escritor = await asyncio.open_unix_connection(unix)
+    else:
+        leitor, escritor = await asyncio.open_connection(host, porta)
+
+    requisicoes = [consultas[i:i + tamanho_requisicao] for i in range(0, len(consultas), tamanho_requisicao)]
+    enviadas = {}
+    vagas = asyncio.Semaphore(profundidade)
+
+    async def enviar():
+        for id_requisicao, valores in enumerate(requisicoes):
+            await vagas.acquire()
+            enviadas[id_requisicao] = time.perf_counter()
+            escritor.write(CABECALHO.pack(id_requisicao, len(valores)) + array('q', valores).tobytes())
+            await escritor.drain()
+
+    async def receber():
+        for _ in requisicoes:
+            id_requisicao, quantidade = CABECALHO.unpack(await leitor.readexactly(CABECALHO.size))
+            await leitor.readexactly(quantidade)
+            latencias.append(time.perf_counter() - enviadas.pop(id_requisicao))
+            vagas.release()
+
+    await asyncio.gather(enviar(), receber())
+    escritor.close()
+    await escritor.wait_closed()
+
+
+def percentil(amostras_ordenadas, p):
+    """Percentil p (0-100) de uma lista já ordenada, pelo método do vizinho mais próximo."""
+    if not amostras_ordenadas:
+        return 0.0
+    indice = max(0, min(len(amostras_ordenadas) - 1, round(p / 100 * len(amostras_ordenadas)) - 1))
+    return amostras_ordenadas[indice]
+
+
+async def gerar_carga(consultas, conexoes=4, profundidade=32, tamanho_requisicao=1,
+                      host=HOST_PADRAO, porta=PORTA_PADRAO, unix=None):
+    """
+    Dispara as consultas contra o servidor, divididas entre várias conexões.
+
+    Parâmetros:
+    - consultas: valores a buscar.
+    - conexoes: conexões simultâneas.
+    - profundidade: requisições em voo por conexão (pipelining).
+    - tamanho_requisicao: valores por requisição.
+
+    Retorna:
+    - dicionário com qps e latências p50/p95/p99 (em segundos) por requisição.
+    """
+    latencias = []
+    fatias = [consultas[i::conexoes] for i in range(conexoes)]
+    inicio = time.perf_counter()
+    await asyncio.gather(*(
+        _conexao_carga(fatia, tamanho_requisicao, profundidade, host, porta, unix, latencias)
+        for fatia in fatias if fatia
+    ))
+    tempo = time.perf_counter() - inicio
+
+    latencias.sort()
+    return {
+        "consultas": len(consultas),
+        "tempo": tempo,
+        "qps": len(consultas) / tempo if tempo else 0.0,
+        "p50": percentil(latencias, 50),
+        "p95": percentil(latencias, 95),
+        "p99": percentil(latencias, 99),
+    }
+
+
+def imprimir_resultado(titulo, resultado):
+    print(f"{titulo:<14} {resultado['qps']:>12,.0f} consultas/s | "
+          f"p50 {resultado['p50'] * 1e6:>9.1f} us | p95 {resultado['p95'] * 1e6:>9.1f} us | "
+          f"p99 {resultado['p99'] * 1e6:>9.1f} us")
+
+
+async def executar_carga_cli(args):
+    valores = cache_datasets.ler(args.arquivo)
+    if args.consultas > len(valores):
+        # gerar_valores_busca usaria passo len // consultas = 0 e repetiria uma única chave
+        existentes = gerar_consultas_uniformes(valores, args.consultas)
+    else:
+        existentes = gerar_valores_busca(valores, args.consultas)
+    inexistentes = gerar_valores_busca(valores, args.consultas, existente=False)
+    opcoes = dict(conexoes=args.conexoes, profundidade=args.profundidade,
+                  tamanho_requisicao=args.tamanho_requisicao, host=args.host, porta=args.porta, unix=args.unix)
+
+    print(f"{args.conexoes} conexao(oes), {args.profundidade} requisicoes em voo, "
+          f"{args.tamanho_requisicao} valor(es) por requisicao")
+    imprimir_resultado("existentes", await gerar_carga(existentes, **opcoes))
+    imprimir_resultado("inexistentes", await gerar_carga(inexistentes, **opcoes))
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Servidor de consultas e gerador de carga.")
+    subcomandos = parser.add_subparsers(dest="modo", required=True)
+
+    for nome in ("servir", "carga"):
+        sub = subcomandos.add_parser(nome)
+        sub.add_argument("--arquivo", default=main.ARQUIVO_MEDIO, help="conjunto de dados")
+        sub.add_argument("--host", default=HOST_PADRAO)
+        sub.add_argument("--porta", type=int, default=PORTA_PADRAO)
+        sub.add_argument("--unix", default=None, help="caminho de socket Unix (em vez de TCP)")
+
+    subcomandos.choices["servir"].add_argument("--estrutura", choices=sorted(ESTRUTURAS), default="ListaOtimizada")
+    carga = subcomandos.choices["carga"]
+    carga.add_argument("--consultas", type=int, default=10_000, help="consultas por tipo (existentes/inexistentes)")
+    carga.add_argument("--conexoes", type=int, default=4)
+    carga.add_argument("--profundidade", type=int, default=32, help="requisições em voo por conexão")
+    carga.add_argument("--tamanho-requisicao", type=int, default=1, help="valores por requisição")
+    args = parser.parse_args()
+
+    if args.modo == "servir":
+        inicio = time.perf_counter()
+        estrutura = carregar_estrutura(args.estrutura, args.arquivo)
+        print(f"{args.estrutura} com {args.arquivo} pronta em {time.perf_counter() - inicio:.3f}s")
+        print(f"Atendendo em {args.unix or f'{args.host}:{args.porta}'} (Ctrl+C para sair)")
+        try:
+            asyncio.run(servir(estrutura, args.host, args.porta, args.unix))
+        except KeyboardInterrupt:
+            pass
+    else:
+        asyncio.run(executar_carga_cli(args))